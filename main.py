@@ -6,10 +6,18 @@
 # ==========================================================
 import sys
 from PySide6.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QMessageBox, QFileDialog, QHBoxLayout, QFrame, QCheckBox, QGroupBox
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from src.daq_worker import DaqDataCollector
+from src.stream_hub import StreamHub
+from src.recorder import StreamRecorder
+from src.stats_worker import RecordingStatsWorker
+from src.signal_pipeline import RunningStats
+from src.processing_graph import ProcessingGraph
+from src.session_store import SessionStore
+from src.ui_refresh import UiRefreshCoalescer
 from src.plot_widget import RealtimePlotWidget
-from src.data_io import save_data, load_data
+from src.data_io import save_data, save_data_blocks, open_recording
+from src.recording import as_array
 from src.offline_player import OfflinePlayer
 from src.dashboard import DashboardWidget
 from src.settings_widget import SettingsWidget
@@ -18,10 +26,15 @@ from src.update_checker import check_update_async
 from src.admin_utils import is_user_admin, run_as_admin
 from src import __version__
 
+# 세션 데이터 저장소 RAM 예산 (바이트, 넘으면 오래된 블록을 임시 파일로 옮김)
+SESSION_RAM_BUDGET = 512 * 1024 * 1024
+
 # 메인 윈도우 클래스 정의
 class MainWindow(QMainWindow):
   def __init__(self):
     super().__init__()
+    # 라벨/로그/신호 목록은 수집 주기가 아닌 고정 저주기(10 Hz)로 갱신
+    self.ui_refresh = UiRefreshCoalescer(interval_ms=100, parent=self)
     self.setWindowTitle("PyDAQ Dashboard 예제")
     self.resize(1200, 900)
 
@@ -127,9 +140,31 @@ class MainWindow(QMainWindow):
     self.setCentralWidget(central_widget)
 
     # DAQ 스레드 객체 초기화 (예시: Dev1/ai0, 실제 환경에 맞게 수정 필요)
-    self.daq_thread = DaqDataCollector(device_name="Dev1", channel="ai0", sample_rate=10000, samples_per_read=1000)
-    self.daq_thread.data_collected.connect(self.on_data_collected)
+    # 적응형 모드: 장치 백로그 기반으로 읽고, 스트림 허브 기록을 샘플링 속도와 무관하게 초당 최대 30회로 병합
+    # (화면은 허브 커서로 읽으므로 수집 스레드의 표시용 저하 정책은 쓰지 않음)
+    self.daq_thread = DaqDataCollector(device_name="Dev1", channel="ai0", sample_rate=10000, samples_per_read=1000,
+                                       adaptive=True, max_emit_rate=30)
     self.daq_thread.error_occurred.connect(self.on_error_occurred)
+    self.daq_thread.telemetry_updated.connect(self.on_telemetry_updated)
+    self.daq_thread.health_updated.connect(self.on_health_updated)
+    self.daq_thread.finished.connect(self.on_daq_finished)
+    self._last_health = {}
+    # 스트림 허브: 수집 스레드가 싱크로 전체 샘플을 기록하고, 화면/세션 버퍼는 각자 커서로 읽음
+    # (청크마다 GUI로 시그널을 보내지 않고 타이머 주기로 밀린 구간을 한 번에 처리)
+    self.stream_hub = StreamHub(channel_count=self.daq_thread.channel_count, capacity=self.daq_thread.sample_rate * 10,
+                                dtype=self.daq_thread.dtype)
+    self.stream_hub.fell_behind.connect(self.on_stream_fell_behind)
+    self.daq_thread.add_sink(self.stream_hub.write)
+    self.plot_cursor = self.stream_hub.subscribe("plot")
+    self.hub_timer = QTimer(self)
+    self.hub_timer.timeout.connect(self.on_hub_tick)
+    # 스트리밍 녹화기 (● 버튼으로 시작/종료)
+    self.recorder = None
+    # 처리 그래프 (대시보드 "파이프라인" 버튼으로 설정, 레이아웃 JSON에 함께 저장, 기본은 단계 없음)
+    # target이 "plot"인 sink 단계가 있으면 플롯에는 원시 데이터 대신 그래프 출력을 표시
+    self.pipeline = ProcessingGraph(sample_rate=self.daq_thread.sample_rate)
+    self.pipeline.bind_sink("plot", lambda data, timebase: self.plot_widget.append_data(data, timebase))
+    self.dashboard.set_pipeline(self.pipeline)
 
     # 버튼 이벤트 연결 (함수 분리)
     self.btn_play.clicked.connect(self.start_daq)
@@ -137,8 +172,16 @@ class MainWindow(QMainWindow):
     self.btn_rec.clicked.connect(self.on_record_clicked)
     self.btn_mark.clicked.connect(self.on_mark_clicked)
 
-    # 데이터 버퍼 (그래프와 동기화)
-    self.collected_data = np.empty((0,))
+    # 세션 전체 데이터 저장소 (청크 단위 블록 추가, RAM 예산을 넘으면 오래된 블록은 임시 파일로 이동)
+    self.session_store = SessionStore(self.daq_thread.channel_count, ram_budget=SESSION_RAM_BUDGET)
+    # 세션 전체 통계 (청크마다 누적, 통계 표시/마커/정지 요약은 누적값만 조회)
+    self.session_stats = RunningStats(self.daq_thread.channel_count)
+    # 수집 데이터 첫 샘플의 타임베이스 (저장 시 t0/dt 기록)
+    self.session_timebase = None
+    # 불러온 기록 파일의 지연 로딩 핸들 (오프라인 재생/분석은 필요한 구간만 읽음)
+    self.recording = None
+    # 불러온 기록 전체 통계를 백그라운드에서 계산하는 스레드 (열기 시 파일 전체를 훑지 않음)
+    self.recording_stats_worker = None
 
   def apply_theme(self, theme="dark"):
     """다크/라이트 테마 및 위젯 스타일 적용 (SettingsWidget 시그널 연동)"""
@@ -283,6 +326,7 @@ class MainWindow(QMainWindow):
       set_groupbox_title("log", "로그")
       set_groupbox_title("signal_list", "신호 목록")
       # 신호 목록 항목 한글화 예시
+      self.ui_refresh.invalidate(self.signal_list_widget)
       self.signal_list_widget.clear()
       self.signal_list_widget.addItems(["채널 1"])
     else:
@@ -294,14 +338,14 @@ class MainWindow(QMainWindow):
       set_groupbox_title("log", "Log")
       set_groupbox_title("signal_list", "Signal List")
       # 신호 목록 항목 영어화 예시
+      self.ui_refresh.invalidate(self.signal_list_widget)
       self.signal_list_widget.clear()
       self.signal_list_widget.addItems(["Channel 1"])
 
   def log_event(self, message):
-    """로그 위젯에 메시지 추가 (스크롤 자동 하단)"""
+    """로그 위젯에 메시지 추가 ("[WARN] ..." 접두어는 레벨/출처로 변환, 스크롤 자동 하단)"""
     try:
       self.log_widget.append(message)
-      self.log_widget.moveCursor(self.log_widget.textCursor().End)
     except Exception:
       pass
 
@@ -313,10 +357,17 @@ class MainWindow(QMainWindow):
     self.btn_play.setEnabled(False)
     self.btn_stop.setEnabled(True)
     self.plot_widget.clear()  # 그래프 초기화
-    self.collected_data = np.empty((0,))  # 데이터 버퍼 초기화
+    self.session_store.close()  # 데이터 버퍼 초기화 (이전 spill 파일 삭제)
+    self.session_store = SessionStore(self.daq_thread.channel_count, ram_budget=SESSION_RAM_BUDGET)
+    self.session_stats = RunningStats(self.daq_thread.channel_count)
+    self.session_timebase = None
     self.offline_player.hide()  # 오프라인 컨트롤러 숨김
+    self.close_recording()
+    self.stream_hub.reset()
+    self.pipeline.reset()
     try:
       self.daq_thread.start()
+      self.hub_timer.start(int(1000 / 30))
       self.log_event("[INFO] 데이터 수집 시작")
     except Exception as e:
       self.show_error_message(f"DAQ 스레드 시작 오류: {e}")
@@ -329,65 +380,128 @@ class MainWindow(QMainWindow):
     self.status_label.setText("DAQ 상태: 정지됨")
     self.btn_play.setEnabled(True)
     self.btn_stop.setEnabled(False)
+    # 녹화는 수집 스레드가 마지막 배치까지 싱크에 넘기고 끝난 뒤 종료 (on_daq_finished)
     self.daq_thread.stop()
     self.log_event("[INFO] 데이터 수집 정지")
     # 전체 통계 기록
     try:
-      if self.collected_data.size > 0:
-        avg = np.mean(self.collected_data)
-        mx = np.max(self.collected_data)
-        mn = np.min(self.collected_data)
-        self.log_event(f"[STATS] 전체 평균: {avg:.3f}, 최대: {mx:.3f}, 최소: {mn:.3f}")
+      if self.session_stats.count > 0:
+        stats = self.session_stats.merged_channels()
+        self.log_event(f"[STATS] 전체 평균: {stats.mean[0]:.3f}, 최대: {stats.max[0]:.3f}, 최소: {stats.min[0]:.3f}, "
+                       f"RMS: {stats.rms[0]:.3f}")
     except Exception:
       pass
 
-  def on_data_collected(self, data: np.ndarray, timestamp: float):
+  def on_daq_finished(self):
+    """
+    수집 스레드 종료 후 처리 (정지 시 남은 배치까지 싱크로 전달된 뒤이므로 여기서 녹화를 닫음)
+    """
+    self.stop_recording()
+
+  def on_data_collected(self, data: np.ndarray, timebase):
     """
-    데이터 수집 신호 처리 (UI 및 그래프에 표시, 통계/로그/신호 목록 연동)
+    수집 데이터 처리 (스트림 허브에서 읽은 구간을 UI 및 그래프에 표시, 통계/로그/신호 목록 연동)
+    data: 허브 커서가 읽은 (채널 수, 샘플 수) 배열 (단일 채널도 2차원)
+    timebase: 청크의 ChunkTimebase (샘플 인덱스 기반 시각)
     """
-    self.data_label.setText(f"수집 데이터: {data[:5]} ...")
-    self.plot_widget.append_data(data)
-    # 통계 위젯 업데이트
+    if self.session_timebase is None:
+      self.session_timebase = timebase
+    if len(self.pipeline):
+      try:
+        self.pipeline.process(data, timebase)
+      except Exception as e:
+        self.log_widget.log("ERROR", f"처리 그래프 오류: {e}", source="pipeline")
+    if not self.pipeline.has_sink("plot"):
+      self.plot_widget.append_data(data, timebase)
+    # 라벨/통계/신호 목록은 갱신 예약만 하고 문자열은 반영 시점에 생성 (UiRefreshCoalescer)
+    self.ui_refresh.set_text(self.data_label, lambda: f"수집 데이터: {data[0, :5]} ...")
     try:
-      if data.size > 0:
-        avg = np.mean(data)
-        mx = np.max(data)
-        mn = np.min(data)
-        stats = f"평균: {avg:.3f}\n최대: {mx:.3f}\n최소: {mn:.3f}"
-        self.stats_label.setText(stats)
-      else:
-        self.stats_label.setText("통계 정보 없음")
+      self.session_stats.update(data)
+      self.ui_refresh.set_text(self.stats_label, self.format_session_stats)
     except Exception as e:
-      self.stats_label.setText(f"통계 계산 오류: {e}")
-    # 로그 위젯에 데이터 수집 로그 추가
-    try:
-      self.log_widget.append(f"[{timestamp:.2f}] 데이터 수집: {data[:5]} ...")
-    except Exception:
-      pass
-    # 신호 목록 위젯(예시: 1채널, 실제 신호명/상태 연동)
-    try:
-      self.signal_list_widget.clear()
-      # 예시: 1채널, 활성화 상태 표시
-      self.signal_list_widget.addItem("채널 1 (활성)")
-    except Exception:
-      pass
-    # 데이터 버퍼에 누적 (1차원/2차원 모두 지원)
-    if self.collected_data.size == 0:
-      self.collected_data = data.flatten()
-    else:
-      self.collected_data = np.concatenate([self.collected_data, data.flatten()])
+      self.ui_refresh.set_text(self.stats_label, f"통계 계산 오류: {e}")
+    # 수집 로그는 직전 레코드에 반복 횟수로 접힘 (세부 정보는 마지막 청크만 보관)
+    start_sample = timebase.start_sample if timebase is not None else 0
+    self.log_widget.log("DEBUG", "데이터 수집", source="daq", detail=f"시작 샘플 {start_sample}, {data.shape[1]} 샘플")
+    # 신호 목록은 채널 상태가 바뀐 경우에만 다시 채워짐
+    self.ui_refresh.set_items(self.signal_list_widget, [f"채널 {i + 1} (활성)" for i in range(data.shape[0])])
+    # 세션 저장소에 누적 (블록 단위 추가, 기존 데이터 재복사 없음)
+    self.session_store.append(data)
+
+  def format_session_stats(self):
+    """통계 위젯 텍스트 (세션 누적 통계)"""
+    if self.session_stats.count == 0:
+      return "통계 정보 없음"
+    stats = self.session_stats.merged_channels()
+    return f"평균: {stats.mean[0]:.3f}\n최대: {stats.max[0]:.3f}\n최소: {stats.min[0]:.3f}\nRMS: {stats.rms[0]:.3f}"
+
+  def on_hub_tick(self):
+    """
+    스트림 허브에서 마지막 읽기 이후의 데이터를 한 번에 가져와 화면/버퍼 갱신
+    """
+    # 원시(int16) 모드는 화면에 그릴 구간만 전압으로 변환
+    data, timebase = self.plot_cursor.read(scaling=self.daq_thread.scaling)
+    if data.shape[1] > 0:
+      self.on_data_collected(data, timebase)
+    elif not self.daq_thread.isRunning():
+      # 수집 스레드가 끝나고 허브의 마지막 청크까지 처리한 뒤에 처리 그래프 종료
+      self.hub_timer.stop()
+      self.finish_pipeline()
+
+  def finish_pipeline(self):
+    """
+    처리 그래프 파일 출력 닫기 및 단계별 처리 시간 기록 (수집 종료 후 허브를 모두 읽은 뒤 호출)
+    """
+    self.pipeline.close()
+    if len(self.pipeline) and self.pipeline.format_timing():
+      self.log_event(f"[STATS] 처리 그래프: {self.pipeline.format_timing()}")
+
+  def on_stream_fell_behind(self, name, n_samples):
+    """
+    스트림 허브 소비자가 링 버퍼 용량보다 밀려 데이터를 건너뛴 경우 경고
+    """
+    self.log_event(f"[WARN] '{name}' 소비자가 {n_samples} 샘플 밀려 건너뜀")
+
+  def on_telemetry_updated(self, telemetry: dict):
+    """
+    수집 텔레메트리(배치 크기/지연) 상태 표시
+    """
+    if not self.daq_thread.isRunning():
+      return
+    self.status_label.setText(
+      f"DAQ 상태: 수집 중... (배치 {telemetry.get('batch_samples', 0)} 샘플, 지연 {telemetry.get('latency', 0.0) * 1000:.1f} ms)"
+    )
+
+  def on_health_updated(self, health: dict):
+    """
+    수집 헬스 신호 처리: 유실/오버플로가 새로 발생하면 경고 로그 기록
+    """
+    last = self._last_health
+    if health.get("gaps", 0) > last.get("gaps", 0):
+      self.log_event(f"[WARN] 샘플 유실: 누적 {health['lost_samples']} 샘플 ({health['gaps']}회), 백로그 {health['backlog']}")
+    if health.get("overflows", 0) > last.get("overflows", 0):
+      self.log_event(f"[WARN] 장치 버퍼 오버플로: {health['overflows']}회")
+    self._last_health = health
 
   def save_data_to_file(self):
     """
     파일 다이얼로그로 데이터 저장
     """
-    if self.collected_data.size == 0:
+    if len(self.session_store) == 0 and self.recording is None:
       self.show_error_message("저장할 데이터가 없습니다.")
       return
-    file_path, _ = QFileDialog.getSaveFileName(self, "데이터 저장", "", "CSV 파일 (*.csv);;HDF5 파일 (*.h5 *.hdf5)")
+    file_path, _ = QFileDialog.getSaveFileName(self, "데이터 저장", "", "CSV 파일 (*.csv);;HDF5 파일 (*.h5 *.hdf5);;원시 바이너리 (*.bin)")
     if file_path:
       try:
-        save_data(file_path, self.collected_data)
+        # 단일 채널은 기존 파일 형식과 같은 1차원으로 저장
+        if len(self.session_store) > 0:
+          # 세션 블록(spill된 memmap 포함)을 이어붙이지 않고 한 블록씩 기록
+          store = self.session_store
+          shape = (len(store),) if store.channel_count == 1 else store.shape
+          save_data_blocks(file_path, store.iter_blocks, shape, store.dtype, self.session_timebase)
+        else:
+          data = np.atleast_2d(as_array(self.recording))
+          save_data(file_path, data[0] if data.shape[0] == 1 else data, self.session_timebase)
         QMessageBox.information(self, "저장 완료", f"데이터가 저장되었습니다:\n{file_path}")
       except Exception as e:
         self.show_error_message(str(e))
@@ -396,27 +510,67 @@ class MainWindow(QMainWindow):
     """
     파일 다이얼로그로 데이터 불러오기 및 그래프/버퍼/오프라인 컨트롤러 반영
     """
-    file_path, _ = QFileDialog.getOpenFileName(self, "데이터 불러오기", "", "CSV 파일 (*.csv);;HDF5 파일 (*.h5 *.hdf5)")
+    file_path, _ = QFileDialog.getOpenFileName(self, "데이터 불러오기", "", "CSV 파일 (*.csv);;HDF5 파일 (*.h5 *.hdf5);;원시 바이너리 (*.bin)")
     if file_path:
       try:
-        data = load_data(file_path)
-        self.collected_data = data
+        # 파일 전체를 읽지 않고 핸들만 열어 두고, 플롯/통계/재생은 필요한 구간만 읽음
+        recording = open_recording(file_path)
+        self.close_recording()
+        self.recording = recording
+        timebase = recording.timebase
+        self.session_store.close()
+        self.session_store = SessionStore(recording.channel_count, ram_budget=SESSION_RAM_BUDGET)
+        # 전체 통계는 백그라운드에서 블록 단위로 계산 (끝나면 on_recording_stats_ready)
+        self.session_stats = RunningStats(recording.channel_count)
+        self.stats_label.setText("통계 계산 중...")
+        self.recording_stats_worker = RecordingStatsWorker(recording, parent=self)
+        self.recording_stats_worker.stats_ready.connect(self.on_recording_stats_ready)
+        self.recording_stats_worker.error_occurred.connect(self.on_error_occurred)
+        self.recording_stats_worker.start()
+        self.session_timebase = timebase
         self.plot_widget.clear()
-        self.plot_widget.append_data(data)
-        self.offline_player.set_data(data)
+        self.plot_widget.append_data(recording, timebase)
+        self.offline_player.set_data(recording, timebase)
         self.offline_player.show()
         QMessageBox.information(self, "불러오기 완료", f"데이터를 불러왔습니다:\n{file_path}")
       except Exception as e:
         self.show_error_message(str(e))
 
+  def close_recording(self):
+    """
+    불러온 기록 파일 핸들 닫기 (오프라인 재생 중이면 정지)
+    """
+    if self.recording is None:
+      return
+    if self.recording_stats_worker is not None:
+      # 통계 스레드가 핸들을 읽는 중이면 중단시킨 뒤 닫음 (최대 한 블록 읽기만큼 대기)
+      self.recording_stats_worker.cancel()
+      self.recording_stats_worker.wait()
+      self.recording_stats_worker.deleteLater()
+      self.recording_stats_worker = None
+    self.offline_player.pause()
+    if self.offline_player.data is self.recording:
+      self.offline_player.data = None
+    self.recording.close()
+    self.recording = None
+
+  def on_recording_stats_ready(self, stats):
+    """불러온 기록 전체 통계 계산 완료 (그사이 다른 파일/수집으로 바뀌었으면 무시)"""
+    if self.sender() is not self.recording_stats_worker:
+      return
+    self.session_stats = stats
+    self.recording_stats_worker.deleteLater()
+    self.recording_stats_worker = None
+    self.stats_label.setText(self.format_session_stats())
+
   def on_offline_frame_changed(self, frame_idx, frame_data):
     """
     오프라인 재생 시 프레임 변경 신호 처리 (그래프에 해당 프레임만 표시)
     """
     # frame_data shape: (채널,) 또는 (채널, 1)
     # 그래프에 해당 프레임만 표시
-    if frame_data.ndim == 1:
-      frame_data = frame_data.reshape(-1, 1)
+    if frame_data.ndim < 2:
+      frame_data = np.asarray(frame_data).reshape(-1, 1)
     self.plot_widget.clear()
     self.plot_widget.append_data(frame_data)
     self.data_label.setText(f"오프라인 재생 프레임: {frame_idx+1}")
@@ -432,23 +586,67 @@ class MainWindow(QMainWindow):
   # 툴바/하단바 기능 함수
   # ----------------------
   def on_record_clicked(self):
-    """녹화 버튼 클릭 시 동작 (예외처리 포함)"""
+    """녹화 버튼 클릭 시 동작: 녹화 중이 아니면 HDF5 스트리밍 녹화 시작, 녹화 중이면 종료"""
     try:
-      # TODO: 실제 녹화 기능 구현 필요
-      QMessageBox.information(self, "녹화", "녹화 기능은 추후 지원 예정입니다.")
+      if self.recorder is not None:
+        self.stop_recording()
+        return
+      if not self.daq_thread.isRunning():
+        QMessageBox.information(self, "녹화", "데이터 수집 중에만 녹화할 수 있습니다.")
+        return
+      file_path, _ = QFileDialog.getSaveFileName(self, "녹화 파일", "", "HDF5 파일 (*.h5 *.hdf5)")
+      if not file_path:
+        return
+      self.start_recording(file_path)
     except Exception as e:
       QMessageBox.critical(self, "에러", f"녹화 중 오류 발생: {e}")
 
+  def start_recording(self, file_path):
+    """
+    수집 스레드 싱크로 연결된 녹화기 시작 (별도 쓰기 스레드에서 HDF5에 이어 쓰기)
+    """
+    channels = self.daq_thread.physical_channels().split(",")
+    self.recorder = StreamRecorder(file_path, self.daq_thread.channel_count, self.daq_thread.sample_rate,
+                                   channel_names=channels, dtype=self.daq_thread.dtype,
+                                   scaling=self.daq_thread.scaling, parent=self)
+    self.recorder.error_occurred.connect(self.on_recording_failed)
+    self.recorder.recording_stopped.connect(self.on_recording_stopped)
+    self.recorder.start()
+    self.daq_thread.add_sink(self.recorder.write)
+    self.btn_rec.setText("■")
+    self.log_event(f"[INFO] 녹화 시작: {file_path}")
+
+  def stop_recording(self):
+    """
+    녹화 종료 (남은 청크 기록 후 파일 닫기는 녹화 스레드에서 처리)
+    """
+    if self.recorder is None:
+      return
+    self.daq_thread.remove_sink(self.recorder.write)
+    self.recorder.stop()
+    self.recorder = None
+    self.btn_rec.setText("●")
+
+  def on_recording_failed(self, message):
+    """
+    녹화 쓰기 스레드 실패: 싱크를 떼어 수집 스레드가 더 이상 청크를 넘기지 않도록 한 뒤 오류 표시
+    """
+    self.stop_recording()
+    self.on_error_occurred(message)
+
+  def on_recording_stopped(self, file_path, n_samples):
+    self.log_event(f"[INFO] 녹화 종료: {file_path} ({n_samples} 샘플)")
+
   def on_mark_clicked(self):
     """북마크(마커) 버튼 클릭 시 플롯에 주석 추가 및 해당 시점 통계 로그 기록"""
     try:
-      self.plot_widget.add_annotation(self.plot_widget.ptr, 0, "★ Marker", color="#f1c40f")
+      self.plot_widget.add_annotation(self.plot_widget.x_at(self.plot_widget.ptr), 0, "★ Marker", color="#f1c40f")
+      if self.recorder is not None:
+        self.recorder.add_marker(self.plot_widget.end_sample, "★ Marker")
       # 북마크 시점 통계 기록
-      if self.collected_data.size > 0:
-        avg = np.mean(self.collected_data)
-        mx = np.max(self.collected_data)
-        mn = np.min(self.collected_data)
-        self.log_event(f"[MARK] 북마크 시점 통계: 평균={avg:.3f}, 최대={mx:.3f}, 최소={mn:.3f}")
+      if self.session_stats.count > 0:
+        stats = self.session_stats.merged_channels()
+        self.log_event(f"[MARK] 북마크 시점(세션 샘플 {len(self.session_store)}) 통계: 평균={stats.mean[0]:.3f}, 최대={stats.max[0]:.3f}, 최소={stats.min[0]:.3f}")
     except Exception as e:
       QMessageBox.critical(self, "에러", f"마커 추가 중 오류 발생: {e}")
       self.log_event(f"[ERROR] 마커 추가 오류: {e}")
@@ -0,0 +1,249 @@
+import nidaqmx
+from nidaqmx import stream_readers
+from src.scaling import ChannelScaling
+import numpy as np
+import time
+
+# 버퍼 오버플로(소비자가 따라가지 못함)를 뜻하는 DAQmx 오류 코드
+OVERFLOW_ERROR_CODES = {
+  nidaqmx.error_codes.DAQmxErrors.SAMPLES_NO_LONGER_AVAILABLE,
+  nidaqmx.error_codes.DAQmxErrors.INPUT_FIFO_OVERFLOW,
+  nidaqmx.error_codes.DAQmxErrors.INPUT_FIFO_OVERFLOW_2,
+  nidaqmx.error_codes.DAQmxErrors.ACQ_STOPPED_TO_PREVENT_INTERMEDIATE_BUFFER_OVERFLOW,
+}
+
+class AcquisitionBackend:
+  """
+  수집 백엔드 공통 인터페이스 (DaqDataCollector가 사용)
+  - start(): 장치/태스크 준비 및 수집 시작
+  - read_into(buf): (채널 수, 샘플 수) 버퍼를 직접 채우고 채널당 읽은 샘플 수 반환
+  - read(n, dtype): 새 (채널 수, 읽은 샘플 수) 배열로 n 샘플 읽기 (채널 수와 백엔드에 관계없이 같은 shape)
+  - available(): 장치에 쌓여 있는(아직 읽지 않은) 채널당 샘플 수
+  - stop(): 수집 종료 및 자원 해제
+  - lost_samples: 장치 버퍼 덮어쓰기 등으로 읽지 못하고 유실된 채널당 샘플 누적 수
+  - is_overflow(e): 읽기 예외가 버퍼 오버플로인지 여부
+  - int16 버퍼를 넘기면 원시 코드로 읽음 (지원하는 백엔드만, scaling()으로 전압 변환 계수 제공)
+  """
+  def __init__(self, channel_count=1, sample_rate=10000):
+    self.channel_count = channel_count
+    self.sample_rate = sample_rate
+    self.lost_samples = 0
+
+  def start(self):
+    pass
+
+  def read_into(self, buf: np.ndarray) -> int:
+    raise NotImplementedError
+
+  def read(self, n_samples, dtype=np.float64) -> np.ndarray:
+    buf = np.empty((self.channel_count, n_samples), dtype=dtype)
+    n_read = self.read_into(buf)
+    return buf[:, :n_read]
+
+  def available(self) -> int:
+    return 0
+
+  def is_overflow(self, error) -> bool:
+    return False
+
+  def scaling(self):
+    """원시 코드 → 전압 변환 계수 (ChannelScaling), 원시 읽기를 지원하지 않으면 None"""
+    return None
+
+  def stop(self):
+    pass
+
+  def __enter__(self):
+    self.start()
+    return self
+
+  def __exit__(self, exc_type, exc, tb):
+    self.stop()
+    return False
+
+class NiDaqBackend(AcquisitionBackend):
+  """
+  NI-DAQmx 하드웨어 백엔드
+  - 다채널(multi_channel=True)은 AnalogMultiChannelReader로 버퍼에 직접 읽음
+  - 단일 채널 read()는 기존과 동일하게 task.read 사용하되 다른 백엔드와 같은 (채널 수, 샘플 수)로 반환
+    (read_into는 채널 수와 무관하게 스트림 리더 사용)
+  - int16 버퍼는 AnalogUnscaledReader로 원시 코드를 읽음 (변환 계수는 태스크의 ai_dev_scaling_coeff)
+  """
+  def __init__(self, physical_channels, channel_count=1, sample_rate=10000, multi_channel=False):
+    super().__init__(channel_count, sample_rate)
+    self.physical_channels = physical_channels  # 예: 'Dev1/ai0,Dev1/ai1'
+    self.multi_channel = multi_channel
+    self.task = None
+    self._task_ctx = None
+    self._reader = None
+    self._raw_reader = None
+
+  def start(self):
+    # DAQmx Task 생성
+    self._task_ctx = nidaqmx.Task()
+    try:
+      self.task = self._task_ctx.__enter__()
+      # 아날로그 입력 채널 추가
+      self.task.ai_channels.add_ai_voltage_chan(self.physical_channels)
+      # 샘플 클럭 설정
+      self.task.timing.cfg_samp_clk_timing(self.sample_rate, sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS)
+      if self.multi_channel:
+        self._reader = stream_readers.AnalogMultiChannelReader(self.task.in_stream)
+    except Exception:
+      # 설정 중 실패해도 이미 만든 Task는 닫음
+      self.stop()
+      raise
+
+  def read_into(self, buf: np.ndarray) -> int:
+    if buf.dtype == np.int16:
+      if self._raw_reader is None:
+        self._raw_reader = stream_readers.AnalogUnscaledReader(self.task.in_stream)
+      return self._raw_reader.read_int16(buf, number_of_samples_per_channel=buf.shape[1])
+    if self._reader is None:
+      self._reader = stream_readers.AnalogMultiChannelReader(self.task.in_stream)
+    return self._reader.read_many_sample(buf, number_of_samples_per_channel=buf.shape[1])
+
+  def read(self, n_samples, dtype=np.float64) -> np.ndarray:
+    if self.multi_channel or np.dtype(dtype) == np.int16:
+      return super().read(n_samples, dtype)
+    data = np.asarray(self.task.read(number_of_samples_per_channel=n_samples), dtype=dtype)
+    return data.reshape(self.channel_count, -1)
+
+  def available(self) -> int:
+    return int(self.task.in_stream.avail_samp_per_chan)
+
+  def is_overflow(self, error) -> bool:
+    return getattr(error, "error_code", None) in OVERFLOW_ERROR_CODES
+
+  def scaling(self):
+    return ChannelScaling([list(channel.ai_dev_scaling_coeff) for channel in self.task.ai_channels])
+
+  def stop(self):
+    if self._task_ctx is not None:
+      self._task_ctx.__exit__(None, None, None)
+    self._task_ctx = None
+    self.task = None
+    self._reader = None
+    self._raw_reader = None
+
+class SyntheticBackend(AcquisitionBackend):
+  """
+  하드웨어 없이 사용하는 가상 신호 백엔드 (부하 테스트/벤치마크용)
+  - 파형: sine, chirp, noise, step, pulse (채널별 지정, 채널 수만큼 순환 적용)
+  - 블록 단위 벡터화 생성 (채널 × 샘플 브로드캐스트)
+  - realtime=True: 샘플링 속도에 맞춰 실제 시간으로 페이싱
+  - realtime=False: 최대 속도 free-run (파이프라인 처리량 측정 기준 소스)
+  - buffer_size: 장치 버퍼 크기(채널당 샘플) 시뮬레이션, 백로그가 넘치면 오래된 샘플을 버리고 lost_samples에 누적
+  - int16 버퍼: ±voltage_range를 16비트로 양자화한 원시 코드 (선형 스케일링)
+  """
+  WAVEFORMS = ("sine", "chirp", "noise", "step", "pulse")
+
+  def __init__(self, channel_count=1, sample_rate=10000, waveforms="sine", frequency=10.0,
+               amplitude=1.0, noise_level=0.0, chirp_end=None, chirp_period=1.0, duty=0.1,
+               realtime=True, seed=None, buffer_size=None, voltage_range=10.0):
+    super().__init__(channel_count, sample_rate)
+    if isinstance(waveforms, str):
+      waveforms = [waveforms]
+    for w in waveforms:
+      if w not in self.WAVEFORMS:
+        raise ValueError(f"지원하지 않는 파형입니다: {w} (지원: {', '.join(self.WAVEFORMS)})")
+    self.waveforms = [waveforms[i % len(waveforms)] for i in range(channel_count)]
+    # 채널별 주파수/진폭 (스칼라 지정 시 모든 채널 동일)
+    self.frequency = np.asarray(frequency, dtype=np.float64) * np.ones(channel_count)
+    self.amplitude = np.asarray(amplitude, dtype=np.float64) * np.ones(channel_count)
+    self.noise_level = noise_level
+    self.chirp_end = chirp_end if chirp_end is not None else sample_rate / 4
+    self.chirp_period = chirp_period
+    self.duty = duty
+    self.realtime = realtime
+    self.seed = seed
+    self.buffer_size = buffer_size
+    self.voltage_range = voltage_range
+    self._scratch = None  # 원시 코드 생성용 float 작업 버퍼
+    self.sample_index = 0  # 지금까지 생성한 채널당 샘플 수
+    self._rng = np.random.default_rng(seed)
+    self._start_time = None
+    # 파형 종류별 채널 인덱스 (종류별로 한 번에 벡터 연산)
+    self._groups = {}
+    for i, w in enumerate(self.waveforms):
+      self._groups.setdefault(w, []).append(i)
+    self._groups = {w: np.array(idx) for w, idx in self._groups.items()}
+
+  def start(self):
+    self.sample_index = 0
+    self.lost_samples = 0
+    self._rng = np.random.default_rng(self.seed)
+    self._start_time = time.monotonic()
+
+  def available(self) -> int:
+    if self._start_time is None:
+      return 0
+    if not self.realtime:
+      return 0
+    produced = int((time.monotonic() - self._start_time) * self.sample_rate)
+    return max(produced - self.sample_index, 0)
+
+  def read_into(self, buf: np.ndarray) -> int:
+    if self._start_time is None:
+      self.start()
+    n = buf.shape[1]
+    if self.realtime and self.buffer_size is not None:
+      # 장치 버퍼 덮어쓰기 모드: 버퍼를 넘친 가장 오래된 샘플은 유실
+      overflow = self.available() - self.buffer_size
+      if overflow > 0:
+        self.sample_index += overflow
+        self.lost_samples += overflow
+    if self.realtime:
+      # 요청한 블록의 마지막 샘플 시각까지 대기 (실제 장치의 블로킹 읽기와 동일한 동작)
+      due = self._start_time + (self.sample_index + n) / self.sample_rate
+      wait = due - time.monotonic()
+      if wait > 0:
+        time.sleep(wait)
+    if buf.dtype == np.int16:
+      self._generate_raw(self.sample_index, buf)
+    else:
+      self.generate(self.sample_index, buf)
+    self.sample_index += n
+    return n
+
+  def generate(self, start_sample, out: np.ndarray):
+    """
+    start_sample부터 out.shape[1]개 샘플을 out에 벡터화 생성
+    """
+    n = out.shape[1]
+    t = (start_sample + np.arange(n)) / self.sample_rate
+    for kind, idx in self._groups.items():
+      amp = self.amplitude[idx, None]
+      freq = self.frequency[idx, None]
+      if kind == "sine":
+        out[idx] = amp * np.sin(2 * np.pi * freq * t)
+      elif kind == "chirp":
+        # chirp_period 주기로 frequency → chirp_end 선형 스윕 반복
+        tc = np.mod(t, self.chirp_period)
+        k = (self.chirp_end - freq) / self.chirp_period
+        out[idx] = amp * np.sin(2 * np.pi * (freq * tc + 0.5 * k * tc * tc))
+      elif kind == "noise":
+        out[idx] = amp * self._rng.standard_normal((len(idx), n))
+      elif kind == "step":
+        out[idx] = np.where(np.mod(t * freq, 1.0) < 0.5, -amp, amp)
+      elif kind == "pulse":
+        out[idx] = np.where(np.mod(t * freq, 1.0) < self.duty, amp, 0.0)
+    if self.noise_level:
+      out += self.noise_level * self._rng.standard_normal(out.shape)
+    return out
+
+  def scaling(self):
+    return ChannelScaling.linear(self.channel_count, self.voltage_range / 32768)
+
+  def _generate_raw(self, start_sample, out: np.ndarray):
+    if self._scratch is None or self._scratch.shape[1] < out.shape[1]:
+      self._scratch = np.empty((self.channel_count, out.shape[1]))
+    volts = self.generate(start_sample, self._scratch[:, :out.shape[1]])
+    volts *= 32768 / self.voltage_range
+    np.rint(volts, out=volts)
+    np.clip(volts, -32768, 32767, out=volts)
+    out[:] = volts
+    return out
+
+  def stop(self):
+    self._start_time = None
@@ -0,0 +1,161 @@
+from multiprocessing import shared_memory
+import numpy as np
+import queue
+import sys
+import time
+
+class SharedSlotRing:
+  """
+  multiprocessing.shared_memory 기반 슬롯 링 버퍼 (단일 생산자 / 단일 소비자)
+  - 메모리 배치: [헤더 int64 x2][슬롯 메타 int64 (슬롯 수, 4)][데이터 float64 (슬롯 수, 채널 수, 블록 크기)]
+  - 각 슬롯은 C-연속 (채널 수, 블록 크기) 배열이라 자식 프로세스가 백엔드로 직접 읽고,
+    GUI 프로세스는 같은 메모리를 복사 없이 뷰로 사용
+  - 슬롯 메타: [시작 샘플 인덱스, 샘플 수, 읽기 시간(ns), 장치 백로그]
+  - dtype: 데이터 자료형 (원시 모드는 np.int16)
+  - 헤더[0]: 지금까지 기록(commit)된 슬롯 수 (슬롯 데이터/메타를 쓴 뒤 마지막에 증가)
+  - 소비자는 seqlock 방식으로 읽음: 메타/데이터를 복사한 뒤 is_overwritten()을 다시 확인해 그 사이
+    생산자가 슬롯을 다시 쓰기 시작했으면 복사본을 버림
+  """
+  HEADER_ITEMS = 2
+  META_ITEMS = 4
+
+  def __init__(self, channel_count, block_size, n_slots=64, name=None, create=True, dtype=np.float64):
+    self.channel_count = channel_count
+    self.block_size = block_size
+    self.n_slots = n_slots
+    self.created = create
+    header_bytes = self.HEADER_ITEMS * 8
+    meta_bytes = n_slots * self.META_ITEMS * 8
+    self.dtype = np.dtype(dtype)
+    data_bytes = n_slots * channel_count * block_size * self.dtype.itemsize
+    if create:
+      self.shm = shared_memory.SharedMemory(name=name, create=True, size=header_bytes + meta_bytes + data_bytes)
+    elif sys.version_info >= (3, 13):
+      # 붙기만 하는 쪽은 리소스 트래커에 등록하지 않음 (해제는 생성한 프로세스 담당)
+      self.shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+      self.shm = shared_memory.SharedMemory(name=name)
+    buf = self.shm.buf
+    self._header = np.ndarray((self.HEADER_ITEMS,), dtype=np.int64, buffer=buf, offset=0)
+    self._meta = np.ndarray((n_slots, self.META_ITEMS), dtype=np.int64, buffer=buf, offset=header_bytes)
+    self._data = np.ndarray((n_slots, channel_count, block_size), dtype=self.dtype, buffer=buf,
+                            offset=header_bytes + meta_bytes)
+    if create:
+      self._header[:] = 0
+
+  @property
+  def name(self):
+    return self.shm.name
+
+  @property
+  def write_count(self):
+    """지금까지 기록된 슬롯 수"""
+    return int(self._header[0])
+
+  def write_slot(self):
+    """
+    다음에 기록할 슬롯 (생산자 전용, (채널 수, 블록 크기) C-연속 뷰)
+    """
+    return self._data[self.write_count % self.n_slots]
+
+  def commit(self, start_sample, n_samples, read_ns=0, backlog=0):
+    """
+    write_slot()에 채운 데이터를 소비자에게 공개
+    """
+    index = self.write_count
+    self._meta[index % self.n_slots] = (start_sample, n_samples, read_ns, backlog)
+    self._header[0] = index + 1
+
+  def meta(self, index):
+    """
+    index번째 슬롯 메타 (시작 샘플, 샘플 수, 읽기 시간(ns), 백로그)
+    """
+    return tuple(int(v) for v in self._meta[index % self.n_slots])
+
+  def slot_view(self, index, n_samples=None):
+    """
+    index번째 슬롯 데이터 뷰 (복사 없음, n_slots개 슬롯 뒤에는 덮어써지므로 보관하려면 복사 후 재확인)
+    """
+    view = self._data[index % self.n_slots]
+    return view if n_samples is None else view[:, :n_samples]
+
+  def is_overwritten(self, index):
+    """
+    index번째 슬롯이 생산자에게 덮어써졌거나 덮어쓰는 중인지 여부
+    - 기록 수가 index + n_slots가 되면 생산자의 다음 write_slot()이 같은 슬롯이므로 이미 안전하지 않음
+    """
+    return self.write_count - index >= self.n_slots
+
+  def close(self):
+    """
+    공유 메모리 해제 (생성자는 이름도 제거)
+    - 소비자가 아직 뷰를 들고 있으면 매핑은 뷰가 사라질 때 해제됨
+    """
+    self._header = self._meta = self._data = None
+    if self.created:
+      try:
+        self.shm.unlink()
+      except FileNotFoundError:
+        pass
+    try:
+      self.shm.close()
+    except BufferError:
+      pass
+
+def acquisition_process_main(backend, shm_name, channel_count, block_size, n_slots, stop_event, status_queue, raw=False):
+  """
+  자식 프로세스 수집 루프: 백엔드가 공유 메모리 슬롯에 직접 읽고 commit
+  - status_queue로 ("started", t0, t0_monotonic, 스케일링 dict 또는 None), ("error", 메시지, 오버플로 여부),
+    ("stopped",) 전달
+  - raw=True: int16 슬롯에 원시 코드로 읽음
+  - stop_event 설정 시 종료
+  """
+  ring = SharedSlotRing(channel_count, block_size, n_slots, name=shm_name, create=False,
+                        dtype=np.int16 if raw else np.float64)
+  try:
+    backend.start()
+    scaling = backend.scaling() if raw else None
+  except Exception as e:
+    status_queue.put(("error", f"DAQ 초기화 오류: {e}", False))
+    try:
+      backend.stop()
+    except Exception:
+      pass
+    finally:
+      ring.close()
+      status_queue.put(("stopped",))
+    return
+  # 기준 시각은 태스크 시작 시 한 번만 고정 (monotonic은 프로세스 간 공통 시계)
+  status_queue.put(("started", time.time(), time.monotonic(), scaling.to_dict() if scaling is not None else None))
+  sample_index = 0
+  lost_seen = backend.lost_samples
+  try:
+    while not stop_event.is_set():
+      slot = ring.write_slot()
+      started = time.perf_counter()
+      n_read = backend.read_into(slot)
+      read_ns = int((time.perf_counter() - started) * 1e9)
+      # 장치에서 유실된 샘플은 시작 인덱스를 건너뛰어 표시
+      sample_index += backend.lost_samples - lost_seen
+      lost_seen = backend.lost_samples
+      ring.commit(sample_index, n_read, read_ns, backend.available())
+      sample_index += n_read
+  except Exception as e:
+    status_queue.put(("error", f"데이터 수집 중 오류: {e}", backend.is_overflow(e)))
+  finally:
+    try:
+      backend.stop()
+    finally:
+      ring.close()
+      status_queue.put(("stopped",))
+
+def drain_status(status_queue):
+  """
+  상태 큐에 쌓인 메시지를 모두 꺼내 리스트로 반환 (대기 없음)
+  """
+  messages = []
+  while True:
+    try:
+      messages.append(status_queue.get_nowait())
+    except queue.Empty:
+      return messages
@@ -1,52 +1,564 @@
 from PySide6.QtCore import QThread, Signal
-import nidaqmx
+from src.daq_backend import NiDaqBackend
+from src.daq_process import SharedSlotRing, acquisition_process_main, drain_status
+from src.scaling import ChannelScaling
+from src.timebase import SampleClock, ChunkTimebase
 import numpy as np
+import multiprocessing
+import bisect
 import time
 
+def expand_channels(channels):
+  """
+  채널 목록/범위 문자열을 개별 채널명 리스트로 변환
+  - ["ai0", "ai1"] → 그대로
+  - "ai0:3" → ["ai0", "ai1", "ai2", "ai3"]
+  - "ai0,ai2" → ["ai0", "ai2"]
+  """
+  if isinstance(channels, (list, tuple)):
+    names = [str(c).strip() for c in channels]
+  else:
+    names = []
+    for part in str(channels).split(","):
+      part = part.strip()
+      if ":" in part:
+        first, last = part.split(":", 1)
+        prefix = first.rstrip("0123456789")
+        start = int(first[len(prefix):])
+        end = int(last[len(prefix):] if last.startswith(prefix) else last)
+        step = 1 if end >= start else -1
+        names.extend(f"{prefix}{i}" for i in range(start, end + step, step))
+      elif part:
+        names.append(part)
+  if not names:
+    raise ValueError("채널 목록이 비어 있습니다.")
+  return names
+
+class BufferPool:
+  """
+  미리 할당된 (채널 수, 샘플 수) 버퍼를 순환 재사용하는 풀
+  - 수집 루프에서 매 읽기마다 새 배열을 만들지 않도록 함
+  - pool_size 번 읽은 뒤 같은 버퍼가 다시 채워지므로, 데이터를 보관하려는 동기 소비자(싱크)는 복사해야 함
+  - delivered: GUI 스레드에 전달 완료된 emit 수를 돌려주는 함수 (지정 시 hold()로 표시한 버퍼는
+    해당 emit이 전달되기 전까지 덮어쓰지 않고, 그 자리는 새 버퍼로 교체 → 큐 연결 슬롯도 안전하게 받음)
+  """
+  def __init__(self, channel_count, samples_per_read, pool_size=8, dtype=np.float64, delivered=None):
+    if pool_size < 1:
+      raise ValueError("pool_size는 1 이상이어야 합니다.")
+    self.channel_count = channel_count
+    self.capacity = samples_per_read
+    self.buffers = [np.zeros((channel_count, samples_per_read), dtype=dtype) for _ in range(pool_size)]
+    self.delivered = delivered
+    self.replaced = 0               # 전달 전이라 교체한 버퍼 수 (GUI가 pool_size 이상 밀린 횟수)
+    self._holds = [0] * pool_size   # 버퍼별로 전달을 기다리는 emit 번호 (0이면 없음)
+    self._index = 0
+    self._last = None
+
+  def acquire(self, n_samples=None) -> np.ndarray:
+    """
+    다음 순번의 버퍼 반환 (C-연속 배열, 스트림 리더에 바로 전달 가능)
+    n_samples: 용량보다 적게 지정 시 같은 메모리 앞부분을 (채널 수, n_samples) 연속 배열로 반환
+    """
+    index = self._index
+    if self.delivered is not None and self._holds[index] > self.delivered():
+      # 이전 emit이 아직 GUI에 전달되지 않음: 덮어쓰지 않고 새 버퍼로 교체 (기존 배열은 시그널 인자가 보관)
+      self.buffers[index] = np.empty_like(self.buffers[index])
+      self.replaced += 1
+    self._holds[index] = 0
+    self._last = index
+    buf = self.buffers[index]
+    self._index = (index + 1) % len(self.buffers)
+    if n_samples is None or n_samples == self.capacity:
+      return buf
+    if n_samples > self.capacity:
+      raise ValueError(f"요청 샘플 수({n_samples})가 버퍼 용량({self.capacity})보다 큽니다.")
+    return buf.reshape(-1)[:self.channel_count * n_samples].reshape(self.channel_count, n_samples)
+
+  def hold(self, emit_count):
+    """
+    마지막으로 반환한 버퍼를 emit_count번째 emit이 전달될 때까지 재사용하지 않도록 표시
+    """
+    if self._last is not None:
+      self._holds[self._last] = emit_count
+
+class AcquisitionHealth:
+  """
+  수집 스레드 상태(헬스) 누적기
+  - 장치 백로그, 총 읽은 샘플 수, 읽기 호출 시간 히스토그램
+  - emit 대기열 깊이(emit 수 - GUI 전달 수), 유실(gap)/오버플로 횟수
+  - 표시용 청크를 버리거나 솎아낸 샘플 수 (기록용 싱크에는 항상 전체 전달)
+  """
+  # 읽기 호출 시간 히스토그램 구간 경계(ms): [0,1), [1,2), ..., [500, inf)
+  READ_DURATION_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+  def __init__(self):
+    self.reset()
+
+  def reset(self):
+    self.backlog = 0
+    self.total_samples = 0
+    self.reads = 0
+    self.read_hist = [0] * (len(self.READ_DURATION_EDGES_MS) + 1)
+    self.max_read_ms = 0.0
+    self.emitted = 0
+    self.delivered = 0
+    self.overflows = 0
+    self.gaps = 0
+    self.lost_samples = 0
+    self.dropped_display_chunks = 0
+    self.dropped_display_samples = 0
+    self.decimation = 1
+
+  @property
+  def queue_depth(self):
+    """GUI 스레드에 아직 전달되지 않은 emit 수"""
+    return max(self.emitted - self.delivered, 0)
+
+  def record_read(self, duration, n_samples):
+    ms = duration * 1000.0
+    self.reads += 1
+    self.total_samples += n_samples
+    self.read_hist[bisect.bisect_right(self.READ_DURATION_EDGES_MS, ms)] += 1
+    self.max_read_ms = max(self.max_read_ms, ms)
+
+  def snapshot(self) -> dict:
+    return {
+      "backlog": self.backlog,
+      "total_samples": self.total_samples,
+      "reads": self.reads,
+      "read_hist_edges_ms": list(self.READ_DURATION_EDGES_MS),
+      "read_hist": list(self.read_hist),
+      "max_read_ms": self.max_read_ms,
+      "queue_depth": self.queue_depth,
+      "overflows": self.overflows,
+      "gaps": self.gaps,
+      "lost_samples": self.lost_samples,
+      "dropped_display_chunks": self.dropped_display_chunks,
+      "dropped_display_samples": self.dropped_display_samples,
+      "decimation": self.decimation,
+    }
+
 class DaqDataCollector(QThread):
-  # 데이터 수집 신호: (numpy 배열, 타임스탬프)
+  # 데이터 수집 신호: (numpy 배열, 청크 첫 샘플 시각(샘플 인덱스 기반 epoch 초))
   data_collected = Signal(np.ndarray, float)
+  # 청크 수집 신호: (numpy 배열, ChunkTimebase)
+  chunk_collected = Signal(np.ndarray, object)
   # 에러 발생 신호: (에러 메시지)
   error_occurred = Signal(str)
+  # 적응형 모드 텔레메트리 신호: (읽기/배치 크기, 지연 등 dict, 약 1초 주기)
+  telemetry_updated = Signal(dict)
+  # 수집 헬스 신호: (백로그/읽기 시간 히스토그램/대기열 깊이/유실 등 dict, health_interval 주기)
+  health_updated = Signal(dict)
 
-  def __init__(self, device_name, channel, sample_rate=10000, samples_per_read=1000, parent=None):
+  # 표시용 emit 저하(degrade) 정책
+  DEGRADE_POLICIES = (None, "decimate", "drop")
+
+  def __init__(self, device_name, channel, sample_rate=10000, samples_per_read=1000, channels=None, pool_size=8, backend=None,
+               adaptive=False, target_latency=0.05, max_emit_rate=30.0, telemetry_interval=1.0,
+               health_interval=1.0, degrade_policy=None, max_queue_depth=4, out_of_process=False, ring_slots=64,
+               raw=False, parent=None):
     super().__init__(parent)
     self.device_name = device_name  # DAQ 디바이스 이름
     self.channel = channel          # 수집 채널명 (예: 'ai0')
     self.sample_rate = sample_rate  # 샘플링 속도(Hz)
     self.samples_per_read = samples_per_read  # 한 번에 읽을 샘플 개수
+    # 다채널 모드: 채널 목록(["ai0", "ai1"]) 또는 범위("ai0:15") 지정 시 활성화
+    self.channels = expand_channels(channels) if channels is not None else None
+    self.pool_size = pool_size      # 다채널 모드에서 순환 사용할 버퍼 개수
+    # 수집 백엔드 (None이면 NI-DAQmx, 하드웨어 없이 테스트 시 SyntheticBackend 등 지정)
+    self.backend = backend
+    if backend is not None:
+      self.sample_rate = backend.sample_rate
+    # 적응형 모드: 장치 백로그/목표 지연으로 읽기 크기를 정하고, 청크를 병합해 GUI emit 횟수를 제한
+    self.adaptive = adaptive
+    self.target_latency = target_latency      # 목표 지연(초)
+    self.max_emit_rate = max_emit_rate        # GUI로 보내는 초당 최대 emit 횟수
+    self.telemetry_interval = telemetry_interval  # 텔레메트리 신호 주기(초)
+    self.telemetry = {}             # 최근 텔레메트리 (읽기/배치 크기, 지연 등)
+    self.clock = None               # 수집 시작 시 고정되는 샘플 클럭 (SampleClock)
+    # 헬스/저하 정책: GUI 대기열이 max_queue_depth 이상 밀리면 표시용 청크를 솎아내거나(decimate) 버림(drop)
+    if degrade_policy not in self.DEGRADE_POLICIES:
+      raise ValueError(f"지원하지 않는 저하 정책입니다: {degrade_policy}")
+    self.health_interval = health_interval
+    self.degrade_policy = degrade_policy
+    self.max_queue_depth = max_queue_depth
+    self.health = AcquisitionHealth()
+    # 별도 프로세스 수집 모드: 자식 프로세스가 백엔드를 소유하고 공유 메모리 링(ring_slots개 슬롯)에 기록
+    # (GIL 경합 회피, 시그널 API는 동일하며 samples_per_read 블록 단위로 전달)
+    if out_of_process and adaptive:
+      raise ValueError("out_of_process 모드는 adaptive 모드와 함께 사용할 수 없습니다.")
+    self.out_of_process = out_of_process
+    self.ring_slots = ring_slots
+    # 원시(raw) 모드: 장치 int16 코드를 그대로 읽어 전달 (float64 대비 1/4 대역폭/메모리)
+    # 전압 변환 계수는 수집 시작 후 self.scaling (ChannelScaling), 변환은 필요한 곳에서 scaling.apply()
+    self.raw = raw
+    self.dtype = np.int16 if raw else np.float64
+    self.scaling = None
+    self._sinks = []                # 기록용 싱크 (수집 스레드에서 모든 청크를 받음)
+    self._last_health = 0.0
+    self._lost_seen = 0
     self._running = False           # 스레드 실행 플래그
+    # GUI 스레드로 전달된 emit 수 집계 (이 객체는 생성 스레드에 속하므로 큐 연결로 GUI에서 실행됨)
+    self.chunk_collected.connect(self._on_chunk_delivered)
+
+  @property
+  def channel_count(self):
+    if self.backend is not None:
+      return self.backend.channel_count
+    return len(self.channels) if self.channels is not None else 1
+
+  def add_sink(self, sink):
+    """
+    기록용 싱크 등록: sink(data, timebase)가 수집 스레드에서 모든 청크에 대해 호출됨
+    - 표시 저하 정책과 무관하게 샘플 손실 없음
+    - data는 재사용 버퍼이므로 보관하려면 복사해야 하며, 싱크는 빠르게 반환해야 함(큐에 넣기 등)
+    """
+    if sink not in self._sinks:
+      self._sinks.append(sink)
+
+  def remove_sink(self, sink):
+    if sink in self._sinks:
+      self._sinks.remove(sink)
+
+  def _on_chunk_delivered(self, data, timebase):
+    self.health.delivered += 1
+
+  def _delivered(self):
+    """GUI 스레드에 전달 완료된 emit 수 (BufferPool 재사용 판단용)"""
+    return self.health.delivered
+
+  def create_backend(self):
+    """
+    사용할 수집 백엔드 반환 (지정된 백엔드 또는 NI-DAQmx 백엔드)
+    """
+    if self.backend is not None:
+      return self.backend
+    return NiDaqBackend(self.physical_channels(), channel_count=self.channel_count,
+                        sample_rate=self.sample_rate, multi_channel=self.channels is not None)
+
+  def physical_channels(self):
+    """
+    DAQmx에 전달할 물리 채널 문자열 (예: 'Dev1/ai0,Dev1/ai1')
+    """
+    names = self.channels if self.channels is not None else [self.channel]
+    return ",".join(f"{self.device_name}/{name}" for name in names)
 
   def run(self):
     """
-    QThread 실행 함수. DAQ 하드웨어에서 데이터를 실시간으로 수집.
+    QThread 실행 함수. 수집 백엔드에서 데이터를 실시간으로 수집.
     """
     self._running = True
+    backend = self.create_backend()
+    if self.out_of_process:
+      self._read_out_of_process(backend)
+      return
     try:
-      # DAQmx Task 생성
-      with nidaqmx.Task() as task:
-        # 아날로그 입력 채널 추가
-        task.ai_channels.add_ai_voltage_chan(f"{self.device_name}/{self.channel}")
-        # 샘플 클럭 설정
-        task.timing.cfg_samp_clk_timing(self.sample_rate, sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS)
-        while self._running:
-          try:
-            # 데이터 읽기
-            data = task.read(number_of_samples_per_channel=self.samples_per_read)
-            np_data = np.array(data)
-            timestamp = time.time()
-            # 데이터 수집 신호 발생
-            self.data_collected.emit(np_data, timestamp)
-          except Exception as e:
-            # 데이터 읽기 중 에러 발생 시 에러 신호 발생
-            self.error_occurred.emit(f"데이터 수집 중 오류: {e}")
-            break
+      # 백엔드(DAQmx Task 등) 생성/설정
+      backend.start()
+      self.scaling = self._raw_scaling(backend.scaling() if self.raw else None)
     except Exception as e:
-      # DAQ Task 생성/설정 중 에러 발생 시 에러 신호 발생
+      # DAQ Task 생성/설정 중 에러 발생 시 에러 신호 발생 (이미 연 Task는 정리)
       self.error_occurred.emit(f"DAQ 초기화 오류: {e}")
+      self._stop_backend(backend)
+      return
+    # 기준 시각은 태스크 시작 시 한 번만 고정
+    self.clock = SampleClock(self.sample_rate)
+    self.clock.start()
+    self.health.reset()
+    self._lost_seen = backend.lost_samples
+    self._last_health = time.monotonic()
+    try:
+      if self.adaptive:
+        self._read_adaptive(backend)
+      elif self.raw or self.channels is not None or self.channel_count > 1:
+        self._read_pooled(backend)
+      else:
+        self._read_single(backend)
+    finally:
+      self._stop_backend(backend)
+
+  def _stop_backend(self, backend):
+    """
+    백엔드 정지 (종료 중 오류는 error_occurred로 알림)
+    """
+    try:
+      backend.stop()
+    except Exception as e:
+      self.error_occurred.emit(f"DAQ 종료 오류: {e}")
+
+  def _read_single(self, backend):
+    """
+    단일 채널 수집 루프 (백엔드와 관계없이 별도 프로세스 모드와 같은 1차원 (샘플 수,) 배열을 emit)
+    """
+    while self._running:
+      try:
+        # 데이터 읽기 (백엔드는 (1, 샘플 수)로 반환)
+        started = time.perf_counter()
+        np_data = backend.read(self.samples_per_read, self.dtype)[0]
+        self._account_read(backend, time.perf_counter() - started, np_data.shape[-1])
+        # 데이터 수집 신호 발생
+        self._emit_chunk(np_data)
+      except Exception as e:
+        # 데이터 읽기 중 에러 발생 시 에러 신호 발생
+        self._on_read_error(backend, e)
+        break
+
+  def _read_pooled(self, backend):
+    """
+    다채널 수집 루프: 백엔드가 풀 버퍼에 직접 읽어 (채널 수, 샘플 수) 배열을 emit
+    (파이썬 리스트 생성/복사 없음)
+    """
+    pool = BufferPool(self.channel_count, self.samples_per_read, self.pool_size, self.dtype, self._delivered)
+    while self._running:
+      try:
+        buf = pool.acquire()
+        started = time.perf_counter()
+        n_read = backend.read_into(buf)
+        self._account_read(backend, time.perf_counter() - started, n_read)
+        if n_read < self.samples_per_read:
+          buf = buf[:, :n_read]
+        self._emit_chunk(buf, pool=pool)
+      except Exception as e:
+        self._on_read_error(backend, e)
+        break
+
+  def read_size_limits(self):
+    """
+    적응형 모드의 (기본 읽기 크기, 최대 읽기 크기, 배치 용량) 계산
+    - 기본: 목표 지연 동안 쌓이는 샘플 수 (백로그가 적을 때 한 번 읽기 대기 시간 ≈ 목표 지연)
+    - 최대: 기본의 4배 (백로그가 쌓이면 한 번에 비움)
+    - 배치 용량: emit 간격 동안 쌓이는 샘플 수 + 최대 읽기 크기
+    """
+    base = max(int(self.sample_rate * self.target_latency), 1)
+    max_read = base * 4
+    batch_capacity = int(np.ceil(self.sample_rate / self.max_emit_rate)) + max_read
+    return base, max_read, batch_capacity
+
+  def next_read_size(self, backlog):
+    """
+    장치 백로그로 다음 읽기 크기 결정 (기본 크기 이상, 최대 크기 이하)
+    """
+    base, max_read, _ = self.read_size_limits()
+    return int(min(max(base, backlog), max_read))
+
+  def _read_adaptive(self, backend):
+    """
+    적응형 수집 루프: 백로그 기반 읽기 + 청크 병합 후 최대 max_emit_rate 회/초로 emit
+    """
+    _, max_read, batch_capacity = self.read_size_limits()
+    read_pool = BufferPool(self.channel_count, max_read, 1, self.dtype)
+    batch_pool = BufferPool(self.channel_count, batch_capacity, self.pool_size, self.dtype, self._delivered)
+    emit_interval = 1.0 / self.max_emit_rate
+    batch = batch_pool.acquire()
+    fill = chunks = start_sample = 0
+    drift = 0.0
+    last_emit = last_telemetry = time.monotonic()
+
+    def flush():
+      nonlocal batch, fill, chunks, last_emit, last_telemetry
+      if fill == 0:
+        return
+      timebase = ChunkTimebase(start_sample, self.clock.t0, self.clock.dt, drift, fill)
+      now = time.monotonic()
+      self._emit_chunk(batch[:, :fill], timebase, batch_pool)
+      # 배치 첫 샘플이 장치에서 수집된 시점부터 emit까지의 지연
+      latency = now - (self.clock.t0_monotonic + start_sample * self.clock.dt)
+      self.telemetry.update({
+        "batch_samples": fill,
+        "batch_chunks": chunks,
+        "latency": latency,
+        "emit_interval": now - last_emit,
+      })
+      last_emit = now
+      batch = batch_pool.acquire()
+      fill = chunks = 0
+      if now - last_telemetry >= self.telemetry_interval:
+        self.telemetry_updated.emit(dict(self.telemetry))
+        last_telemetry = now
+
+    while self._running:
+      try:
+        n = self.next_read_size(backend.available())
+        buf = read_pool.acquire(n)
+        started = time.perf_counter()
+        n_read = backend.read_into(buf)
+        if self._account_read(backend, time.perf_counter() - started, n_read):
+          flush()  # 유실 구간을 사이에 둔 샘플은 한 배치로 합치지 않음
+        timebase = self.clock.advance(n_read)
+        if fill + n_read > batch_capacity:
+          flush()
+        if fill == 0:
+          start_sample = timebase.start_sample
+        batch[:, fill:fill + n_read] = buf[:, :n_read]
+        fill += n_read
+        chunks += 1
+        drift = timebase.drift
+        self.telemetry["read_samples"] = n_read
+        if time.monotonic() - last_emit >= emit_interval:
+          flush()
+      except Exception as e:
+        self._on_read_error(backend, e)
+        break
+    # 정지 시 남은 샘플도 전달
+    flush()
+
+  def _read_out_of_process(self, backend):
+    """
+    별도 프로세스 수집 루프: 자식 프로세스가 공유 메모리 슬롯에 쓴 블록을 버퍼 풀에 복사해 emit
+    - 복사 후 슬롯이 덮어써졌는지 다시 확인 (seqlock), 덮어써졌으면 버리고 다음 슬롯의 시작 샘플로 유실 집계
+    """
+    ctx = multiprocessing.get_context("spawn")
+    ring = SharedSlotRing(self.channel_count, self.samples_per_read, self.ring_slots, dtype=self.dtype)
+    stop_event = ctx.Event()
+    status_queue = ctx.Queue()
+    process = ctx.Process(target=acquisition_process_main, daemon=True,
+                          args=(backend, ring.name, self.channel_count, self.samples_per_read, self.ring_slots,
+                                stop_event, status_queue, self.raw))
+    # 공유 메모리 슬롯은 생산자가 곧 다시 쓰므로 emit할 블록은 풀 버퍼에 복사 (다중 채널 모드와 같은 수명 규칙)
+    pool = BufferPool(self.channel_count, self.samples_per_read, self.pool_size, self.dtype, self._delivered)
+    self.health.reset()
+    try:
+      process.start()
+      # 자식 프로세스의 시작(기준 시각) 또는 초기화 오류 대기
+      message = status_queue.get(timeout=60)
+      if message[0] != "started":
+        self.error_occurred.emit(message[1])
+        return
+      self.clock = SampleClock(self.sample_rate)
+      self.clock.t0, self.clock.t0_monotonic = message[1], message[2]
+      self.scaling = self._raw_scaling(ChannelScaling.from_dict(message[3]) if message[3] else None)
+      self._last_health = time.monotonic()
+      # 단일 채널은 기존 모드와 같이 1차원 배열로 전달
+      multi_channel = self.channels is not None or self.channel_count > 1
+      read_index = 0
+      stopped = False
+      while self._running and not stopped:
+        for message in drain_status(status_queue):
+          if message[0] == "error":
+            if message[2]:
+              self.health.overflows += 1
+            self.error_occurred.emit(message[1])
+          elif message[0] == "stopped":
+            stopped = True
+        write_count = ring.write_count
+        if write_count == read_index:
+          time.sleep(0.001)
+          continue
+        # 소비가 늦어 덮어써진 슬롯은 건너뜀 (시작 샘플 차이로 유실 집계)
+        read_index = max(read_index, write_count - ring.n_slots + 1)
+        while read_index < write_count and self._running:
+          start_sample, n_samples, read_ns, backlog = ring.meta(read_index)
+          data = pool.acquire(n_samples)
+          np.copyto(data, ring.slot_view(read_index, n_samples))
+          # 메타/데이터 복사 도중 생산자가 슬롯을 다시 쓰기 시작했으면 복사본은 깨졌을 수 있으므로 버림
+          if not ring.is_overwritten(read_index):
+            self._account_slot(start_sample, n_samples, read_ns, backlog)
+            self._emit_chunk(data if multi_channel else data[0], self.clock.advance(n_samples), pool)
+          read_index += 1
+        if time.monotonic() - self._last_health >= self.health_interval:
+          self._last_health = time.monotonic()
+          self._publish_health()
+    except Exception as e:
+      self.error_occurred.emit(f"DAQ 프로세스 오류: {e}")
+    finally:
+      stop_event.set()
+      process.join(timeout=5)
+      if process.is_alive():
+        process.terminate()
+        process.join()
+      ring.close()
+
+  def _raw_scaling(self, scaling):
+    if self.raw and scaling is None:
+      raise ValueError("원시(raw) 모드를 지원하지 않는 백엔드입니다.")
+    return scaling
+
+  def _account_slot(self, start_sample, n_samples, read_ns, backlog):
+    """
+    공유 메모리 슬롯 메타로 헬스 집계 (시작 샘플이 건너뛰었으면 유실로 처리)
+    """
+    self.health.record_read(read_ns / 1e9, n_samples)
+    self.health.backlog = backlog
+    lost = start_sample - self.clock.sample_count
+    if lost > 0:
+      self.health.gaps += 1
+      self.health.lost_samples += lost
+      self.clock.skip(lost)
+
+  def _account_read(self, backend, duration, n_read):
+    """
+    읽기 1회 헬스 집계 (읽기 시간/샘플 수/유실) 및 주기적 헬스 신호 발생
+    유실 샘플이 있으면 샘플 클럭을 건너뛰고 유실 샘플 수 반환
+    """
+    self.health.record_read(duration, n_read)
+    lost = backend.lost_samples - self._lost_seen
+    if lost > 0:
+      self._lost_seen = backend.lost_samples
+      self.health.gaps += 1
+      self.health.lost_samples += lost
+      self.clock.skip(lost)
+    now = time.monotonic()
+    if now - self._last_health >= self.health_interval:
+      self._last_health = now
+      self._publish_health(backend)
+    return max(lost, 0)
+
+  def _publish_health(self, backend=None):
+    if backend is not None:
+      try:
+        self.health.backlog = backend.available()
+      except Exception:
+        pass
+    self.health_updated.emit(self.health.snapshot())
+
+  def _on_read_error(self, backend, error):
+    """
+    읽기 예외 처리: 오버플로 집계 후 헬스/에러 신호 발생 (수집 루프는 종료)
+    """
+    if backend.is_overflow(error):
+      self.health.overflows += 1
+    self._publish_health(backend)
+    self.error_occurred.emit(f"데이터 수집 중 오류: {error}")
+
+  def _emit_chunk(self, data, timebase=None, pool=None):
+    """
+    샘플 클럭으로 청크 타임베이스를 계산해 시그널 emit
+    - 기록용 싱크에는 항상 전체 청크 전달
+    - 표시용 시그널은 GUI 대기열이 밀리면 저하 정책(decimate/drop) 적용
+    - pool: data가 이 풀의 버퍼이면 GUI에 전달될 때까지 그 버퍼를 재사용하지 않도록 표시
+    """
+    if timebase is None:
+      timebase = self.clock.advance(data.shape[-1])
+    for sink in list(self._sinks):
+      try:
+        sink(data, timebase)
+      except Exception as e:
+        self.error_occurred.emit(f"기록 싱크 오류: {e}")
+    n_samples = data.shape[-1]
+    depth = self.health.queue_depth
+    if self.degrade_policy is not None and depth >= self.max_queue_depth:
+      if self.degrade_policy == "drop":
+        self.health.dropped_display_chunks += 1
+        self.health.dropped_display_samples += n_samples
+        return
+      # 대기열이 밀린 정도에 따라 2, 4, 8, ... 배 솎아내기 (최대 64배)
+      factor = min(2 ** (depth - self.max_queue_depth + 1), 64)
+      data = data[..., ::factor]
+      timebase = ChunkTimebase(timebase.start_sample, timebase.t0, timebase.dt, timebase.drift,
+                               data.shape[-1], step=factor * timebase.step)
+      self.health.dropped_display_samples += n_samples - data.shape[-1]
+      self.health.decimation = factor
+    else:
+      self.health.decimation = 1
+    self.health.emitted += 1
+    self.data_collected.emit(data, timebase.start_time)
+    self.chunk_collected.emit(data, timebase)
+    if pool is not None:
+      # 전달 집계 슬롯은 가장 먼저 연결되어 같은 emit의 다른 슬롯보다 먼저 실행되므로 다음 emit 전달까지 보관
+      pool.hold(self.health.emitted + 1)
 
   def stop(self):
     """
     스레드 종료 요청 함수
     """
-    self._running = False 
\ No newline at end of file
+    self._running = False
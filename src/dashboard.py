@@ -1,6 +1,7 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QMessageBox, QTextEdit, QListWidget, QGroupBox, QLabel, QMenu, QDialog, QFormLayout, QSpinBox, QComboBox
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QMessageBox, QListWidget, QGroupBox, QLabel, QMenu, QDialog, QFormLayout, QSpinBox, QComboBox, QPlainTextEdit
 from PySide6.QtCore import Qt, QMimeData, QEvent
 from PySide6.QtGui import QDrag, QMouseEvent, QDropEvent, QDragEnterEvent, QPixmap, QCursor
+from src.log_view import LogView
 import json
 
 class DraggableGroupBox(QGroupBox):
@@ -58,6 +59,7 @@ class DashboardWidget(QWidget):
   - 레이아웃 저장/불러오기 지원
   - 플롯, 통계, 로그, 신호 목록 등 다양한 위젯 추가 지원
   - [프리셋/템플릿] 지원 (2024-06 추가)
+  - 처리 그래프(ProcessingGraph) 설정 편집, 레이아웃 JSON에 함께 저장
   """
   def __init__(self, parent=None):
     super().__init__(parent)
@@ -65,6 +67,7 @@ class DashboardWidget(QWidget):
     self.layout = QVBoxLayout()
     self.setLayout(self.layout)
     self.widget_list = []  # 현재 배치된 위젯 목록
+    self.pipeline = None   # 레이아웃과 함께 저장/복원할 처리 그래프 (set_pipeline)
 
     # [프리셋/템플릿] 미리 정의된 프리셋 목록
     # 각 프리셋은 위젯 타입/설정 리스트로 구성
@@ -72,16 +75,16 @@ class DashboardWidget(QWidget):
       "기본": [
         {"type": "RealtimePlotWidget", "channel_count": 1, "buffer_size": 10000},
         {"type": "QLabel"},
-        {"type": "QTextEdit"},
+        {"type": "LogView"},
         {"type": "QListWidget", "signals": ["채널 1"]},
       ],
       "오실로스코프": [
         {"type": "RealtimePlotWidget", "channel_count": 2, "buffer_size": 10000},
-        {"type": "QTextEdit"},
+        {"type": "LogView"},
       ],
       "통계+로그": [
         {"type": "QLabel"},
-        {"type": "QTextEdit"},
+        {"type": "LogView"},
       ],
     }
 
@@ -93,12 +96,15 @@ class DashboardWidget(QWidget):
     self.add_stats_btn = QPushButton("통계 추가")
     self.add_log_btn = QPushButton("로그 추가")
     self.add_signal_btn = QPushButton("신호 목록 추가")
+    self.pipeline_btn = QPushButton("파이프라인")
+    self.pipeline_btn.setEnabled(False)
     btn_layout.addWidget(self.save_btn)
     btn_layout.addWidget(self.load_btn)
     btn_layout.addWidget(self.add_plot_btn)
     btn_layout.addWidget(self.add_stats_btn)
     btn_layout.addWidget(self.add_log_btn)
     btn_layout.addWidget(self.add_signal_btn)
+    btn_layout.addWidget(self.pipeline_btn)
     self.layout.addLayout(btn_layout)
 
     self.save_btn.clicked.connect(self.save_layout)
@@ -107,6 +113,51 @@ class DashboardWidget(QWidget):
     self.add_stats_btn.clicked.connect(self._add_stats)
     self.add_log_btn.clicked.connect(self._add_log)
     self.add_signal_btn.clicked.connect(self._add_signal)
+    self.pipeline_btn.clicked.connect(self.show_pipeline_dialog)
+
+  def set_pipeline(self, pipeline):
+    """
+    레이아웃과 함께 저장/복원하고 "파이프라인" 버튼으로 편집할 처리 그래프 지정
+    """
+    self.pipeline = pipeline
+    self.pipeline_btn.setEnabled(pipeline is not None)
+
+  def show_pipeline_dialog(self):
+    """
+    처리 그래프 설정(JSON) 편집 다이얼로그 (단계별 처리 시간 표시, 확인 시 실행 중에도 한 번에 교체)
+    """
+    if self.pipeline is None:
+      return
+    dlg = QDialog(self)
+    dlg.setWindowTitle("처리 그래프 설정")
+    form = QFormLayout(dlg)
+    editor = QPlainTextEdit(json.dumps(self.pipeline.to_config(), ensure_ascii=False, indent=2))
+    editor.setMinimumSize(480, 320)
+    form.addRow(editor)
+    timing = self.pipeline.format_timing()
+    form.addRow("처리 시간", QLabel(timing.replace(", ", "\n") if timing else "실행 기록 없음"))
+    btn_ok = QPushButton("확인")
+    btn_cancel = QPushButton("취소")
+    btn_layout = QHBoxLayout()
+    btn_layout.addWidget(btn_ok)
+    btn_layout.addWidget(btn_cancel)
+    form.addRow(btn_layout)
+    btn_ok.clicked.connect(lambda: self.apply_pipeline_config(editor.toPlainText(), dlg))
+    btn_cancel.clicked.connect(dlg.reject)
+    dlg.exec()
+
+  def apply_pipeline_config(self, text, dlg=None):
+    """
+    처리 그래프 설정 적용 (JSON 문자열, 잘못된 설정이면 오류 표시 후 기존 그래프 유지)
+    """
+    try:
+      self.pipeline.load_config(json.loads(text))
+    except Exception as e:
+      QMessageBox.critical(self, "처리 그래프 오류", f"처리 그래프 설정 오류: {e}")
+      return False
+    if dlg is not None:
+      dlg.accept()
+    return True
 
   def _add_plot(self):
     from src.plot_widget import RealtimePlotWidget
@@ -194,12 +245,12 @@ class DashboardWidget(QWidget):
     self.add_dashboard_widget(label, widget_id="stats", title="통계")
     return label
 
-  def add_log_widget(self):
+  def add_log_widget(self, model=None):
     """
-    로그 표시용 QTextEdit 위젯 추가
+    로그 표시용 LogView 위젯 추가 (용량 고정 레코드 링 + 보이는 행만 그리는 모델/뷰)
+    model: 공유할 LogModel (옵션, 없으면 새로 생성)
     """
-    log_widget = QTextEdit()
-    log_widget.setReadOnly(True)
+    log_widget = LogView(model)
     self.add_dashboard_widget(log_widget, widget_id="log", title="로그")
     return log_widget
 
@@ -241,6 +292,9 @@ class DashboardWidget(QWidget):
             if list_widget:
               info['signals'] = [list_widget.item(i).text() for i in range(list_widget.count())]
           layout_info.append(info)
+        # 처리 그래프가 있으면 {"widgets": [...], "pipeline": {...}} 형식으로 저장
+        if self.pipeline is not None:
+          layout_info = {'widgets': layout_info, 'pipeline': self.pipeline.to_config()}
         with open(file_path, 'w', encoding='utf-8') as f:
           json.dump(layout_info, f, ensure_ascii=False, indent=2)
         QMessageBox.information(self, "저장 완료", f"레이아웃이 저장되었습니다:\n{file_path}")
@@ -256,6 +310,13 @@ class DashboardWidget(QWidget):
       try:
         with open(file_path, 'r', encoding='utf-8') as f:
           layout_info = json.load(f)
+        # 이전 형식(위젯 목록만 있는 리스트)도 지원
+        pipeline_config = None
+        if isinstance(layout_info, dict):
+          pipeline_config = layout_info.get('pipeline')
+          layout_info = layout_info.get('widgets', [])
+        if pipeline_config is not None and self.pipeline is not None:
+          self.pipeline.load_config(pipeline_config)
         # 기존 위젯 모두 삭제
         for w in self.widget_list:
           self.layout.removeWidget(w['widget'])
@@ -276,7 +337,7 @@ class DashboardWidget(QWidget):
             self.add_signal_list_widget(signals)
           elif t == 'QLabel':
             self.add_statistics_widget("통계 정보 없음")
-          elif t == 'QTextEdit':
+          elif t in ('LogView', 'QTextEdit'):
             self.add_log_widget()
         QMessageBox.information(self, "불러오기 완료", f"레이아웃을 불러왔습니다:\n{file_path}")
       except Exception as e:
@@ -411,7 +472,7 @@ class DashboardWidget(QWidget):
         self.add_dashboard_widget(plot, widget_id=f"plot{idx+1}", title="실시간 플롯")
       elif t == 'QLabel':
         self.add_statistics_widget("통계 정보 없음")
-      elif t == 'QTextEdit':
+      elif t in ('LogView', 'QTextEdit'):
         self.add_log_widget()
       elif t == 'QListWidget':
         signals = info.get('signals', ["채널 1"])
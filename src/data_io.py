@@ -1,71 +1,769 @@
 import numpy as np
 import h5py
+import json
 import os
+import datetime
+import itertools
+import multiprocessing
+import concurrent.futures
+from src.timebase import ChunkTimebase
+from src.scaling import ChannelScaling, scale_if_raw
+from src.recording import RecordingHandle
+
+# CSV 헤더에 타임베이스를 기록할 때 사용하는 접두어 (np.loadtxt는 '#' 줄을 주석으로 무시)
+CSV_TIMEBASE_PREFIX = "timebase "
+# CSV 헤더에 원시 코드 스케일링 계수를 기록할 때 사용하는 접두어
+CSV_SCALING_PREFIX = "scaling "
+# HDF5 기록 레이아웃 버전 (파일 루트 format_version 속성, 속성이 없는 파일은 버전 1: 단일 연속 data 데이터셋)
+# 버전 2: 샘플 축으로 확장 가능한 청크 data 데이터셋 + 선택적 압축(lzf/gzip, shuffle) + 채널/시간 원점 메타데이터
+HDF5_FORMAT_VERSION = 2
+HDF5_COMPRESSIONS = (None, "lzf", "gzip")
+# 청크당 샘플 수 (스트리밍 추가와 구간 읽기 모두에 적당한 크기)
+HDF5_CHUNK_SAMPLES = 4096
+# CSV 읽기/쓰기 블록 크기 (행 수)
+CSV_CHUNK_ROWS = 65536
+# 원시 바이너리(.bin) 형식: 리틀 엔디언 샘플 파일 + '<파일>.json' 사이드카 (dtype/채널/샘플레이트/스케일링/t0)
+RAW_EXTENSIONS = (".bin", ".raw")
+RAW_SIDECAR_SUFFIX = ".json"
+RAW_FORMAT_VERSION = 1
+RAW_LAYOUTS = ("interleaved", "planar")
+# 원시 바이너리 기록 버퍼 크기 (이 크기가 찰 때마다 한 번에 순차 기록)
+RAW_WRITE_BUFFER_BYTES = 4 * 1024 * 1024
+UNSUPPORTED_FORMAT_MESSAGE = "지원하지 않는 파일 포맷입니다. (csv, h5/hdf5, bin)"
 
 # CSV 파일로 데이터 저장
-def save_csv(file_path, data: np.ndarray):
+def save_csv(file_path, data: np.ndarray, timebase=None, scaling=None, chunk_rows=CSV_CHUNK_ROWS):
+  """
+  numpy 배열 데이터를 CSV 파일로 저장 (np.savetxt와 같은 형식, 블록 단위 벡터 포맷으로 스트리밍 기록)
+  timebase: ChunkTimebase (옵션, '# timebase {...}' 주석 헤더로 기록)
+  scaling: 원시 코드(정수) 데이터의 ChannelScaling (옵션, 정수로 저장하고 '# scaling {...}' 헤더로 기록)
+  """
+  try:
+    lines = []
+    if timebase is not None:
+      lines.append(CSV_TIMEBASE_PREFIX + json.dumps(timebase.to_dict()))
+    if scaling is not None:
+      lines.append(CSV_SCALING_PREFIX + json.dumps(scaling.to_dict()))
+    fmt = "%d" if np.issubdtype(data.dtype, np.integer) else "%.8f"
+    data = data.reshape(-1, 1) if data.ndim == 1 else data
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+      for line in lines:
+        f.write(f"# {line}\n")
+      _write_csv_rows(f, data, fmt, chunk_rows)
+  except Exception as e:
+    raise IOError(f"CSV 저장 오류: {e}")
+
+def write_csv_table(file_path, data: np.ndarray, columns=None, timestamps=None, fmt="%.8f",
+                    timestamp_fmt="%.6f", chunk_rows=CSV_CHUNK_ROWS):
   """
-  numpy 배열 데이터를 CSV 파일로 저장
+  행=샘플, 열=채널 형식 CSV 저장 (read_csv_table과 대칭)
+  data: (샘플 수, 채널 수) 또는 단일 채널 (샘플 수,)
+  columns: 첫 줄 열 이름 (옵션, timestamps가 있으면 맨 앞에 "time" 열 이름 추가)
+  timestamps: 샘플별 시각(epoch 초) 배열 (옵션, 첫 번째 열로 기록)
   """
+  data = data.reshape(-1, 1) if data.ndim == 1 else data
   try:
-    np.savetxt(file_path, data, delimiter=",", fmt="%.8f")
+    with open(file_path, "w", encoding="utf-8", newline="") as f:
+      if columns is not None:
+        names = (["time"] if timestamps is not None else []) + list(columns)
+        f.write(",".join(names) + "\n")
+      if timestamps is not None:
+        if len(timestamps) != data.shape[0]:
+          raise ValueError(f"타임스탬프 수({len(timestamps)})와 샘플 수({data.shape[0]})가 다릅니다.")
+        _write_csv_rows(f, data, fmt, chunk_rows, np.asarray(timestamps, dtype=np.float64), timestamp_fmt)
+      else:
+        _write_csv_rows(f, data, fmt, chunk_rows)
   except Exception as e:
     raise IOError(f"CSV 저장 오류: {e}")
 
+def _write_csv_rows(f, data, fmt, chunk_rows, first_col=None, first_fmt=None):
+  """
+  (행, 열) 배열을 chunk_rows 행 단위로 포맷해 기록
+  - 블록마다 행 템플릿을 반복한 포맷 문자열 하나로 한 번에 변환 (값마다 파이썬 호출 없음)
+  - 열이 매우 많은 행(채널당 한 행 형식)은 한 행을 열 구간으로 나눠 기록
+  """
+  n_rows, n_cols = data.shape
+  if n_cols > chunk_rows:
+    for row in data:
+      for c in range(0, n_cols, chunk_rows):
+        part = row[c:c + chunk_rows]
+        f.write(",".join([fmt] * len(part)) % tuple(part.tolist()))
+        f.write("," if c + chunk_rows < n_cols else "\n")
+    return
+  row_fmt = ",".join(([first_fmt] if first_col is not None else []) + [fmt] * n_cols) + "\n"
+  for r in range(0, n_rows, chunk_rows):
+    block = data[r:r + chunk_rows]
+    if first_col is not None:
+      block = np.column_stack([first_col[r:r + chunk_rows], block])
+    f.write((row_fmt * block.shape[0]) % tuple(block.ravel().tolist()))
+
 # CSV 파일에서 데이터 불러오기
-def load_csv(file_path) -> np.ndarray:
+def load_csv(file_path, scaled=True, dtype=np.float64, parallel=False, workers=None,
+             chunk_rows=CSV_CHUNK_ROWS) -> np.ndarray:
   """
-  CSV 파일에서 numpy 배열 데이터 불러오기
+  CSV 파일에서 numpy 배열 데이터 불러오기 (np.loadtxt와 같은 shape: 한 행 또는 한 열이면 1차원)
+  scaled: 원시 코드로 저장된 파일이면 전압으로 변환해 반환 (False면 int16 원시 코드)
+  dtype: np.float32 또는 np.float64 (원시 코드 파일은 int16으로 읽은 뒤 변환)
+  parallel: 큰 파일을 바이트 구간으로 나눠 작업 프로세스 풀에서 파싱
   """
   try:
-    return np.loadtxt(file_path, delimiter=",")
+    scaling = _read_csv_header(file_path).get(CSV_SCALING_PREFIX.strip())
+    table = read_csv_table(file_path, dtype=np.int16 if scaling is not None else dtype, parallel=parallel,
+                           workers=workers, chunk_rows=chunk_rows)
+    data = np.squeeze(table["data"]) if table["data"].size else table["data"].reshape(0)
+    if scaling is None:
+      return data
+    return ChannelScaling.from_dict(scaling).apply(data).astype(dtype, copy=False) if scaled else data
   except Exception as e:
     raise IOError(f"CSV 불러오기 오류: {e}")
 
+def iter_csv(file_path, chunk_rows=CSV_CHUNK_ROWS, dtype=np.float64, timestamp_col=None):
+  """
+  CSV를 chunk_rows 행 단위로 읽어 (타임스탬프 또는 None, (행, 열) 블록)를 차례로 반환 (전체를 메모리에 올리지 않음)
+  - '#' 주석 줄과 숫자가 아닌 첫 줄(열 이름)은 건너뜀
+  - timestamp_col: 시각 열 인덱스 또는 이름 (숫자(epoch 초) 또는 ISO 8601 문자열, 블록에서는 제외)
+  """
+  dtype = _check_csv_dtype(dtype)
+  layout = _csv_layout(file_path, timestamp_col)
+  with open(file_path, "r", encoding="utf-8") as f:
+    f.seek(layout["data_offset"])
+    while True:
+      lines = list(itertools.islice(f, chunk_rows))
+      if not lines:
+        break
+      yield _parse_csv_lines(lines, dtype, layout)
+
+def read_csv_table(file_path, dtype=np.float64, timestamp_col=None, parallel=False, workers=None,
+                   chunk_rows=CSV_CHUNK_ROWS):
+  """
+  행=샘플, 열=채널 형식 CSV 읽기
+  - 반환: {"columns": 열 이름 목록 또는 None, "timestamps": epoch 초 배열 또는 None, "data": (행, 열) 배열}
+  - parallel: 파일을 줄 경계에 맞춘 바이트 구간으로 나눠 workers개 프로세스에서 파싱 후 순서대로 결합
+  """
+  dtype = _check_csv_dtype(dtype)
+  layout = _csv_layout(file_path, timestamp_col)
+  if parallel:
+    parts = _parse_csv_parallel(file_path, dtype, layout, workers)
+  else:
+    parts = list(iter_csv(file_path, chunk_rows, dtype, timestamp_col))
+  n_cols = layout["n_cols"] - (layout["timestamp_col"] is not None)
+  data = np.concatenate([p[1] for p in parts]) if parts else np.empty((0, n_cols), dtype=dtype)
+  timestamps = None
+  if layout["timestamp_col"] is not None:
+    timestamps = np.concatenate([p[0] for p in parts]) if parts else np.empty(0)
+  columns = layout["columns"]
+  if columns is not None and layout["timestamp_col"] is not None:
+    columns = [c for i, c in enumerate(columns) if i != layout["timestamp_col"]]
+  return {"columns": columns, "timestamps": timestamps, "data": data}
+
+def _check_csv_dtype(dtype):
+  dtype = np.dtype(dtype)
+  if dtype not in (np.dtype(np.float32), np.dtype(np.float64), np.dtype(np.int16)):
+    raise ValueError(f"CSV 데이터 형식은 float32, float64 또는 int16이어야 합니다: {dtype}")
+  return dtype
+
+def _csv_layout(file_path, timestamp_col=None):
+  """
+  주석/열 이름 줄을 건너뛴 데이터 시작 위치(바이트), 열 수, 열 이름, 시각 열 인덱스
+  """
+  columns = None
+  with open(file_path, "rb") as f:
+    offset = 0
+    line = f.readline()
+    while line.startswith(b"#") or (line and not line.strip()):
+      offset = f.tell()
+      line = f.readline()
+    first = line.decode("utf-8").strip()
+    cells = [c.strip() for c in first.split(",")] if first else []
+    if cells and not all(_is_csv_value(c) for c in cells if c):
+      columns = cells
+      offset = f.tell()
+      second = f.readline().decode("utf-8").strip()
+      cells = second.split(",") if second else cells
+  if isinstance(timestamp_col, str):
+    if columns is None or timestamp_col not in columns:
+      raise ValueError(f"시각 열을 찾을 수 없습니다: {timestamp_col}")
+    timestamp_col = columns.index(timestamp_col)
+  return {"data_offset": offset, "n_cols": len(cells), "columns": columns, "timestamp_col": timestamp_col}
+
+def _is_csv_value(text):
+  try:
+    float(text)
+    return True
+  except ValueError:
+    return _parse_timestamps([text]) is not None
+
+def _parse_timestamps(values):
+  """
+  시각 문자열 배열 → epoch 초 (숫자면 그대로, ISO 8601이면 벡터 변환, 둘 다 아니면 None)
+  """
+  values = np.char.strip(np.asarray(values, dtype=str))
+  try:
+    return values.astype(np.float64)
+  except ValueError:
+    pass
+  try:
+    return (values.astype("datetime64[ns]") - np.datetime64(0, "ns")).astype(np.float64) / 1e9
+  except ValueError:
+    return None
+
+def _parse_csv_lines(lines, dtype, layout):
+  """
+  줄 목록 → (타임스탬프 또는 None, (행, 열) 블록), 파싱은 np.loadtxt C 파서로 블록 단위 처리
+  """
+  ts_col = layout["timestamp_col"]
+  if ts_col is None:
+    return None, np.loadtxt(lines, delimiter=",", dtype=dtype, ndmin=2)
+  usecols = [i for i in range(layout["n_cols"]) if i != ts_col]
+  try:
+    # 숫자(epoch 초) 시각 열은 C 파서로 데이터 열과 함께 한 번에 읽음
+    table = np.loadtxt(lines, delimiter=",", dtype=np.float64, ndmin=2)
+    return table[:, ts_col], table[:, usecols].astype(dtype)
+  except ValueError:
+    pass
+  # 문자열(ISO 8601) 시각 열은 열만 잘라 numpy datetime64로 한 번에 변환
+  lines = [line for line in lines if line.strip() and not line.startswith("#")]
+  timestamps = _parse_timestamps([line.split(",", ts_col + 1)[ts_col] for line in lines])
+  if timestamps is None:
+    raise ValueError("시각 열을 해석할 수 없습니다.")
+  return timestamps, np.loadtxt(lines, delimiter=",", dtype=dtype, ndmin=2, usecols=usecols)
+
+def _parse_csv_range(file_path, start, end, dtype, layout):
+  """
+  작업 프로세스: [start, end) 바이트 구간에서 시작하는 줄들을 파싱
+  """
+  with open(file_path, "rb") as f:
+    f.seek(start - 1 if start > 0 else 0)
+    if start > 0:
+      f.readline()  # 이전 구간에 속한 줄의 나머지 건너뜀
+    lines = []
+    while f.tell() < end:
+      line = f.readline()
+      if not line:
+        break
+      lines.append(line.decode("utf-8"))
+  if not lines:
+    return None
+  return _parse_csv_lines(lines, dtype, layout)
+
+def _parse_csv_parallel(file_path, dtype, layout, workers=None):
+  workers = workers or os.cpu_count() or 1
+  size = os.path.getsize(file_path)
+  start = layout["data_offset"]
+  bounds = np.linspace(start, size, workers + 1).astype(np.int64)
+  context = multiprocessing.get_context("spawn")
+  with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+    futures = [pool.submit(_parse_csv_range, file_path, int(lo), int(hi), dtype, layout)
+               for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+    return [part for part in (future.result() for future in futures) if part is not None]
+
+def _read_csv_header(file_path):
+  """
+  CSV 앞부분 '# 키 {json}' 주석 줄을 {키: dict}로 반환
+  """
+  header = {}
+  with open(file_path, "r", encoding="utf-8") as f:
+    for line in f:
+      if not line.startswith("#"):
+        break
+      key, _, value = line.lstrip("#").strip().partition(" ")
+      if value.startswith("{"):
+        header[key] = json.loads(value)
+  return header
+
+def _create_hdf5_data(f, shape, dtype, chunk_samples=HDF5_CHUNK_SAMPLES, compression=None, compression_opts=None,
+                      sample_rate=None, channel_names=None, channel_info=None, scaling=None):
+  """
+  버전 2 레이아웃의 data 데이터셋 생성 (마지막 축이 샘플 축, 샘플 축으로만 확장 가능)
+  - compression: None/"lzf"/"gzip" (압축 시 shuffle 필터 함께 적용, gzip 기본 레벨 4)
+  - channel_info: 채널별 메타데이터 dict 목록 (예: [{"name": "ch0", "unit": "V"}], channels 속성에 JSON으로 기록)
+  """
+  if compression not in HDF5_COMPRESSIONS:
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {compression} (lzf, gzip)")
+  if compression == "gzip" and compression_opts is None:
+    compression_opts = 4
+  channel_count = shape[0] if len(shape) == 2 else 1
+  f.attrs["format"] = "pydaq"
+  f.attrs["format_version"] = HDF5_FORMAT_VERSION
+  dset = f.create_dataset("data", shape=shape, maxshape=shape[:-1] + (None,), dtype=dtype,
+                          chunks=shape[:-1] + (max(1, min(chunk_samples, shape[-1] or chunk_samples)),),
+                          compression=compression, compression_opts=compression_opts,
+                          shuffle=compression is not None)
+  if scaling is not None:
+    dset.attrs["scaling"] = json.dumps(scaling.to_dict())
+  if sample_rate:
+    dset.attrs["sample_rate"] = float(sample_rate)
+    dset.attrs["dt"] = 1.0 / sample_rate
+  if channel_info is None:
+    names = channel_names or [f"ch{i}" for i in range(channel_count)]
+    channel_info = [{"name": name} for name in names]
+  elif len(channel_info) != channel_count:
+    raise ValueError(f"채널 메타데이터 수({len(channel_info)})와 채널 수({channel_count})가 다릅니다.")
+  dset.attrs["channel_names"] = json.dumps([info.get("name", f"ch{i}") for i, info in enumerate(channel_info)],
+                                           ensure_ascii=False)
+  dset.attrs["channels"] = json.dumps(list(channel_info), ensure_ascii=False)
+  return dset
+
 # HDF5 파일로 데이터 저장
-def save_hdf5(file_path, data: np.ndarray):
+def save_hdf5(file_path, data: np.ndarray, timebase=None, scaling=None, sample_rate=None, channel_names=None,
+              channel_info=None, compression=None, chunk_samples=HDF5_CHUNK_SAMPLES):
   """
-  numpy 배열 데이터를 HDF5 파일로 저장
+  numpy 배열 데이터를 HDF5 파일로 저장 (버전 2 레이아웃: 청크/확장 가능, 이후 append_hdf5로 이어 쓰기 가능)
+  timebase: ChunkTimebase (옵션, data 데이터셋 속성 t0/dt/start_sample/time_origin으로 기록)
+  scaling: 원시 코드(정수) 데이터의 ChannelScaling (옵션, 원시 코드 그대로 저장하고 scaling 속성으로 기록)
+  compression: None/"lzf"/"gzip" (옵션)
   """
   try:
     with h5py.File(file_path, "w") as f:
-      f.create_dataset("data", data=data)
+      if sample_rate is None and timebase is not None:
+        sample_rate = timebase.sample_rate
+      dset = _create_hdf5_data(f, data.shape, data.dtype, chunk_samples, compression, sample_rate=sample_rate,
+                               channel_names=channel_names, channel_info=channel_info, scaling=scaling)
+      dset[...] = data
+      if timebase is not None:
+        set_hdf5_timebase(dset, timebase)
   except Exception as e:
     raise IOError(f"HDF5 저장 오류: {e}")
 
+# 스트리밍 기록용 확장 가능한 HDF5 데이터셋 생성
+def create_hdf5_stream(file_path, channel_count, sample_rate=None, channel_names=None, chunk_samples=HDF5_CHUNK_SAMPLES,
+                       dtype=np.float64, scaling=None, compression=None, channel_info=None):
+  """
+  (채널 수, 0)에서 시작해 샘플 축으로 늘어나는 청크 단위 HDF5 데이터셋 생성 (버전 2 레이아웃)
+  - 반환: (h5py.File, data 데이터셋), 닫기는 호출자 담당
+  - 속성: sample_rate/dt, channel_names/channels (t0/start_sample은 첫 청크 기록 시 set_hdf5_timebase로 기록)
+  - scaling: 원시 코드(dtype=np.int16) 기록 시 ChannelScaling (scaling 속성으로 기록)
+  - compression: None/"lzf"/"gzip" (옵션, 청크 단위로 압축)
+  """
+  try:
+    f = h5py.File(file_path, "w")
+  except Exception as e:
+    raise IOError(f"HDF5 스트림 생성 오류: {e}")
+  try:
+    dset = _create_hdf5_data(f, (channel_count, 0), dtype, chunk_samples, compression, sample_rate=sample_rate,
+                             channel_names=channel_names, channel_info=channel_info, scaling=scaling)
+    return f, dset
+  except Exception as e:
+    f.close()
+    raise IOError(f"HDF5 스트림 생성 오류: {e}")
+
+def append_hdf5(dset, data: np.ndarray):
+  """
+  확장 가능한 data 데이터셋 끝에 (채널 수, N) 청크 추가 (1차원 데이터셋이면 (N,))
+  """
+  if data.ndim == 1 and dset.ndim == 2:
+    data = data.reshape(1, -1)
+  axis = dset.ndim - 1
+  n_old = dset.shape[axis]
+  dset.resize(n_old + data.shape[-1], axis=axis)
+  dset[..., n_old:] = data
+
+def set_hdf5_timebase(dset, timebase):
+  """
+  데이터셋 속성에 타임베이스(t0/dt/start_sample) 기록 (load_timebase와 호환)
+  """
+  dset.attrs["t0"] = timebase.t0
+  dset.attrs["dt"] = timebase.dt
+  dset.attrs["start_sample"] = timebase.start_sample
+  # 사람이 읽을 수 있는 시간 원점 (첫 샘플 시각, UTC ISO 8601)
+  dset.attrs["time_origin"] = datetime.datetime.fromtimestamp(timebase.start_time, datetime.timezone.utc).isoformat()
+
+def set_hdf5_markers(dset, markers):
+  """
+  마커 목록 [{"sample": 절대 샘플 인덱스, "label": 이름}, ...]을 JSON 속성으로 기록
+  """
+  dset.attrs["markers"] = json.dumps(list(markers), ensure_ascii=False)
+
+def load_hdf5_markers(file_path):
+  """
+  HDF5 파일에 기록된 마커 목록 반환 (없으면 빈 리스트)
+  """
+  try:
+    with h5py.File(file_path, "r") as f:
+      return json.loads(f["data"].attrs.get("markers", "[]"))
+  except Exception as e:
+    raise IOError(f"마커 불러오기 오류: {e}")
+
 # HDF5 파일에서 데이터 불러오기
-def load_hdf5(file_path) -> np.ndarray:
+def load_hdf5(file_path, scaled=True, start=None, stop=None) -> np.ndarray:
   """
-  HDF5 파일에서 numpy 배열 데이터 불러오기
+  HDF5 파일에서 numpy 배열 데이터 불러오기 (버전 1/2 레이아웃 모두 지원)
+  scaled: 원시 코드로 저장된 파일이면 전압으로 변환해 반환 (False면 원시 코드)
+  start/stop: 샘플 축 구간 (옵션, 해당 청크만 읽음)
   """
   try:
     with h5py.File(file_path, "r") as f:
-      return f["data"][:]
+      data = f["data"][..., start:stop]
+      scaling = f["data"].attrs.get("scaling")
+    return scale_if_raw(data, ChannelScaling.from_dict(json.loads(scaling))) if scaled and scaling else data
   except Exception as e:
     raise IOError(f"HDF5 불러오기 오류: {e}")
 
+def load_hdf5_info(file_path):
+  """
+  HDF5 기록 메타데이터 dict 반환 (format_version, shape, dtype, chunks, compression, sample_rate,
+  channel_names, channels, t0, start_sample, time_origin; 기록되지 않은 항목은 None)
+  """
+  try:
+    with h5py.File(file_path, "r") as f:
+      return _hdf5_info(f)
+  except Exception as e:
+    raise IOError(f"HDF5 정보 불러오기 오류: {e}")
+
+def _hdf5_info(f):
+  dset = f["data"]
+  attrs = dset.attrs
+  channel_count = dset.shape[0] if dset.ndim == 2 else 1
+  names = json.loads(attrs["channel_names"]) if "channel_names" in attrs else [f"ch{i}" for i in range(channel_count)]
+  channels = json.loads(attrs["channels"]) if "channels" in attrs else [{"name": name} for name in names]
+  return {
+    "format_version": int(f.attrs.get("format_version", 1)),
+    "shape": dset.shape,
+    "dtype": dset.dtype,
+    "chunks": dset.chunks,
+    "compression": dset.compression,
+    "sample_rate": float(attrs["sample_rate"]) if "sample_rate" in attrs else (
+      1.0 / float(attrs["dt"]) if "dt" in attrs else None),
+    "channel_names": names,
+    "channels": channels,
+    "t0": float(attrs["t0"]) if "t0" in attrs else None,
+    "start_sample": int(attrs.get("start_sample", 0)),
+    "time_origin": attrs.get("time_origin"),
+  }
+
+class RawWriter:
+  """
+  원시 바이너리 기록기: (채널 수, N) 청크를 샘플 단위로 인터리브해 버퍼에 모았다가 큰 순차 쓰기로 추가
+  - 파일: 리틀 엔디언, 샘플마다 채널 값이 연속 (interleaved), 샘플 수는 파일 크기로 결정되어 중단돼도 읽기 가능
+  - 사이드카 '<파일>.json': 생성 시 한 번, set_timebase()/close() 때 다시 기록
+  """
+  def __init__(self, file_path, channel_count, dtype=np.float64, sample_rate=None, channel_names=None, scaling=None,
+               buffer_bytes=RAW_WRITE_BUFFER_BYTES):
+    self.file_path = file_path
+    self.channel_count = channel_count
+    self.dtype = np.dtype(dtype).newbyteorder("<")
+    self.samples_written = 0
+    self.buffer_bytes = buffer_bytes
+    self.info = {
+      "format": "pydaq-raw",
+      "format_version": RAW_FORMAT_VERSION,
+      "dtype": self.dtype.str,
+      "layout": "interleaved",
+      "channel_count": channel_count,
+      "ndim": 2,
+      "sample_rate": float(sample_rate) if sample_rate else None,
+      "channel_names": list(channel_names or [f"ch{i}" for i in range(channel_count)]),
+      "scaling": scaling.to_dict() if scaling is not None else None,
+      "timebase": None,
+    }
+    self._pending = []
+    self._pending_bytes = 0
+    try:
+      self._file = open(file_path, "wb")
+      self._write_sidecar()
+    except Exception as e:
+      raise IOError(f"원시 바이너리 파일 생성 오류: {e}")
+
+  def append(self, data: np.ndarray):
+    """(채널 수, N) 또는 단일 채널 (N,) 청크 추가"""
+    if data.ndim == 1:
+      data = data.reshape(1, -1)
+    if data.shape[0] != self.channel_count:
+      raise ValueError(f"입력 데이터 shape는 ({self.channel_count}, N)이어야 합니다. 현재: {data.shape}")
+    # 전치 후 C 순서 복사 = 샘플 단위 인터리브
+    block = np.ascontiguousarray(data.T, dtype=self.dtype)
+    self._pending.append(block)
+    self._pending_bytes += block.nbytes
+    self.samples_written += data.shape[1]
+    if self._pending_bytes >= self.buffer_bytes:
+      self.flush()
+
+  def set_timebase(self, timebase):
+    self.info["timebase"] = timebase.to_dict()
+    if not self.info["sample_rate"]:
+      self.info["sample_rate"] = timebase.sample_rate
+    self._write_sidecar()
+
+  def flush(self):
+    if self._pending:
+      self._file.write(b"".join(block.data for block in self._pending) if len(self._pending) > 1
+                       else self._pending[0].data)
+      self._pending = []
+      self._pending_bytes = 0
+    self._file.flush()
+
+  def close(self):
+    if self._file.closed:
+      return
+    try:
+      self.flush()
+    finally:
+      self._file.close()
+      self._write_sidecar()
+
+  def _write_sidecar(self):
+    self.info["n_samples"] = self.samples_written
+    with open(raw_sidecar_path(self.file_path), "w", encoding="utf-8") as f:
+      json.dump(self.info, f, ensure_ascii=False, indent=2)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+def raw_sidecar_path(file_path):
+  return file_path + RAW_SIDECAR_SUFFIX
+
+# 원시 바이너리 파일로 데이터 저장
+def save_raw(file_path, data: np.ndarray, timebase=None, scaling=None, layout="interleaved", sample_rate=None,
+             channel_names=None):
+  """
+  numpy 배열을 리틀 엔디언 원시 바이너리 + JSON 사이드카로 저장
+  layout: "interleaved" (샘플마다 채널 값 연속, 이어 쓰기 가능) 또는 "planar" (채널마다 전체 샘플 연속)
+  """
+  if layout not in RAW_LAYOUTS:
+    raise ValueError(f"지원하지 않는 원시 바이너리 배치입니다: {layout} (interleaved, planar)")
+  data_2d = data.reshape(1, -1) if data.ndim == 1 else data
+  try:
+    with RawWriter(file_path, data_2d.shape[0], data.dtype, sample_rate, channel_names, scaling) as writer:
+      writer.info["ndim"] = data.ndim
+      if timebase is not None:
+        writer.info["timebase"] = timebase.to_dict()
+        writer.info["sample_rate"] = writer.info["sample_rate"] or timebase.sample_rate
+      if layout == "planar":
+        writer.info["layout"] = "planar"
+        writer._file.write(np.ascontiguousarray(data_2d, dtype=writer.dtype).data)
+        writer.samples_written = data_2d.shape[1]
+      else:
+        writer.append(data_2d)
+  except Exception as e:
+    raise IOError(f"원시 바이너리 저장 오류: {e}")
+
+def load_raw_info(file_path):
+  """
+  원시 바이너리 사이드카 dict 반환 (n_samples는 실제 파일 크기로 다시 계산)
+  """
+  try:
+    with open(raw_sidecar_path(file_path), "r", encoding="utf-8") as f:
+      info = json.load(f)
+    frame_bytes = np.dtype(info["dtype"]).itemsize * info["channel_count"]
+    if info["layout"] == "interleaved":
+      info["n_samples"] = os.path.getsize(file_path) // frame_bytes
+    return info
+  except Exception as e:
+    raise IOError(f"원시 바이너리 정보 불러오기 오류: {e}")
+
+# 원시 바이너리 파일 불러오기 (np.memmap, 복사 없음)
+def load_raw(file_path, scaled=False, mode="r") -> np.ndarray:
+  """
+  원시 바이너리 파일을 np.memmap 기반 (채널 수, 샘플 수) 뷰로 반환 (저장 시 1차원이면 (샘플 수,))
+  - interleaved는 (샘플 수, 채널 수) memmap의 전치 뷰, planar는 (채널 수, 샘플 수) memmap
+  - scaled: 원시 코드 파일이면 전압으로 변환한 ndarray 반환 (전체를 읽음, 기본값 False는 복사 없는 뷰)
+  """
+  info = load_raw_info(file_path)
+  try:
+    data = _raw_memmap(file_path, info, mode)
+    if scaled and info.get("scaling"):
+      return ChannelScaling.from_dict(info["scaling"]).apply(data)
+    return data
+  except Exception as e:
+    raise IOError(f"원시 바이너리 불러오기 오류: {e}")
+
+def _raw_memmap(file_path, info, mode="r"):
+  dtype = np.dtype(info["dtype"])
+  ch, n = info["channel_count"], info["n_samples"]
+  if n == 0:
+    data = np.empty((ch, 0), dtype=dtype)
+  elif info["layout"] == "interleaved":
+    data = np.memmap(file_path, dtype=dtype, mode=mode, shape=(n, ch)).T
+  else:
+    data = np.memmap(file_path, dtype=dtype, mode=mode, shape=(ch, n))
+  return data[0] if info.get("ndim", 2) == 1 else data
+
+def _raw_timebase(info):
+  if not info.get("timebase"):
+    return None
+  timebase = ChunkTimebase.from_dict(info["timebase"])
+  timebase.n_samples = info["n_samples"]
+  return timebase
+
+# 지연 로딩 기록 핸들 열기
+def open_recording(file_path, scaled=True) -> RecordingHandle:
+  """
+  파일을 통째로 읽지 않는 RecordingHandle 반환 (shape/dtype/metadata/timebase는 바로 조회, 구간은 요청 시 읽음)
+  - h5/hdf5: 파일을 열어 둔 채 h5py 데이터셋 슬라이싱 (handle.close() 또는 with 문으로 닫기)
+  - bin/raw: 사이드카 정보와 np.memmap 뷰 (구간 접근 시 복사 없음)
+  - csv: 텍스트 형식은 구간 읽기가 불가능하므로 전체를 읽어 감쌈
+  scaled: 원시 코드로 저장된 파일이면 읽은 구간을 전압으로 변환 (False면 원시 코드)
+  """
+  ext = os.path.splitext(file_path)[1].lower()
+  if ext in RAW_EXTENSIONS:
+    info = load_raw_info(file_path)
+    scaling = ChannelScaling.from_dict(info["scaling"]) if scaled and info.get("scaling") else None
+    return RecordingHandle(_raw_memmap(file_path, info), info, _raw_timebase(info), scaling, file_path=file_path)
+  if ext == ".csv":
+    data = load_csv(file_path, scaled)
+    return RecordingHandle(data, {"format_version": 1, "shape": data.shape, "dtype": data.dtype},
+                           load_timebase(file_path), file_path=file_path)
+  elif ext in [".h5", ".hdf5"]:
+    try:
+      f = h5py.File(file_path, "r")
+    except Exception as e:
+      raise IOError(f"HDF5 열기 오류: {e}")
+    try:
+      info = _hdf5_info(f)
+      attrs = f["data"].attrs
+      timebase = None
+      if info["t0"] is not None and "dt" in attrs:
+        timebase = ChunkTimebase(info["start_sample"], info["t0"], float(attrs["dt"]), n_samples=info["shape"][-1])
+      scaling = attrs.get("scaling")
+      scaling = ChannelScaling.from_dict(json.loads(scaling)) if scaled and scaling else None
+      return RecordingHandle(f["data"], info, timebase, scaling, closer=f.close, file_path=file_path)
+    except Exception as e:
+      f.close()
+      raise IOError(f"HDF5 열기 오류: {e}")
+  else:
+    raise ValueError(UNSUPPORTED_FORMAT_MESSAGE)
+
 # 파일 확장자 기반 포맷 자동 감지 및 저장
-def save_data(file_path, data: np.ndarray):
+def save_data(file_path, data: np.ndarray, timebase=None, scaling=None):
   """
-  파일 확장자에 따라 데이터 저장 (csv/h5)
+  파일 확장자에 따라 데이터 저장 (csv/h5/bin)
+  timebase: ChunkTimebase (옵션, 샘플 시각 복원용 t0/dt 기록)
+  scaling: 원시 코드 데이터의 ChannelScaling (옵션, 원시 코드와 변환 계수를 함께 저장)
   """
   ext = os.path.splitext(file_path)[1].lower()
   if ext == ".csv":
-    save_csv(file_path, data)
+    save_csv(file_path, data, timebase, scaling)
   elif ext in [".h5", ".hdf5"]:
-    save_hdf5(file_path, data)
+    save_hdf5(file_path, data, timebase, scaling)
+  elif ext in RAW_EXTENSIONS:
+    save_raw(file_path, data, timebase, scaling)
   else:
-    raise ValueError("지원하지 않는 파일 포맷입니다. (csv, h5/hdf5)")
+    raise ValueError(UNSUPPORTED_FORMAT_MESSAGE)
+
+# 블록 단위 데이터를 파일 확장자에 맞춰 한 블록씩 저장
+def save_data_blocks(file_path, blocks, shape, dtype=np.float64, timebase=None, scaling=None):
+  """
+  블록으로 나뉜 데이터를 이어붙이지 않고 한 블록씩 기록 (save_data와 같은 파일 형식)
+  blocks: (채널 수, N) 블록 이터레이터를 반환하는 함수 (다채널 CSV는 채널 행마다 다시 순회)
+  shape: 전체 데이터 shape, (채널 수, 샘플 수) 또는 단일 채널을 1차원으로 저장할 때 (샘플 수,)
+  """
+  ext = os.path.splitext(file_path)[1].lower()
+  dtype = np.dtype(dtype)
+  if ext == ".csv":
+    try:
+      fmt = "%d" if np.issubdtype(dtype, np.integer) else "%.8f"
+      with open(file_path, "w", encoding="utf-8", newline="") as f:
+        if timebase is not None:
+          f.write(f"# {CSV_TIMEBASE_PREFIX}{json.dumps(timebase.to_dict())}\n")
+        if scaling is not None:
+          f.write(f"# {CSV_SCALING_PREFIX}{json.dumps(scaling.to_dict())}\n")
+        if len(shape) == 1:
+          for block in blocks():
+            _write_csv_rows(f, block.reshape(-1, 1), fmt, CSV_CHUNK_ROWS)
+        else:
+          # 채널당 한 행: 채널마다 블록을 다시 순회하며 같은 행에 이어 씀
+          for ch in range(shape[0]):
+            sep = ""
+            for block in blocks():
+              for c in range(0, block.shape[1], CSV_CHUNK_ROWS):
+                part = block[ch, c:c + CSV_CHUNK_ROWS]
+                f.write(sep + ",".join([fmt] * len(part)) % tuple(part.tolist()))
+                sep = ","
+            f.write("\n")
+    except Exception as e:
+      raise IOError(f"CSV 저장 오류: {e}")
+  elif ext in [".h5", ".hdf5"]:
+    try:
+      with h5py.File(file_path, "w") as f:
+        sample_rate = timebase.sample_rate if timebase is not None else None
+        dset = _create_hdf5_data(f, tuple(shape), dtype, sample_rate=sample_rate, scaling=scaling)
+        offset = 0
+        for block in blocks():
+          n = block.shape[-1]
+          dset[..., offset:offset + n] = block[0] if dset.ndim == 1 else block
+          offset += n
+        if timebase is not None:
+          set_hdf5_timebase(dset, timebase)
+    except Exception as e:
+      raise IOError(f"HDF5 저장 오류: {e}")
+  elif ext in RAW_EXTENSIONS:
+    try:
+      channel_count = 1 if len(shape) == 1 else shape[0]
+      with RawWriter(file_path, channel_count, dtype, scaling=scaling) as writer:
+        writer.info["ndim"] = len(shape)
+        if timebase is not None:
+          writer.info["timebase"] = timebase.to_dict()
+          writer.info["sample_rate"] = timebase.sample_rate
+        for block in blocks():
+          writer.append(block)
+    except Exception as e:
+      raise IOError(f"원시 바이너리 저장 오류: {e}")
+  else:
+    raise ValueError(UNSUPPORTED_FORMAT_MESSAGE)
+
+# 저장된 파일의 원시 코드 스케일링 계수 불러오기
+def load_scaling(file_path):
+  """
+  원시 코드로 저장된 파일의 ChannelScaling 반환, 전압으로 저장된 파일이면 None
+  """
+  ext = os.path.splitext(file_path)[1].lower()
+  try:
+    if ext == ".csv":
+      info = _read_csv_header(file_path).get(CSV_SCALING_PREFIX.strip())
+      return ChannelScaling.from_dict(info) if info is not None else None
+    elif ext in [".h5", ".hdf5"]:
+      with h5py.File(file_path, "r") as f:
+        info = f["data"].attrs.get("scaling")
+      return ChannelScaling.from_dict(json.loads(info)) if info else None
+    elif ext in RAW_EXTENSIONS:
+      info = load_raw_info(file_path).get("scaling")
+      return ChannelScaling.from_dict(info) if info else None
+  except Exception as e:
+    raise IOError(f"스케일링 정보 불러오기 오류: {e}")
+  raise ValueError(UNSUPPORTED_FORMAT_MESSAGE)
 
 # 파일 확장자 기반 포맷 자동 감지 및 불러오기
-def load_data(file_path) -> np.ndarray:
+def load_data(file_path, scaled=True) -> np.ndarray:
   """
-  파일 확장자에 따라 데이터 불러오기 (csv/h5)
+  파일 확장자에 따라 데이터 불러오기 (csv/h5/bin)
+  scaled: 원시 코드로 저장된 파일이면 전압으로 변환해 반환 (False면 원시 코드)
+  bin: 스케일링이 없거나 scaled=False면 np.memmap 뷰 (복사 없음)
   """
   ext = os.path.splitext(file_path)[1].lower()
   if ext == ".csv":
-    return load_csv(file_path)
+    return load_csv(file_path, scaled)
   elif ext in [".h5", ".hdf5"]:
-    return load_hdf5(file_path)
+    return load_hdf5(file_path, scaled)
+  elif ext in RAW_EXTENSIONS:
+    return load_raw(file_path, scaled)
   else:
-    raise ValueError("지원하지 않는 파일 포맷입니다. (csv, h5/hdf5)") 
\ No newline at end of file
+    raise ValueError(UNSUPPORTED_FORMAT_MESSAGE) 
+
+# 저장된 파일의 타임베이스 불러오기
+def load_timebase(file_path):
+  """
+  파일에 기록된 타임베이스(ChunkTimebase) 반환, 기록이 없으면 None
+  """
+  ext = os.path.splitext(file_path)[1].lower()
+  try:
+    if ext == ".csv":
+      with open(file_path, "r", encoding="utf-8") as f:
+        first = f.readline().lstrip("#").strip()
+      if not first.startswith(CSV_TIMEBASE_PREFIX.strip()):
+        return None
+      return ChunkTimebase.from_dict(json.loads(first[len(CSV_TIMEBASE_PREFIX):]))
+    elif ext in [".h5", ".hdf5"]:
+      with h5py.File(file_path, "r") as f:
+        attrs = f["data"].attrs
+        if "dt" not in attrs or "t0" not in attrs:
+          return None
+        return ChunkTimebase(int(attrs.get("start_sample", 0)), float(attrs["t0"]), float(attrs["dt"]),
+                             n_samples=f["data"].shape[-1])
+    elif ext in RAW_EXTENSIONS:
+      return _raw_timebase(load_raw_info(file_path))
+  except Exception as e:
+    raise IOError(f"타임베이스 불러오기 오류: {e}")
+  raise ValueError(UNSUPPORTED_FORMAT_MESSAGE)
@@ -0,0 +1,293 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QListView, QComboBox, QLabel
+from PySide6.QtCore import Qt, QAbstractListModel, QSortFilterProxyModel, QModelIndex
+from PySide6.QtGui import QColor
+import logging
+import logging.handlers
+import queue
+import time
+import re
+
+# 로그 레벨 (값이 클수록 중요)
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+LEVEL_COLORS = {"DEBUG": "#7f8c8d", "WARN": "#e67e22", "ERROR": "#e74c3c"}
+# "[WARN] 메시지" 형식 접두어 → (레벨, 출처)
+PREFIX_PATTERN = re.compile(r"^\[(\w+)\]\s*")
+PREFIX_SOURCES = {"MARK": "mark", "STATS": "stats"}
+
+class LogRecord:
+  """
+  구조화된 로그 레코드 (반복 접힘 시 count/last_time 갱신)
+  - detail: 반복마다 바뀌는 부가 정보 (접힌 레코드는 마지막 값만 보관)
+  """
+  __slots__ = ("time", "level", "source", "message", "detail", "count", "last_time")
+
+  def __init__(self, level, source, message, detail=None, timestamp=None):
+    self.time = time.time() if timestamp is None else timestamp
+    self.level = level
+    self.source = source
+    self.message = message
+    self.detail = detail
+    self.count = 1
+    self.last_time = self.time
+
+  def text(self):
+    line = f"{time.strftime('%H:%M:%S', time.localtime(self.last_time))} [{self.level}] {self.source}: {self.message}"
+    if self.count > 1:
+      line += f" ×{self.count}"
+    if self.detail:
+      line += f" ({self.detail})"
+    return line
+
+class RecordRing:
+  """
+  고정 용량 링 버퍼 (추가/가장 오래된 항목 제거/인덱스 접근 모두 O(1))
+  - 인덱스 0이 가장 오래된 항목, -1이 가장 최근 항목
+  """
+  def __init__(self, capacity):
+    if capacity < 1:
+      raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity}")
+    self.capacity = capacity
+    self._items = [None] * capacity
+    self._head = 0      # 가장 오래된 항목 위치
+    self._size = 0
+
+  def __len__(self):
+    return self._size
+
+  def __getitem__(self, i):
+    if i < 0:
+      i += self._size
+    if not 0 <= i < self._size:
+      raise IndexError("RecordRing index out of range")
+    return self._items[(self._head + i) % self.capacity]
+
+  def __iter__(self):
+    for i in range(self._size):
+      yield self._items[(self._head + i) % self.capacity]
+
+  def append(self, item):
+    """항목 추가 (가득 차 있으면 가장 오래된 항목을 덮어씀)"""
+    self._items[(self._head + self._size) % self.capacity] = item
+    if self._size < self.capacity:
+      self._size += 1
+    else:
+      self._head = (self._head + 1) % self.capacity
+
+  def popleft(self):
+    """가장 오래된 항목 제거 후 반환"""
+    if not self._size:
+      raise IndexError("pop from an empty RecordRing")
+    item, self._items[self._head] = self._items[self._head], None
+    self._head = (self._head + 1) % self.capacity
+    self._size -= 1
+    return item
+
+  def clear(self):
+    self._items = [None] * self.capacity
+    self._head = self._size = 0
+
+class LogModel(QAbstractListModel):
+  """
+  용량이 고정된 로그 레코드 링 (세션 길이와 무관하게 메모리/추가 비용 일정)
+  - capacity를 넘으면 가장 오래된 레코드부터 제거 (RecordRing, 제거/추가 모두 O(1))
+  - 직전 레코드와 레벨/출처/메시지가 같고 fold_window(초) 안이면 새 행 대신 반복 횟수만 증가 ("데이터 수집 ×1200")
+  - enable_spill(): 레코드를 별도 스레드에서 회전 로그 파일로 기록 (GUI 스레드는 큐에 넣기만 함)
+  """
+  def __init__(self, capacity=5000, fold_window=5.0, parent=None):
+    super().__init__(parent)
+    self.capacity = capacity
+    self.fold_window = fold_window
+    self.records = RecordRing(capacity)   # 오래된 순 (앞에서 제거)
+    self.sources = []   # 지금까지 나온 출처 (필터 목록용)
+    self.dropped = 0    # 용량 초과로 제거된 레코드 수
+    self._spill_logger = None
+    self._spill_listener = None
+
+  def rowCount(self, parent=QModelIndex()):
+    return 0 if parent.isValid() else len(self.records)
+
+  def data(self, index, role=Qt.DisplayRole):
+    if not index.isValid() or index.row() >= len(self.records):
+      return None
+    record = self.records[index.row()]
+    if role == Qt.DisplayRole:
+      return record.text()
+    if role == Qt.ForegroundRole and record.level in LEVEL_COLORS:
+      return QColor(LEVEL_COLORS[record.level])
+    if role == Qt.UserRole:
+      return record
+    return None
+
+  def log(self, level, message, source="app", detail=None, timestamp=None):
+    """
+    레코드 추가 (반복이면 직전 레코드에 접음)
+    """
+    if level not in LOG_LEVELS:
+      raise ValueError(f"알 수 없는 로그 레벨입니다: {level}")
+    now = time.time() if timestamp is None else timestamp
+    last = self.records[-1] if self.records else None
+    if (last is not None and last.level == level and last.source == source and last.message == message
+        and now - last.last_time <= self.fold_window):
+      last.count += 1
+      last.last_time = now
+      last.detail = detail
+      row = self.index(len(self.records) - 1)
+      self.dataChanged.emit(row, row)
+      return last
+    if last is not None and last.count > 1:
+      self._spill_write(last, folded=True)
+    if source not in self.sources:
+      self.sources.append(source)
+    if len(self.records) >= self.capacity:
+      self.beginRemoveRows(QModelIndex(), 0, 0)
+      self.records.popleft()
+      self.dropped += 1
+      self.endRemoveRows()
+    record = LogRecord(level, source, message, detail, now)
+    self.beginInsertRows(QModelIndex(), len(self.records), len(self.records))
+    self.records.append(record)
+    self.endInsertRows()
+    self._spill_write(record)
+    return record
+
+  def append(self, text):
+    """
+    기존 QTextEdit 로그와 같은 문자열 입력 ("[WARN] 메시지" 접두어를 레벨/출처로 변환)
+    """
+    for line in text.splitlines():
+      level, source = "INFO", "app"
+      match = PREFIX_PATTERN.match(line)
+      if match:
+        tag = match.group(1).upper()
+        if tag in LOG_LEVELS:
+          level = tag
+        elif tag in PREFIX_SOURCES:
+          source = PREFIX_SOURCES[tag]
+        line = line[match.end():]
+      self.log(level, line, source)
+
+  def clear(self):
+    self.beginResetModel()
+    self.records.clear()
+    self.endResetModel()
+
+  def enable_spill(self, file_path, max_bytes=5 * 1024 * 1024, backup_count=3):
+    """
+    회전 로그 파일 기록 시작 (쓰기는 QueueListener 스레드에서 수행)
+    """
+    self.disable_spill()
+    try:
+      handler = logging.handlers.RotatingFileHandler(file_path, maxBytes=max_bytes, backupCount=backup_count,
+                                                     encoding="utf-8")
+    except Exception as e:
+      raise IOError(f"로그 파일 열기 오류: {e}")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.Queue(-1)
+    logger = logging.Logger(f"daq.log.{id(self)}")
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    self._spill_listener = logging.handlers.QueueListener(log_queue, handler)
+    self._spill_listener.start()
+    self._spill_logger = logger
+
+  def disable_spill(self):
+    """회전 로그 파일 기록 종료 (남은 레코드를 모두 쓴 뒤 파일을 닫음)"""
+    if self._spill_listener is not None:
+      self._spill_listener.stop()
+      for handler in self._spill_listener.handlers:
+        handler.close()
+    self._spill_listener = None
+    self._spill_logger = None
+
+  def _spill_write(self, record, folded=False):
+    if self._spill_logger is None:
+      return
+    if folded:
+      self._spill_logger.info(f"{record.text()} (이전 메시지 {record.count}회 반복)")
+    else:
+      self._spill_logger.info(record.text())
+
+class LogFilterProxy(QSortFilterProxyModel):
+  """
+  최소 레벨/출처 필터 (source=None이면 모든 출처)
+  """
+  def __init__(self, parent=None):
+    super().__init__(parent)
+    self.min_level = "DEBUG"
+    self.source = None
+
+  def set_filter(self, min_level=None, source=None):
+    # Qt 6.9 이상은 beginFilterChange/endFilterChange 사용 (invalidateFilter는 deprecated)
+    if hasattr(self, "beginFilterChange"):
+      self.beginFilterChange()
+    self.min_level = min_level or "DEBUG"
+    self.source = source
+    if hasattr(self, "endFilterChange"):
+      self.endFilterChange()
+    else:
+      self.invalidateFilter()
+
+  def filterAcceptsRow(self, source_row, source_parent):
+    record = self.sourceModel().records[source_row]
+    if LOG_LEVELS[record.level] < LOG_LEVELS[self.min_level]:
+      return False
+    return self.source is None or record.source == self.source
+
+class LogView(QWidget):
+  """
+  대시보드 로그 위젯 (모델/뷰, 보이는 행만 그림)
+  - 레벨/출처 콤보박스로 필터링
+  - 맨 아래를 보고 있으면 새 레코드에 맞춰 자동 스크롤
+  - append(text)/log(...)는 LogModel로 전달 (기존 QTextEdit 로그 호출과 호환)
+  """
+  def __init__(self, model=None, parent=None):
+    super().__init__(parent)
+    self.model = model or LogModel(parent=self)
+    self.proxy = LogFilterProxy(self)
+    self.proxy.setSourceModel(self.model)
+    self.view = QListView()
+    self.view.setModel(self.proxy)
+    self.view.setUniformItemSizes(True)
+    self.view.setEditTriggers(QListView.NoEditTriggers)
+    self.level_combo = QComboBox()
+    self.level_combo.addItems(list(LOG_LEVELS))
+    self.source_combo = QComboBox()
+    self.source_combo.addItem("전체")
+
+    filter_layout = QHBoxLayout()
+    filter_layout.setContentsMargins(0, 0, 0, 0)
+    filter_layout.addWidget(QLabel("레벨:"))
+    filter_layout.addWidget(self.level_combo)
+    filter_layout.addWidget(QLabel("출처:"))
+    filter_layout.addWidget(self.source_combo)
+    filter_layout.addStretch()
+    layout = QVBoxLayout()
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.addLayout(filter_layout)
+    layout.addWidget(self.view)
+    self.setLayout(layout)
+
+    self.level_combo.currentTextChanged.connect(self._apply_filter)
+    self.source_combo.currentTextChanged.connect(self._apply_filter)
+    self.model.rowsAboutToBeInserted.connect(self._remember_scroll)
+    self.model.rowsInserted.connect(self._on_rows_inserted)
+    self._follow = True
+
+  def log(self, level, message, source="app", detail=None):
+    return self.model.log(level, message, source, detail)
+
+  def append(self, text):
+    self.model.append(text)
+
+  def _apply_filter(self, *_):
+    source = self.source_combo.currentText()
+    self.proxy.set_filter(self.level_combo.currentText(), None if source == "전체" else source)
+
+  def _remember_scroll(self, *_):
+    bar = self.view.verticalScrollBar()
+    self._follow = bar.value() >= bar.maximum()
+
+  def _on_rows_inserted(self, *_):
+    if self.source_combo.count() - 1 < len(self.model.sources):
+      self.source_combo.addItems(self.model.sources[self.source_combo.count() - 1:])
+    if self._follow:
+      self.view.scrollToBottom()
@@ -12,6 +12,7 @@ class OfflinePlayer(QWidget):
     super().__init__(parent)
     self.setFixedHeight(60)
     self.data = None  # 전체 데이터 (numpy 배열)
+    self.timebase = None  # 데이터 첫 샘플의 ChunkTimebase (옵션)
     self.current_frame = 0
     self.playing = False
     self.playback_speed = 1  # 1x, 2x, 4x 등
@@ -43,11 +44,13 @@ class OfflinePlayer(QWidget):
     self.speed_combo.currentIndexChanged.connect(self.change_speed)
     self.slider.valueChanged.connect(self.seek)
 
-  def set_data(self, data: np.ndarray):
+  def set_data(self, data: np.ndarray, timebase=None):
     """
-    재생할 데이터 설정
+    재생할 데이터 설정 (ndarray 또는 RecordingHandle, 핸들은 재생 중인 프레임만 파일에서 읽음)
+    timebase: ChunkTimebase (옵션, 프레임 시각을 샘플 인덱스로 계산)
     """
     self.data = data
+    self.timebase = timebase
     self.current_frame = 0
     self.slider.setMaximum(data.shape[-1] - 1)
     self.slider.setValue(0)
@@ -115,9 +118,22 @@ class OfflinePlayer(QWidget):
       frame_data = self.data[..., self.current_frame]
       self.frame_changed.emit(self.current_frame, frame_data)
 
+  def frame_time(self, frame_idx=None):
+    """
+    프레임의 시각(수집 시작 기준 초) 반환, 타임베이스가 없으면 None
+    """
+    if self.timebase is None:
+      return None
+    if frame_idx is None:
+      frame_idx = self.current_frame
+    return (self.timebase.start_sample + frame_idx) * self.timebase.dt
+
   def _update_position_label(self):
     if self.data is not None:
       total = self.data.shape[-1]
-      self.position_label.setText(f"{self.current_frame+1} / {total}")
+      text = f"{self.current_frame+1} / {total}"
+      if self.timebase is not None:
+        text += f" ({self.frame_time():.3f}s)"
+      self.position_label.setText(text)
     else:
       self.position_label.setText("0 / 0") 
\ No newline at end of file
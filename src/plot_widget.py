@@ -1,19 +1,80 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QTransform
+from src.render_scheduler import RenderScheduler
+from src.signal_pipeline import WindowedStats
+from src.recording import RecordingHandle
 import pyqtgraph as pg
 import numpy as np
 
+class MinMaxEnvelope:
+  """
+  절대 샘플 인덱스 기준 bin_size 샘플 단위 채널별 최소/최대 캐시 (LOD 렌더링용)
+  - 새로 추가된 구간이 걸친 bin만 벡터 연산으로 다시 계산
+  - bin은 버퍼 위치가 아닌 절대 인덱스로 나뉘므로 원형 버퍼가 감겨도 경계가 섞이지 않음
+  """
+  def __init__(self, channel_count, buffer_size, bin_size):
+    self.bin_size = bin_size
+    self.n_bins = buffer_size // bin_size + 2  # 버퍼가 걸칠 수 있는 최대 bin 수
+    self.mins = np.zeros((channel_count, self.n_bins))
+    self.maxs = np.zeros((channel_count, self.n_bins))
+
+  def update(self, data, start):
+    """
+    절대 인덱스 start부터의 연속 데이터 (채널 수, N)로 걸친 bin 갱신
+    - data 앞쪽은 첫 bin 시작부터(또는 버퍼에 남은 가장 오래된 샘플부터) 포함해야 함
+    """
+    b = self.bin_size
+    first_bin = start // b
+    n_bins = -(-(start + data.shape[1]) // b) - first_bin
+    # bin 경계에 맞춰 가장자리 값을 반복 (최소/최대에 영향 없음)
+    padded = np.pad(data, ((0, 0), (start - first_bin * b, (first_bin + n_bins) * b - start - data.shape[1])), mode="edge")
+    blocks = padded.reshape(data.shape[0], n_bins, b)
+    index = np.arange(first_bin, first_bin + n_bins) % self.n_bins
+    self.mins[:, index] = blocks.min(axis=2)
+    self.maxs[:, index] = blocks.max(axis=2)
+
+  def query(self, first_bin, last_bin):
+    """
+    [first_bin, last_bin) bin의 (최소, 최대) 배열 (채널 수, bin 수)
+    """
+    index = np.arange(first_bin, last_bin) % self.n_bins
+    return self.mins[:, index], self.maxs[:, index]
+
 class RealtimePlotWidget(QWidget):
   """
   오실로스코프 스타일 실시간 플로팅 위젯
   - 검은 배경, 노란/흰색 파형, 두꺼운 그리드, 범례, 통계, 텍스트 주석 지원
+  - 데이터 버퍼는 쓰기 위치(head)를 갖는 원형 버퍼 (추가 비용은 청크 크기에 비례, 전체 버퍼 이동 없음)
+  - 표시 모드: scroll(오래된 → 최신 순으로 정렬해 그림), sweep(버퍼 위치 그대로 덮어쓰며 그림, 재정렬 없음)
+  - LOD(scroll 모드): 보이는 구간의 샘플이 화면 픽셀보다 많으면 픽셀당 최소/최대 포락선만 그림
+    (bin 단위 최소/최대는 추가된 구간만 갱신해 캐시, 확대해서 샘플이 픽셀보다 적어지면 원본 샘플을 그림)
+  - 다시 그리기는 공유 RenderScheduler가 담당: 데이터/보기 범위가 바뀐 위젯만, 화면에 보일 때만 그림
   """
-  def __init__(self, channel_count=1, buffer_size=10000, parent=None):
+  DISPLAY_MODES = ("scroll", "sweep")
+  DEFAULT_LOD_WIDTH = 1000  # 위젯 크기를 알 수 없을 때(숨김 등) 가정하는 픽셀 폭
+
+  def __init__(self, channel_count=1, buffer_size=10000, display_mode="scroll", lod=True, lod_bin_size=None,
+               scheduler=None, parent=None):
     super().__init__(parent)
     self.channel_count = channel_count
     self.buffer_size = buffer_size
     self.data_buffer = np.zeros((channel_count, buffer_size))
-    self.ptr = 0
+    self.ptr = 0    # 버퍼에 들어 있는 유효 샘플 수 (최대 buffer_size)
+    self.head = 0   # 다음 샘플을 쓸 버퍼 위치
+    self.total_samples = 0  # clear() 이후 추가된 전체 샘플 수 (가장 최신 샘플 다음의 절대 인덱스)
+    self.lod = lod
+    self.envelope = MinMaxEnvelope(channel_count, buffer_size, lod_bin_size or max(buffer_size // 2048, 1))
+    # 버퍼 구간 통계 (청크 추가 시 누적, 프레임마다 버퍼를 다시 훑지 않음)
+    self.window_stats = WindowedStats(channel_count, buffer_size)
+    self.display_mode = None
+    self.dirty = False
+    self._rendering = False
+    self.scheduler = None
+    self.set_display_mode(display_mode)
+    # 샘플 인덱스 기반 타임베이스 (지정 시 x축을 수집 시작 기준 초 단위로 표시)
+    self.timebase = None
+    self.end_sample = 0  # 버퍼 마지막 샘플 다음의 절대 샘플 인덱스
 
     # pyqtgraph PlotWidget 생성 및 레이아웃 배치
     self.plot_widget = pg.PlotWidget()
@@ -44,16 +105,25 @@ class RealtimePlotWidget(QWidget):
     layout = QVBoxLayout()
     layout.addWidget(self.plot_widget)
     self.setLayout(layout)
-    # 60 FPS 타이머로 주기적 업데이트
-    self.timer = QTimer()
-    self.timer.timeout.connect(self.update_plot)
-    self.timer.start(int(1000/60))
+    # 공유 프레임 클럭 (기본 60 FPS, 부하에 따라 자동으로 낮아짐)
+    self.scheduler = scheduler or RenderScheduler.shared()
+    self.scheduler.register(self)
+    # 확대/이동으로 보이는 구간이 바뀌면 LOD를 다시 계산
+    self.plot_widget.getViewBox().sigRangeChanged.connect(self._on_range_changed)
 
-  def append_data(self, data: np.ndarray):
+  def append_data(self, data: np.ndarray, timebase=None):
     """
     새로운 데이터를 버퍼에 추가
-    data: (채널 수, 샘플 수) 형태의 numpy 배열
+    data: (채널 수, 샘플 수) 형태의 numpy 배열 또는 RecordingHandle (버퍼/통계에 남을 마지막 구간만 읽음)
+    timebase: 청크의 ChunkTimebase (옵션, 샘플별 시간 배열 없이 x축 시간 계산)
     """
+    n_samples = None
+    if isinstance(data, RecordingHandle):
+      # 기록 핸들의 1차원 데이터는 단일 채널 샘플 축
+      n_samples = data.n_samples
+      data = data[..., -max(self.buffer_size, self.window_stats.window):]
+      if data.ndim == 1 and self.channel_count == 1:
+        data = data.reshape(1, -1)
     if not isinstance(data, np.ndarray):
       raise ValueError("입력 데이터는 numpy.ndarray여야 합니다.")
     if data.ndim == 1:
@@ -62,29 +132,199 @@ class RealtimePlotWidget(QWidget):
       data = data.reshape((self.channel_count, -1))
     if data.ndim != 2 or data.shape[0] != self.channel_count:
       raise ValueError(f"입력 데이터 shape는 ({self.channel_count}, N)이어야 합니다. 현재: {data.shape}")
-    n_samples = data.shape[1]
-    if self.ptr + n_samples > self.buffer_size:
-      overflow = self.ptr + n_samples - self.buffer_size
-      self.data_buffer = np.roll(self.data_buffer, -overflow, axis=1)
-      self.ptr = self.buffer_size - n_samples
-    self.data_buffer[:, self.ptr:self.ptr+n_samples] = data
-    self.ptr += n_samples
+    if n_samples is None:
+      n_samples = data.shape[1]
+    if n_samples >= self.buffer_size:
+      # 버퍼보다 큰 청크는 마지막 buffer_size 샘플만 순서대로 보관
+      self.data_buffer[:] = data[:, -self.buffer_size:]
+      self.head = 0
+    else:
+      first = min(n_samples, self.buffer_size - self.head)
+      self.data_buffer[:, self.head:self.head + first] = data[:, :first]
+      self.data_buffer[:, :n_samples - first] = data[:, first:]
+      self.head = (self.head + n_samples) % self.buffer_size
+    self.ptr = min(self.ptr + n_samples, self.buffer_size)
+    self.total_samples += n_samples
+    self.window_stats.update(data)
+    if self.lod:
+      self._update_envelope(n_samples)
+    if timebase is not None:
+      self.timebase = timebase
+      self.end_sample = timebase.start_sample + n_samples * timebase.step
+    else:
+      self.end_sample += n_samples
+    self.mark_dirty()
+
+  def mark_dirty(self):
+    """
+    다음 프레임에 다시 그리도록 표시 (스케줄러 타이머가 멈춰 있으면 예약)
+    """
+    self.dirty = True
+    if self.scheduler is not None:
+      self.scheduler.request_frame(self)
+
+  def is_render_visible(self):
+    """
+    실제로 화면에 보이는지 여부 (숨김/접힘/스크롤로 가려진 위젯은 그리지 않음)
+    """
+    return self.isVisible() and not self.visibleRegion().isEmpty()
+
+  def showEvent(self, event):
+    super().showEvent(event)
+    # 숨겨져 있는 동안 보류된 변경 사항 반영
+    if self.dirty:
+      self.mark_dirty()
+
+  def _on_range_changed(self, *args):
+    # 자동 범위일 때는 항상 전체 구간을 그리므로, 사용자가 확대/이동한 경우만 다시 그림
+    if not self._rendering and not self.plot_widget.getViewBox().autoRangeEnabled()[0]:
+      self.mark_dirty()
+
+  def set_display_mode(self, mode):
+    """
+    표시 모드 변경 (scroll/sweep)
+    """
+    if mode not in self.DISPLAY_MODES:
+      raise ValueError(f"지원하지 않는 표시 모드입니다: {mode} (지원: {', '.join(self.DISPLAY_MODES)})")
+    self.display_mode = mode
+    self.mark_dirty()
+
+  @property
+  def wrapped(self):
+    """버퍼가 한 바퀴 이상 채워져 최신 데이터가 버퍼 앞쪽으로 넘어갔는지 여부"""
+    return self.ptr == self.buffer_size and self.head != 0
+
+  def ordered_data(self):
+    """
+    오래된 → 최신 순서의 (채널 수, ptr) 배열 (감싸지지 않았으면 복사 없는 뷰, 감싸졌으면 렌더링 시에만 이어붙임)
+    """
+    if not self.wrapped:
+      return self.data_buffer[:, :self.ptr]
+    return np.concatenate([self.data_buffer[:, self.head:], self.data_buffer[:, :self.head]], axis=1)
+
+  def _logical_slice(self, i0, i1):
+    """
+    오래된 샘플부터 센 인덱스 [i0, i1) 구간 (감싸진 경계를 넘을 때만 복사)
+    """
+    start = self.head if self.wrapped else 0
+    p0 = (start + i0) % self.buffer_size
+    if p0 + (i1 - i0) <= self.buffer_size:
+      return self.data_buffer[:, p0:p0 + i1 - i0]
+    return np.concatenate([self.data_buffer[:, p0:], self.data_buffer[:, :p0 + i1 - i0 - self.buffer_size]], axis=1)
+
+  def _update_envelope(self, n_samples):
+    # 새 구간이 걸친 첫 bin의 시작부터 (버퍼에 남아 있는 범위에서) 다시 계산
+    oldest = self.total_samples - self.ptr
+    start = max(self.total_samples - n_samples, oldest)
+    start = max(start - start % self.envelope.bin_size, oldest)
+    self.envelope.update(self._logical_slice(start - oldest, self.ptr), start)
+
+  def visible_range(self):
+    """
+    화면에 보이는 구간의 (시작, 끝) 인덱스 (오래된 샘플부터 센 인덱스, 자동 범위면 전체)
+    """
+    vb = self.plot_widget.getViewBox()
+    if self.display_mode == "sweep" or vb.autoRangeEnabled()[0]:
+      return 0, self.ptr
+    x0, x1 = vb.viewRange()[0]
+    if self.timebase is not None:
+      offset = self.end_sample - self.ptr
+      x0, x1 = x0 / self.timebase.dt - offset, x1 / self.timebase.dt - offset
+    i0 = min(max(int(np.floor(x0)), 0), self.ptr)
+    i1 = min(max(int(np.ceil(x1)) + 1, i0), self.ptr)
+    return i0, i1
+
+  def lod_data(self, i0, i1, width):
+    """
+    [i0, i1) 구간을 width 픽셀에 그릴 (x, y) 반환
+    - x: 오래된 샘플부터 센 인덱스, y: (채널 수, 점 수)
+    - 샘플 수가 픽셀의 2배 이하면 원본 샘플, 아니면 픽셀당 (최소, 최대) 두 점
+    """
+    n = i1 - i0
+    if not self.lod or n <= 2 * width:
+      return np.arange(i0, i1), self._logical_slice(i0, i1)
+    per_pixel = n // width
+    b = self.envelope.bin_size
+    if per_pixel < 2 * b:
+      # 캐시 bin보다 조금 넓은 구간: 보이는 원본을 직접 픽셀 단위로 축소
+      groups = -(-n // per_pixel)
+      data = self._logical_slice(i0, i1)
+      data = np.pad(data, ((0, 0), (0, groups * per_pixel - n)), mode="edge").reshape(self.channel_count, groups, per_pixel)
+      mins, maxs = data.min(axis=2), data.max(axis=2)
+      starts = i0 + np.arange(groups) * per_pixel
+      span = per_pixel
+    else:
+      # 캐시된 bin을 픽셀당 k개씩 묶어 축소 (점 수가 픽셀 수의 2배를 넘지 않도록 올림)
+      k = -(-per_pixel // b)
+      oldest = self.total_samples - self.ptr
+      first_bin = (oldest + i0) // b
+      last_bin = -(-(oldest + i1) // b)
+      mins, maxs = self.envelope.query(first_bin, last_bin)
+      groups = -(-(last_bin - first_bin) // k)
+      pad = ((0, 0), (0, groups * k - (last_bin - first_bin)))
+      mins = np.pad(mins, pad, mode="edge").reshape(self.channel_count, groups, k).min(axis=2)
+      maxs = np.pad(maxs, pad, mode="edge").reshape(self.channel_count, groups, k).max(axis=2)
+      starts = np.maximum((first_bin + np.arange(groups) * k) * b - oldest, 0)
+      span = k * b
+    x = np.column_stack([starts, starts + span / 2]).ravel()
+    y = np.stack([mins, maxs], axis=2).reshape(self.channel_count, -1)
+    return x, y
+
+  def x_at(self, index):
+    """
+    오래된 샘플부터 센 인덱스의 x축 좌표 (타임베이스가 있으면 초, 없으면 샘플 위치)
+    - scroll: 수집 시작 기준 위치, sweep: 버퍼 내 위치
+    """
+    if self.display_mode == "sweep":
+      position = (self.head + index) % self.buffer_size if self.wrapped else index
+      return position if self.timebase is None else position * self.timebase.dt
+    if self.timebase is None:
+      return index
+    return (self.end_sample - self.ptr + index) * self.timebase.dt
+
+  def _apply_x_transform(self, curve):
+    # 곡선은 샘플 인덱스 좌표로 그리고, 시간 축 변환은 아이템 변환(스케일+오프셋)으로 처리
+    if self.timebase is None:
+      curve.setTransform(QTransform())
+      curve.setPos(0, 0)
+    else:
+      curve.setTransform(QTransform.fromScale(self.timebase.dt, 1.0))
+      curve.setPos(0 if self.display_mode == "sweep" else self.x_at(0), 0)
+
+  def _set_sweep_data(self, curve, channel_data):
+    # 버퍼 위치 그대로 그리고, 쓰기 위치(가장 오래된/최신 경계)에서 선을 끊음
+    connect = np.ones(self.ptr, dtype=bool)
+    if self.wrapped:
+      connect[self.head - 1] = False
+    curve.setData(channel_data, connect=connect)
 
   def update_plot(self):
     """
     그래프를 최신 데이터로 갱신 + 통계/주석 표시
     """
+    self.dirty = False
+    self._rendering = True
     try:
+      if self.display_mode == "scroll":
+        width = int(self.plot_widget.getViewBox().width()) or self.DEFAULT_LOD_WIDTH
+        x, data = self.lod_data(*self.visible_range(), max(width, 1))
+      else:
+        data = self.data_buffer[:, :self.ptr]
+      stats = self.window_stats.stats()
       for i, curve in enumerate(self.curves):
-        curve.setData(self.data_buffer[i, :self.ptr])
-        # 통계 표시 (평균/최대/최소)
+        if self.display_mode == "scroll":
+          curve.setData(x, data[i])
+        else:
+          self._set_sweep_data(curve, data[i])
+        self._apply_x_transform(curve)
+        # 통계 표시 (평균/최대/최소, 누적된 버퍼 구간 통계 사용)
         if self.ptr > 0:
-          d = self.data_buffer[i, :self.ptr]
-          stats = f"avg={np.mean(d):.3f}\nmax={np.max(d):.3f}\nmin={np.min(d):.3f}"
-          self.text_items[i].setText(stats)
-          self.text_items[i].setPos(self.ptr, np.max(d))
+          self.text_items[i].setText(f"avg={stats.mean[i]:.3f}\nmax={stats.max[i]:.3f}\nmin={stats.min[i]:.3f}")
+          self.text_items[i].setPos(self.x_at(self.ptr), stats.max[i])
     except Exception as e:
       print(f"[플롯 업데이트 오류] {e}")
+    finally:
+      self._rendering = False
 
   def add_annotation(self, x, y, text, color='#ff4444'):
     """
@@ -101,6 +341,11 @@ class RealtimePlotWidget(QWidget):
     """
     self.data_buffer[:] = 0
     self.ptr = 0
+    self.head = 0
+    self.total_samples = 0
+    self.window_stats.clear()
+    self.timebase = None
+    self.end_sample = 0
     for curve in self.curves:
       curve.clear()
     for txt in self.text_items:
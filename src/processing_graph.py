@@ -0,0 +1,564 @@
+import numpy as np
+import threading
+import copy
+import time
+import os
+from src.signal_pipeline import StreamingFIRFilter, StreamingIIRFilter, RunningStats, WindowedStats, SpectrumAnalyzer
+from src.signal_pipeline import PLUGINS
+from src.timebase import ChunkTimebase
+from src.data_io import RawWriter, RAW_EXTENSIONS
+
+# 처리 그래프 설정(JSON) 형식 버전
+GRAPH_FORMAT_VERSION = 1
+# 수집 데이터 입력 노드 이름 (단계의 input으로 지정)
+SOURCE_ID = "source"
+
+class Stage:
+  """
+  처리 그래프 단계 공통 부분
+  - process(x, timebase) → (출력, 출력 타임베이스), x는 (채널 수, N)
+  - configure(**params): 파라미터 변경 (그래프가 청크 사이에서만 호출)
+  - 출력 버퍼는 _buffer()로 청크마다 재사용 (출력은 다음 청크 처리 전까지만 유효)
+  - calls/seconds/samples: 단계별 누적 처리 시간/입력 샘플 수
+  """
+  type_name = None
+  elementwise = False   # True면 연속된 요소별 단계끼리 하나로 합쳐 실행 (apply_inplace 구현)
+  defaults = {}
+
+  def __init__(self, stage_id, input_id=SOURCE_ID, params=None, sample_rate=1.0):
+    self.id = stage_id
+    self.input = input_id
+    self.sample_rate = float(sample_rate)
+    self.params = dict(self.defaults)
+    self._out = None
+    self.reset_timing()
+    self.configure(**(params or {}))
+
+  def configure(self, **params):
+    unknown = set(params) - set(self.defaults)
+    if unknown:
+      raise ValueError(f"'{self.id}' 단계에 없는 파라미터입니다: {', '.join(sorted(unknown))}")
+    self.params.update(params)
+    self._apply_params()
+
+  def _apply_params(self):
+    pass
+
+  def output_rate(self):
+    """출력 샘플링 속도 (Hz)"""
+    return self.sample_rate
+
+  def process(self, x, timebase):
+    return x, timebase
+
+  def reset(self):
+    """필터 상태/누적 결과 초기화 (수집 재시작 시)"""
+    pass
+
+  def result(self):
+    """분석 단계 결과 (통계/스펙트럼), 없으면 None"""
+    return None
+
+  def close(self):
+    pass
+
+  def reset_timing(self):
+    self.calls = 0
+    self.seconds = 0.0
+    self.samples = 0
+
+  def _buffer(self, shape):
+    # 채널 수가 같고 용량이 충분하면 이전 청크 버퍼를 그대로 사용
+    if self._out is None or self._out.shape[0] != shape[0] or self._out.shape[1] < shape[1]:
+      self._out = np.empty(shape)
+    return self._out[:, :shape[1]]
+
+  def to_config(self):
+    return {"id": self.id, "type": self.type_name, "input": self.input, "params": copy.deepcopy(self.params)}
+
+class GainStage(Stage):
+  """요소별 y = x * gain + offset"""
+  type_name = "gain"
+  elementwise = True
+  defaults = {"gain": 1.0, "offset": 0.0}
+
+  def apply_inplace(self, buf):
+    if self.params["gain"] != 1.0:
+      np.multiply(buf, self.params["gain"], out=buf)
+    if self.params["offset"] != 0.0:
+      np.add(buf, self.params["offset"], out=buf)
+
+  def process(self, x, timebase):
+    buf = self._buffer(x.shape)
+    np.copyto(buf, x)
+    self.apply_inplace(buf)
+    return buf, timebase
+
+class AbsStage(GainStage):
+  """요소별 절댓값 (정류)"""
+  type_name = "abs"
+  defaults = {}
+
+  def apply_inplace(self, buf):
+    np.abs(buf, out=buf)
+
+class ClipStage(GainStage):
+  """요소별 [low, high] 제한 (None이면 해당 방향 제한 없음)"""
+  type_name = "clip"
+  defaults = {"low": None, "high": None}
+
+  def apply_inplace(self, buf):
+    np.clip(buf, self.params["low"], self.params["high"], out=buf)
+
+class FusedStage(Stage):
+  """
+  연속된 요소별 단계를 하나로 합친 실행 단위 (입력을 출력 버퍼에 한 번 복사한 뒤 제자리 연산만 수행)
+  """
+  type_name = "fused"
+
+  def __init__(self, members):
+    self.members = members
+    super().__init__("+".join(m.id for m in members), members[0].input, None, members[0].sample_rate)
+
+  def process(self, x, timebase):
+    buf = self._buffer(x.shape)
+    np.copyto(buf, x)
+    for member in self.members:
+      member.apply_inplace(buf)
+    return buf, timebase
+
+class FirStage(Stage):
+  """FIR 필터 (StreamingFIRFilter, 긴 필터는 FFT 컨볼루션 자동 선택)"""
+  type_name = "fir"
+  defaults = {"cutoff_hz": 100.0, "order": 64, "btype": "lowpass", "method": "auto"}
+  filter = None
+
+  def _apply_params(self):
+    p = self.params
+    if self.filter is None:
+      self.filter = StreamingFIRFilter(p["cutoff_hz"], self.sample_rate, p["order"], p["btype"], method=p["method"])
+    else:
+      self.filter.configure(p["cutoff_hz"], self.sample_rate, p["order"], p["btype"], method=p["method"])
+
+  def process(self, x, timebase):
+    return self.filter.process(x), timebase
+
+  def reset(self):
+    self.filter.reset()
+
+class IirStage(FirStage):
+  """버터워스 IIR 필터 (StreamingIIRFilter, SOS 구조)"""
+  type_name = "iir"
+  defaults = {"cutoff_hz": 100.0, "order": 4, "btype": "lowpass"}
+
+  def _apply_params(self):
+    p = self.params
+    if self.filter is None:
+      self.filter = StreamingIIRFilter(p["cutoff_hz"], self.sample_rate, p["order"], p["btype"])
+    else:
+      self.filter.configure(p["cutoff_hz"], self.sample_rate, p["order"], p["btype"])
+
+class DecimateStage(Stage):
+  """
+  정수배 다운샘플링 (anti_alias면 출력 나이퀴스트의 80%에서 FIR 저역통과 후 솎아냄)
+  - 청크 길이가 factor의 배수가 아니어도 다음 청크에서 위상을 이어감
+  - 출력 타임베이스는 step을 factor배로 늘려 원래 샘플 인덱스 기준 시각 유지
+  """
+  type_name = "decimate"
+  defaults = {"factor": 10, "anti_alias": True}
+
+  def _apply_params(self):
+    factor = int(self.params["factor"])
+    if factor < 1:
+      raise ValueError(f"'{self.id}' 단계 factor는 1 이상이어야 합니다. 현재: {factor}")
+    self.factor = factor
+    self._phase = 0
+    self.filter = None
+    if self.params["anti_alias"] and factor > 1:
+      self.filter = StreamingFIRFilter(0.8 * self.sample_rate / (2 * factor), self.sample_rate, 20 * factor + 1)
+
+  def output_rate(self):
+    return self.sample_rate / self.factor
+
+  def process(self, x, timebase):
+    y = self.filter.process(x) if self.filter is not None else x
+    phase = self._phase
+    picked = y[:, phase::self.factor]
+    self._phase = (phase - x.shape[1]) % self.factor
+    buf = self._buffer(picked.shape)
+    np.copyto(buf, picked)
+    if timebase is not None:
+      timebase = ChunkTimebase(timebase.start_sample + phase * timebase.step, timebase.t0, timebase.dt, timebase.drift,
+                               buf.shape[1], timebase.step * self.factor)
+    return buf, timebase
+
+  def reset(self):
+    self._phase = 0
+    if self.filter is not None:
+      self.filter.reset()
+
+class DerivedStage(Stage):
+  """
+  파생 채널: 입력 채널의 선형 결합 y = weights @ x (예: [[1, -1]] → 채널 1 - 채널 2)
+  keep_inputs면 입력 채널 뒤에 파생 채널을 붙여 출력
+  """
+  type_name = "derived"
+  defaults = {"weights": [[1.0]], "keep_inputs": False}
+
+  def _apply_params(self):
+    weights = np.asarray(self.params["weights"], dtype=np.float64)
+    if weights.ndim != 2:
+      raise ValueError(f"'{self.id}' 단계 weights는 2차원 목록이어야 합니다. 현재: {weights.shape}")
+    self.weights = weights
+
+  def process(self, x, timebase):
+    if x.shape[0] != self.weights.shape[1]:
+      raise ValueError(f"'{self.id}' 단계 weights 열 수({self.weights.shape[1]})와 입력 채널 수({x.shape[0]})가 다릅니다.")
+    keep = x.shape[0] if self.params["keep_inputs"] else 0
+    buf = self._buffer((keep + self.weights.shape[0], x.shape[1]))
+    if keep:
+      buf[:keep] = x
+    buf[keep:] = self.weights @ x
+    return buf, timebase
+
+class StatsStage(Stage):
+  """채널별 통계 (window가 None이면 전체 누적 RunningStats, 아니면 최근 window 샘플 WindowedStats), 입력을 그대로 전달"""
+  type_name = "stats"
+  defaults = {"window": None}
+
+  def _apply_params(self):
+    self.stats = None
+
+  def process(self, x, timebase):
+    if self.stats is None:
+      window = self.params["window"]
+      self.stats = RunningStats(x.shape[0]) if window is None else WindowedStats(x.shape[0], window=int(window))
+    self.stats.update(x)
+    return x, timebase
+
+  def reset(self):
+    self.stats = None
+
+  def result(self):
+    return self.stats.snapshot() if self.stats is not None else None
+
+class SpectrumStage(Stage):
+  """실시간 Welch 스펙트럼 (SpectrumAnalyzer), 입력을 그대로 전달하고 갱신 주기마다 결과 보관"""
+  type_name = "spectrum"
+  defaults = {"nfft": 1024, "overlap": 0.5, "window": "hann", "scaling": "psd", "averaging": "linear",
+              "n_averages": 8, "update_rate": 10.0}
+  analyzer = None
+
+  def _apply_params(self):
+    if self.analyzer is None:
+      self.analyzer = SpectrumAnalyzer(self.sample_rate, **self.params)
+    else:
+      self.analyzer.configure(**self.params)
+    self.latest = None
+
+  def process(self, x, timebase):
+    spectrum = self.analyzer.push(x)
+    if spectrum is not None:
+      self.latest = spectrum
+    return x, timebase
+
+  def reset(self):
+    self.analyzer.reset()
+    self.latest = None
+
+  def result(self):
+    return self.latest
+
+class SinkStage(Stage):
+  """
+  외부 출력 (플롯 등): ProcessingGraph.bind_sink(target, callback)으로 연결한 callback(data, timebase) 호출
+  연결되지 않은 target이면 아무것도 하지 않음
+  """
+  type_name = "sink"
+  defaults = {"target": "plot"}
+  callback = None
+
+  def process(self, x, timebase):
+    if self.callback is not None:
+      self.callback(x, timebase)
+    return x, timebase
+
+class FileStage(Stage):
+  """
+  원시 바이너리 파일 출력 (data_io.RawWriter, 첫 청크에서 파일 생성, reset/close 시 닫음)
+  수집을 다시 시작하면 같은 경로에 새로 기록
+  """
+  type_name = "file"
+  defaults = {"path": "pipeline_output.bin"}
+  writer = None
+
+  def _apply_params(self):
+    if os.path.splitext(self.params["path"])[1].lower() not in RAW_EXTENSIONS:
+      raise ValueError(f"'{self.id}' 단계 파일 확장자는 {', '.join(RAW_EXTENSIONS)} 중 하나여야 합니다.")
+    self.close()
+
+  def process(self, x, timebase):
+    if self.writer is None:
+      self.writer = RawWriter(self.params["path"], x.shape[0], sample_rate=self.output_rate())
+      if timebase is not None:
+        # 솎아낸 입력(step > 1)은 출력 샘플 간격 기준 타임베이스로 기록
+        self.writer.set_timebase(ChunkTimebase(0, timebase.start_time, timebase.dt * timebase.step))
+    self.writer.append(x)
+    return x, timebase
+
+  def reset(self):
+    self.close()
+
+  def close(self):
+    if self.writer is not None:
+      self.writer.close()
+    self.writer = None
+
+class PluginStage(Stage):
+  """
+  외부 파이썬 플러그인 (signal_pipeline.PLUGINS 캐시, 파일이 바뀌면 다음 청크부터 새 코드로 실행)
+  - 스트리밍 계약(init(config)/process(chunk)/flush()) 또는 일괄 계약(process(data)) 모두 지원
+  - 출력 샘플 수가 입력과 다르면 출력 타임베이스는 None
+  - close() 시 flush() 호출 (남은 출력은 버림)
+  """
+  type_name = "plugin"
+  defaults = {"path": "", "config": {}}
+  stream = None
+
+  def _apply_params(self):
+    self.stream = PLUGINS.open_stream(self.params["path"], self.params["config"])
+
+  def process(self, x, timebase):
+    y = self.stream.process(x)
+    return y, timebase if y.shape == x.shape else None
+
+  def reset(self):
+    self.stream.reset()
+
+  def close(self):
+    if self.stream is not None and self.stream.module is not None:
+      self.stream.flush()
+
+STAGE_TYPES = {cls.type_name: cls for cls in (GainStage, AbsStage, ClipStage, FirStage, IirStage, DecimateStage,
+                                              DerivedStage, StatsStage, SpectrumStage, SinkStage, FileStage,
+                                              PluginStage)}
+
+class ProcessingGraph:
+  """
+  청크 단위 신호 처리 그래프 (DAG)
+  - 설정: {"version": 1, "stages": [{"id", "type", "input", "params"}, ...]}, input은 "source" 또는 다른 단계 id
+    (한 단계 출력을 여러 단계가 입력으로 쓰면 팬아웃: 예) 필터 → 플롯 싱크 + 파일 + 통계)
+  - 단계는 위상 정렬 순서로 실행, 출력 샘플링 속도는 입력 단계에서 이어받음 (decimate 이후는 낮아짐)
+  - 소비자가 하나뿐인 연속 요소별 단계(gain/abs/clip)는 하나의 실행 단위로 합침 (fuse=True)
+  - set_params()/load_config()는 실행 중 어느 스레드에서 호출해도 다음 청크 시작 시점에 한 번에 반영
+  - timing_report(): 단계별 처리 시간/처리량
+  """
+  def __init__(self, sample_rate=1.0, config=None, fuse=True):
+    self.sample_rate = float(sample_rate)
+    self.fuse = fuse
+    self.outputs = {}
+    self._lock = threading.Lock()
+    self._pending_params = {}
+    self._sinks = {}
+    self._stages = {}
+    self._plan = []
+    self.load_config(config or {"version": GRAPH_FORMAT_VERSION, "stages": []})
+
+  @property
+  def stages(self):
+    """단계 id → Stage (설정 순서)"""
+    return dict(self._stages)
+
+  def __len__(self):
+    return len(self._stages)
+
+  def load_config(self, config):
+    """
+    설정으로 그래프를 새로 구성 (검증/생성은 잠금 밖에서 하고, 실행 계획 교체만 잠금 안에서 수행)
+    잘못된 설정이면 ValueError, 기존 그래프는 그대로 유지
+    """
+    stages, plan = self._build(config)
+    with self._lock:
+      old = self._stages
+      self._stages, self._plan = stages, plan
+      self._pending_params = {}
+    for stage in old.values():
+      stage.close()
+    self._bind_sinks()
+
+  def configure_sample_rate(self, sample_rate):
+    """입력 샘플링 속도 변경 (필터 재설계를 위해 현재 설정으로 그래프 재구성)"""
+    self.sample_rate = float(sample_rate)
+    self.load_config(self.to_config())
+
+  def _build(self, config):
+    if isinstance(config, list):
+      config = {"stages": config}
+    version = config.get("version", GRAPH_FORMAT_VERSION)
+    if version > GRAPH_FORMAT_VERSION:
+      raise ValueError(f"지원하지 않는 처리 그래프 버전입니다: {version}")
+    entries = config.get("stages", [])
+    by_id = {}
+    for entry in entries:
+      stage_id = entry.get("id")
+      if not stage_id or stage_id == SOURCE_ID or stage_id in by_id:
+        raise ValueError(f"단계 id가 비었거나 중복/예약어입니다: {stage_id}")
+      if entry.get("type") not in STAGE_TYPES:
+        raise ValueError(f"알 수 없는 단계 타입입니다: {entry.get('type')} (가능: {', '.join(STAGE_TYPES)})")
+      by_id[stage_id] = entry
+    # 위상 정렬 (입력이 먼저 실행되도록)
+    order = []
+    state = {}
+    for stage_id in by_id:
+      stack = [stage_id]
+      while stack:
+        current = stack[-1]
+        if state.get(current) == "done":
+          stack.pop()
+          continue
+        state[current] = "visiting"
+        parent = by_id[current].get("input", SOURCE_ID)
+        if parent != SOURCE_ID and parent not in by_id:
+          raise ValueError(f"'{current}' 단계의 입력 '{parent}'이(가) 없습니다.")
+        if parent != SOURCE_ID and state.get(parent) != "done":
+          if state.get(parent) == "visiting":
+            raise ValueError(f"처리 그래프에 순환이 있습니다: '{current}' → '{parent}'")
+          stack.append(parent)
+          continue
+        state[current] = "done"
+        order.append(current)
+        stack.pop()
+    # 입력 단계의 출력 속도로 단계 생성
+    stages = {}
+    rates = {SOURCE_ID: self.sample_rate}
+    for stage_id in order:
+      entry = by_id[stage_id]
+      input_id = entry.get("input", SOURCE_ID)
+      try:
+        stage = STAGE_TYPES[entry["type"]](stage_id, input_id, entry.get("params"), rates[input_id])
+      except ValueError:
+        raise
+      except Exception as e:
+        raise ValueError(f"'{stage_id}' 단계 설정 오류: {e}")
+      rates[stage_id] = stage.output_rate()
+      stages[stage_id] = stage
+    stages = {stage_id: stages[stage_id] for stage_id in by_id}
+    return stages, self._compile([stages[stage_id] for stage_id in order])
+
+  def _compile(self, ordered):
+    if not self.fuse:
+      return ordered
+    consumers = {}
+    for stage in ordered:
+      consumers[stage.input] = consumers.get(stage.input, 0) + 1
+    plan = []
+    chain = []
+    for stage in ordered:
+      if stage.elementwise and chain and stage.input == chain[-1].id and consumers.get(chain[-1].id) == 1:
+        chain.append(stage)
+        continue
+      if chain:
+        plan.append(chain[0] if len(chain) == 1 else FusedStage(chain))
+        chain = []
+      if stage.elementwise:
+        chain = [stage]
+      else:
+        plan.append(stage)
+    if chain:
+      plan.append(chain[0] if len(chain) == 1 else FusedStage(chain))
+    return plan
+
+  def to_config(self):
+    """현재 설정 (실행 중 바뀐 파라미터 포함, 레이아웃 JSON에 저장)"""
+    return {"version": GRAPH_FORMAT_VERSION, "stages": [stage.to_config() for stage in self._stages.values()]}
+
+  def set_params(self, stage_id, **params):
+    """
+    단계 파라미터 변경 예약 (다음 청크 처리 직전에 한 번에 반영, 청크 중간에 반쯤 바뀐 설정으로 실행되지 않음)
+    """
+    if stage_id not in self._stages:
+      raise ValueError(f"처리 그래프에 '{stage_id}' 단계가 없습니다.")
+    with self._lock:
+      self._pending_params.setdefault(stage_id, {}).update(params)
+
+  def bind_sink(self, target, callback):
+    """sink 단계 target 이름에 callback(data, timebase) 연결 (None이면 해제)"""
+    if callback is None:
+      self._sinks.pop(target, None)
+    else:
+      self._sinks[target] = callback
+    self._bind_sinks()
+
+  def has_sink(self, target):
+    """설정에 target으로 출력하는 sink 단계가 있는지"""
+    return any(isinstance(stage, SinkStage) and stage.params["target"] == target for stage in self._stages.values())
+
+  def _bind_sinks(self):
+    for stage in self._stages.values():
+      if isinstance(stage, SinkStage):
+        stage.callback = self._sinks.get(stage.params["target"])
+
+  def process(self, data: np.ndarray, timebase=None) -> dict:
+    """
+    (채널 수, N) 또는 단일 채널 (N,) 청크를 그래프에 통과시킴
+    반환: 단계 id → 출력 배열 (합쳐진 요소별 단계는 마지막 단계 id로만 조회, 다음 청크 전까지 유효)
+    """
+    with self._lock:
+      plan, pending = self._plan, self._pending_params
+      self._pending_params = {}
+    for stage_id, params in pending.items():
+      self._stages[stage_id].configure(**params)
+    if pending:
+      self._bind_sinks()
+    x = data.reshape(1, -1) if data.ndim == 1 else data
+    results = {SOURCE_ID: (x, timebase)}
+    for node in plan:
+      inp, tb = results[node.input]
+      start = time.perf_counter()
+      out, out_tb = node.process(inp, tb)
+      node.seconds += time.perf_counter() - start
+      node.calls += 1
+      node.samples += inp.shape[1]
+      results[node.members[-1].id if isinstance(node, FusedStage) else node.id] = (out, out_tb)
+    self.outputs = {stage_id: out for stage_id, (out, _) in results.items()}
+    return self.outputs
+
+  def result(self, stage_id):
+    """통계/스펙트럼 단계의 최신 결과"""
+    return self._stages[stage_id].result()
+
+  def results(self) -> dict:
+    return {stage_id: stage.result() for stage_id, stage in self._stages.items() if stage.result() is not None}
+
+  def timing_report(self) -> list:
+    """
+    실행 단위별 누적 처리 시간 [{"id", "type", "calls", "total_ms", "mean_ms", "throughput"}]
+    throughput: 입력 샘플/초 (채널당)
+    """
+    report = []
+    for node in self._plan:
+      report.append({
+        "id": node.id,
+        "type": node.type_name,
+        "calls": node.calls,
+        "total_ms": node.seconds * 1e3,
+        "mean_ms": node.seconds * 1e3 / node.calls if node.calls else 0.0,
+        "throughput": node.samples / node.seconds if node.seconds > 0 else 0.0,
+      })
+    return report
+
+  def format_timing(self):
+    """timing_report() 한 줄 요약 (로그용)"""
+    return ", ".join(f"{r['id']}({r['type']}) {r['mean_ms']:.3f} ms/청크 {r['throughput'] / 1e6:.2f} MS/s"
+                     for r in self.timing_report() if r["calls"])
+
+  def reset(self):
+    """모든 단계 상태/타이밍 초기화 (수집 재시작 시)"""
+    for node in self._plan:
+      node.reset_timing()
+    for stage in self._stages.values():
+      stage.reset()
+
+  def close(self):
+    for stage in self._stages.values():
+      stage.close()
@@ -0,0 +1,140 @@
+from PySide6.QtCore import QThread, Signal
+from src.data_io import create_hdf5_stream, append_hdf5, set_hdf5_timebase, set_hdf5_markers
+import numpy as np
+import collections
+import queue
+import time
+import json
+
+class StreamRecorder(QThread):
+  """
+  수집 청크를 별도 쓰기 스레드에서 확장 가능한 HDF5 데이터셋에 이어 쓰는 녹화기
+  - DaqDataCollector.add_sink(recorder.write)로 연결 (수집 스레드는 복사 후 큐에 넣기만 함)
+  - flush_interval마다 파일을 flush하여 비정상 종료 시에도 마지막 flush까지의 데이터 보존
+  - 메모리 사용량은 큐 크기(max_queue_chunks)로 제한 (전체 기록을 RAM에 쌓지 않음)
+  - 속성: sample_rate, channel_names, t0/dt/start_sample, markers, gaps, dropped_samples
+  - 빠진 샘플은 한 곳에만 집계: 수집 유실은 gaps의 lost, 쓰기 큐 초과로 버린 샘플은 dropped_samples
+    (gaps 항목의 dropped는 그 위치에서 큐 초과로 빠진 샘플 수, 파일 시각 복원 시 lost + dropped만큼 건너뜀)
+  - 원시 모드: dtype=np.int16과 scaling(ChannelScaling)을 지정하면 원시 코드와 변환 계수를 함께 기록
+  - compression: None/"lzf"/"gzip" (청크 단위 압축, data_io 버전 2 레이아웃)
+  """
+  recording_stopped = Signal(str, int)  # 파일 경로, 기록된 채널당 샘플 수
+  error_occurred = Signal(str)
+
+  def __init__(self, file_path, channel_count=1, sample_rate=None, channel_names=None, flush_interval=1.0,
+               chunk_samples=4096, max_queue_chunks=1024, dtype=np.float64, scaling=None, compression=None,
+               parent=None):
+    super().__init__(parent)
+    self.file_path = file_path
+    self.channel_count = channel_count
+    self.sample_rate = sample_rate
+    self.channel_names = channel_names
+    self.flush_interval = flush_interval
+    self.chunk_samples = chunk_samples
+    self.dtype = dtype
+    self.scaling = scaling
+    self.compression = compression
+    self.samples_written = 0   # 파일에 기록된 채널당 샘플 수
+    self.dropped_samples = 0   # 큐가 가득 차 기록하지 못한 샘플 수
+    self.markers = []          # [{"sample": 절대 샘플 인덱스, "label": 이름}]
+    self.gaps = []             # 불연속 구간 [{"offset": 파일 내 위치, "lost": 수집 유실 샘플 수, "dropped": 큐 초과 샘플 수}]
+    self._queue = queue.Queue(maxsize=max_queue_chunks)
+    self._dropped_chunks = collections.deque()  # 큐 초과로 버린 청크 (시작 샘플, 샘플 수), 쓰기 스레드가 소비
+    self._expected_sample = None
+    self._markers_dirty = False
+    self._stop_requested = False   # stop() 호출됨: 큐에 남은 청크만 기록하고 종료
+    self._failed = False           # 파일 생성/기록 실패로 쓰기 스레드 종료 (이후 청크는 받지 않음)
+
+  def write(self, data: np.ndarray, timebase=None):
+    """
+    싱크: 수집 스레드에서 호출, 청크를 복사해 쓰기 큐에 넣음 (데이터는 재사용 버퍼일 수 있음)
+    - 정지 요청 후나 쓰기 스레드가 실패한 뒤에는 무시
+    """
+    if self._stop_requested or self._failed:
+      return
+    try:
+      self._queue.put_nowait((np.array(data, copy=True), timebase))
+    except queue.Full:
+      self.dropped_samples += data.shape[-1]
+      if timebase is not None:
+        self._dropped_chunks.append((timebase.start_sample, data.shape[-1]))
+
+  def add_marker(self, sample_index, label="marker"):
+    """
+    마커 추가 (다음 flush 때 파일 속성에 기록)
+    """
+    self.markers.append({"sample": int(sample_index), "label": label})
+    self._markers_dirty = True
+
+  def stop(self):
+    """
+    녹화 종료 요청 (큐에 남은 청크를 모두 기록한 뒤 파일을 닫음)
+    - 대기하지 않음: 큐가 가득 차 종료 표시를 넣지 못해도 쓰기 스레드가 큐를 비운 뒤 정지 플래그로 종료
+    """
+    self._stop_requested = True
+    try:
+      self._queue.put_nowait(None)
+    except queue.Full:
+      pass
+
+  def run(self):
+    try:
+      h5file, dset = create_hdf5_stream(self.file_path, self.channel_count, self.sample_rate, self.channel_names,
+                                        self.chunk_samples, self.dtype, self.scaling, self.compression)
+    except Exception as e:
+      self._failed = True
+      self.error_occurred.emit(f"녹화 파일 생성 오류: {e}")
+      return
+    last_flush = time.monotonic()
+    try:
+      while True:
+        try:
+          item = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+          if self._stop_requested:
+            break
+          item = False
+        if item is None:
+          break
+        if item is not False:
+          self._append(dset, *item)
+        if time.monotonic() - last_flush >= self.flush_interval:
+          self._flush(h5file, dset)
+          last_flush = time.monotonic()
+    except Exception as e:
+      self._failed = True
+      self.error_occurred.emit(f"녹화 중 오류: {e}")
+    finally:
+      try:
+        self._flush(h5file, dset)
+      finally:
+        h5file.close()
+    self.recording_stopped.emit(self.file_path, self.samples_written)
+
+  def _append(self, dset, data, timebase):
+    if timebase is not None:
+      # 이 청크 앞에서 큐 초과로 버린 샘플 (dropped_samples에 이미 집계되어 수집 유실에서 제외)
+      dropped = 0
+      while self._dropped_chunks and self._dropped_chunks[0][0] < timebase.start_sample:
+        dropped += self._dropped_chunks.popleft()[1]
+      if self._expected_sample is None:
+        set_hdf5_timebase(dset, timebase)
+      elif timebase.start_sample > self._expected_sample:
+        gap = {"offset": self.samples_written, "lost": timebase.start_sample - self._expected_sample - dropped}
+        if dropped:
+          gap["dropped"] = dropped
+        self.gaps.append(gap)
+        self._markers_dirty = True
+      self._expected_sample = timebase.end_sample
+    append_hdf5(dset, data)
+    self.samples_written += data.shape[-1]
+
+  def _flush(self, h5file, dset):
+    if self._markers_dirty:
+      set_hdf5_markers(dset, self.markers)
+      dset.attrs["gaps"] = json.dumps(self.gaps)
+      self._markers_dirty = False
+    self._stop_requested = False   # stop() 호출됨: 큐에 남은 청크만 기록하고 종료
+    self._failed = False           # 파일 생성/기록 실패로 쓰기 스레드 종료 (이후 청크는 받지 않음)
+    dset.attrs["dropped_samples"] = self.dropped_samples
+    h5file.flush()
@@ -0,0 +1,102 @@
+import numpy as np
+
+class RecordingHandle:
+  """
+  파일에 있는 기록을 통째로 읽지 않고 필요한 구간만 읽는 지연 로딩 핸들 (data_io.open_recording으로 생성)
+  - source: h5py 데이터셋, np.memmap 또는 ndarray (마지막 축이 샘플 축)
+  - shape/dtype/metadata/timebase는 파일을 읽지 않고 바로 조회
+  - handle[..., a:b]처럼 numpy와 같은 인덱싱으로 해당 구간만 읽어 ndarray로 반환
+  - scaling(ChannelScaling)이 있으면 읽은 구간만 전압으로 변환
+  - np.asarray(handle)은 전체를 읽음 (큰 파일은 iter_blocks()로 나눠 처리)
+  """
+  def __init__(self, source, metadata=None, timebase=None, scaling=None, closer=None, file_path=None):
+    self.source = source
+    self.metadata = metadata or {}
+    self.timebase = timebase
+    self.scaling = scaling
+    self.file_path = file_path
+    self._closer = closer
+
+  @property
+  def shape(self):
+    return tuple(self.source.shape)
+
+  @property
+  def ndim(self):
+    return len(self.source.shape)
+
+  @property
+  def dtype(self):
+    return np.dtype(np.float64) if self.scaling is not None else np.dtype(self.source.dtype)
+
+  @property
+  def size(self):
+    return int(np.prod(self.shape))
+
+  @property
+  def n_samples(self):
+    return self.shape[-1]
+
+  @property
+  def channel_count(self):
+    return self.shape[0] if self.ndim == 2 else 1
+
+  def __len__(self):
+    return self.shape[0]
+
+  def __getitem__(self, key):
+    raw = np.asarray(self.source[key])
+    if self.scaling is None:
+      return raw
+    return self._scale(raw, key)
+
+  def _scale(self, raw, key):
+    # 인덱스가 가리키는 채널을 찾아 해당 채널 계수로 변환
+    if self.ndim == 1:
+      channel_key = 0
+    else:
+      key = key if isinstance(key, tuple) else (key,)
+      channel_key = slice(None) if not key or key[0] is Ellipsis else key[0]
+    channels = np.arange(self.channel_count)[channel_key]
+    if np.ndim(channels) == 0:
+      return self.scaling.apply(raw.reshape(1, -1), [int(channels)]).reshape(raw.shape)
+    if raw.ndim == 2:
+      return self.scaling.apply(raw, channels)
+    return self.scaling.apply(raw.reshape(-1, 1), channels).reshape(raw.shape)
+
+  def __array__(self, dtype=None, copy=None):
+    data = self[...]
+    return data.astype(dtype, copy=False) if dtype is not None else data
+
+  def read(self, start=None, stop=None):
+    """샘플 구간 [start, stop) 읽기"""
+    return self[..., start:stop]
+
+  def iter_blocks(self, block_samples=65536):
+    """
+    (시작 샘플, 블록 ndarray)를 block_samples 단위로 순서대로 반환 (메모리 사용량은 블록 크기로 제한)
+    """
+    for start in range(0, self.n_samples, block_samples):
+      yield start, self.read(start, start + block_samples)
+
+  def close(self):
+    if self._closer is not None:
+      self._closer()
+      self._closer = None
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+  def __repr__(self):
+    return f"RecordingHandle(shape={self.shape}, dtype={self.dtype}, file={self.file_path})"
+
+def as_array(data):
+  """
+  RecordingHandle이면 전체를 ndarray로 읽고, ndarray는 그대로 반환
+  """
+  if isinstance(data, RecordingHandle):
+    return np.asarray(data)
+  return data
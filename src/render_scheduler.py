@@ -0,0 +1,87 @@
+from PySide6.QtCore import QObject, QTimer
+import weakref
+import time
+
+class RenderScheduler(QObject):
+  """
+  여러 플롯 위젯이 공유하는 프레임 클럭
+  - 위젯은 데이터가 바뀌면 request_frame()으로 다시 그리기를 요청 (dirty 표시)
+  - 프레임마다 dirty이면서 화면에 보이는 위젯만 update_plot() 호출, 숨겨진 위젯은 보일 때까지 보류
+  - 그릴 위젯이 없으면 타이머를 멈춤 (유휴 상태 CPU 사용 ≈ 0)
+  - frame_budget: 한 프레임에서 쓸 렌더링 시간(초), 넘으면 남은 위젯은 다음 프레임으로 미루고
+    프레임 간격을 늘려 부하에 따라 실효 FPS가 자동으로 낮아짐
+  """
+  _shared = None
+
+  def __init__(self, max_fps=60, min_fps=5, frame_budget=0.012, parent=None):
+    super().__init__(parent)
+    self.min_interval = 1.0 / max_fps
+    self.max_interval = 1.0 / min_fps
+    self.frame_budget = frame_budget
+    self.interval = self.min_interval   # 현재 프레임 간격(초)
+    self.last_frame_time = 0.0          # 마지막 프레임 렌더링 소요 시간(초)
+    self.frames = 0
+    self._widgets = weakref.WeakSet()
+    self._last_render = weakref.WeakKeyDictionary()  # 위젯별 마지막 렌더링 프레임 번호 (공정한 순서용)
+    self.timer = QTimer(self)
+    self.timer.setSingleShot(True)
+    self.timer.timeout.connect(self.render_frame)
+
+  @classmethod
+  def shared(cls):
+    """애플리케이션 전체에서 공유하는 기본 스케줄러"""
+    if cls._shared is None:
+      cls._shared = cls()
+    return cls._shared
+
+  @property
+  def effective_fps(self):
+    return 1.0 / self.interval
+
+  def register(self, widget):
+    self._widgets.add(widget)
+
+  def unregister(self, widget):
+    self._widgets.discard(widget)
+
+  def request_frame(self, widget=None):
+    """
+    다음 프레임 예약 (이미 예약돼 있으면 무시)
+    """
+    if widget is not None:
+      self._widgets.add(widget)
+    if not self.timer.isActive():
+      self.timer.start(int(self.interval * 1000))
+
+  def _pending(self):
+    pending = []
+    for widget in list(self._widgets):
+      try:
+        if widget.dirty and widget.is_render_visible():
+          pending.append(widget)
+      except RuntimeError:
+        # C++ 객체가 이미 삭제된 위젯
+        self._widgets.discard(widget)
+    return pending
+
+  def render_frame(self):
+    """
+    dirty이면서 보이는 위젯을 오래 기다린 순서로 그림 (프레임 예산을 넘으면 나머지는 다음 프레임)
+    """
+    self.timer.stop()
+    pending = sorted(self._pending(), key=lambda w: self._last_render.get(w, -1))
+    started = time.perf_counter()
+    for widget in pending:
+      widget.update_plot()
+      self._last_render[widget] = self.frames
+      if time.perf_counter() - started > self.frame_budget:
+        break
+    self.frames += 1
+    self.last_frame_time = time.perf_counter() - started
+    # 예산 초과 시 간격을 늘리고, 여유가 있으면 최대 FPS 쪽으로 회복
+    if self.last_frame_time > self.frame_budget:
+      self.interval = min(self.interval * 1.5, self.max_interval)
+    else:
+      self.interval = max(self.interval * 0.9, self.min_interval)
+    if self._pending():
+      self.timer.start(int(self.interval * 1000))
@@ -0,0 +1,59 @@
+import numpy as np
+
+class ChannelScaling:
+  """
+  장치 원시 코드(int16) → 전압 변환용 채널별 다항식 계수
+  - coefficients: (채널 수, 차수+1), 전압 = c0 + c1*x + c2*x^2 + ... (DAQmx ai_dev_scaling_coeff와 동일한 순서)
+  - 원시 데이터는 int16 그대로 저장/전달하고, 표시/DSP/내보내기 등 필요한 곳에서만 apply()로 변환
+  """
+  def __init__(self, coefficients):
+    coefficients = np.atleast_2d(np.asarray(coefficients, dtype=np.float64))
+    if coefficients.shape[1] == 0:
+      raise ValueError("스케일링 계수가 비어 있습니다.")
+    self.coefficients = coefficients
+
+  @classmethod
+  def linear(cls, channel_count, lsb, offset=0.0):
+    """모든 채널에 같은 선형 계수 (전압 = offset + lsb * 코드)"""
+    return cls(np.tile([offset, lsb], (channel_count, 1)))
+
+  @property
+  def channel_count(self):
+    return self.coefficients.shape[0]
+
+  def apply(self, raw: np.ndarray, channels=None, out=None) -> np.ndarray:
+    """
+    원시 코드 배열 (채널 수, N) 또는 단일 채널 (N,)을 전압(float64)으로 변환 (채널별 Horner 벡터 연산)
+    - channels: raw의 행이 가리키는 채널 인덱스 (일부 채널만 변환할 때)
+    """
+    coeffs = self.coefficients if channels is None else self.coefficients[channels]
+    squeeze = raw.ndim == 1
+    x = raw.reshape(1, -1) if squeeze else raw
+    if coeffs.shape[0] != x.shape[0]:
+      raise ValueError(f"스케일링 채널 수({coeffs.shape[0]})와 데이터 채널 수({x.shape[0]})가 다릅니다.")
+    if out is None:
+      out = np.empty(x.shape, dtype=np.float64)
+    out_2d = out.reshape(x.shape)
+    out_2d[:] = coeffs[:, -1:]
+    for k in range(coeffs.shape[1] - 2, -1, -1):
+      out_2d *= x
+      out_2d += coeffs[:, k:k + 1]
+    return out_2d.reshape(-1) if squeeze else out_2d
+
+  def to_dict(self):
+    return {"coefficients": self.coefficients.tolist()}
+
+  @classmethod
+  def from_dict(cls, info):
+    return cls(info["coefficients"])
+
+  def __repr__(self):
+    return f"ChannelScaling(channels={self.channel_count}, order={self.coefficients.shape[1] - 1})"
+
+def scale_if_raw(data: np.ndarray, scaling=None) -> np.ndarray:
+  """
+  정수 원시 코드이고 스케일링 정보가 있으면 전압으로 변환, 아니면 그대로 반환
+  """
+  if scaling is not None and np.issubdtype(data.dtype, np.integer):
+    return scaling.apply(data)
+  return data
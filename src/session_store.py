@@ -0,0 +1,148 @@
+import numpy as np
+import tempfile
+import os
+
+class SessionStore:
+  """
+  수집 세션 전체 데이터를 (채널 수, 샘플 수) 형태로 보관하는 블록 저장소
+  - 고정 크기 블록(block_size 샘플)에 이어 쓰기: 추가 비용은 청크 크기에 비례 (전체 세션 복사 없음)
+  - ram_budget(바이트)을 넘으면 가득 찬 오래된 블록을 임시 파일로 옮기고 memmap으로 참조 (spill)
+  - view(): 전체 연속 배열 (블록이 하나면 복사 없는 뷰, 여러 블록이면 이어붙임, spill이 없을 때만 캐시)
+  - iter_blocks(): 블록을 순서대로 하나씩 (파일 저장 등 전체를 메모리에 올리지 않는 순회용)
+  - slice(start, stop): 필요한 블록만 읽어 구간 반환
+  """
+  def __init__(self, channel_count=1, block_size=65536, dtype=np.float64, ram_budget=None, spill_dir=None):
+    self.channel_count = channel_count
+    self.block_size = block_size
+    self.dtype = np.dtype(dtype)
+    self.ram_budget = ram_budget
+    self.spill_dir = spill_dir
+    self.blocks = []          # 가득 찬 블록 (메모리 배열 또는 memmap)
+    self.spilled = 0          # 파일로 옮긴 블록 수 (blocks 앞쪽부터)
+    self._current = np.empty((channel_count, block_size), dtype=self.dtype)
+    self._fill = 0
+    self._view = None
+    self._spill_file = None
+
+  def __len__(self):
+    return len(self.blocks) * self.block_size + self._fill
+
+  @property
+  def n_samples(self):
+    return len(self)
+
+  @property
+  def shape(self):
+    return (self.channel_count, len(self))
+
+  @property
+  def size(self):
+    return self.channel_count * len(self)
+
+  @property
+  def ram_bytes(self):
+    """메모리에 있는 블록 바이트 수 (spill된 블록 제외)"""
+    return (len(self.blocks) - self.spilled + 1) * self.channel_count * self.block_size * self.dtype.itemsize
+
+  def append(self, data: np.ndarray):
+    """
+    (채널 수, N) 또는 단일 채널 (N,) 청크 추가
+    """
+    if data.ndim == 1:
+      data = data.reshape(1, -1)
+    if data.shape[0] != self.channel_count:
+      raise ValueError(f"입력 데이터 shape는 ({self.channel_count}, N)이어야 합니다. 현재: {data.shape}")
+    offset = 0
+    n = data.shape[1]
+    while offset < n:
+      count = min(n - offset, self.block_size - self._fill)
+      self._current[:, self._fill:self._fill + count] = data[:, offset:offset + count]
+      self._fill += count
+      offset += count
+      if self._fill == self.block_size:
+        self.blocks.append(self._current)
+        self._current = np.empty((self.channel_count, self.block_size), dtype=self.dtype)
+        self._fill = 0
+        self._spill_if_needed()
+    self._view = None
+
+  def _spill_if_needed(self):
+    if self.ram_budget is None:
+      return
+    while self.ram_bytes > self.ram_budget and self.spilled < len(self.blocks):
+      block = self.blocks[self.spilled]
+      if self._spill_file is None:
+        self._spill_file = tempfile.NamedTemporaryFile(prefix="daq_session_", suffix=".bin", dir=self.spill_dir,
+                                                       delete=False)
+      offset = self._spill_file.tell()
+      self._spill_file.write(block.tobytes())
+      self._spill_file.flush()
+      self.blocks[self.spilled] = np.memmap(self._spill_file.name, dtype=self.dtype, mode="r", offset=offset,
+                                            shape=block.shape)
+      self.spilled += 1
+
+  def view(self) -> np.ndarray:
+    """
+    전체 데이터의 연속 (채널 수, 샘플 수) 배열 (다음 append 전까지 캐시, 읽기 전용으로 사용)
+    - spill된 블록이 있으면 캐시하지 않음 (RAM 예산을 넘는 세션을 메모리에 붙잡아 두지 않도록)
+    """
+    if not self.blocks:
+      return self._current[:, :self._fill]
+    if self._view is not None:
+      return self._view
+    view = np.concatenate(self.blocks + [self._current[:, :self._fill]], axis=1)
+    if self.spilled == 0:
+      self._view = view
+    return view
+
+  def iter_blocks(self):
+    """
+    (채널 수, N) 블록을 처음부터 순서대로 반환 (spill 블록은 memmap 그대로, 마지막은 채워진 부분만)
+    """
+    for block in self.blocks:
+      yield block
+    if self._fill:
+      yield self._current[:, :self._fill]
+
+  def to_array(self) -> np.ndarray:
+    return self.view()
+
+  def slice(self, start, stop=None) -> np.ndarray:
+    """
+    [start, stop) 구간 (채널 수, stop-start) 배열 (걸친 블록만 읽음)
+    """
+    total = len(self)
+    start, stop, _ = slice(start, stop).indices(total)
+    stop = max(stop, start)
+    first, last = start // self.block_size, -(-stop // self.block_size)
+    parts = []
+    for b in range(first, last):
+      block = self.blocks[b] if b < len(self.blocks) else self._current[:, :self._fill]
+      lo = max(start - b * self.block_size, 0)
+      hi = min(stop - b * self.block_size, block.shape[1])
+      parts.append(block[:, lo:hi])
+    if not parts:
+      return np.empty((self.channel_count, 0), dtype=self.dtype)
+    return np.array(parts[0]) if len(parts) == 1 else np.concatenate(parts, axis=1)
+
+  def clear(self):
+    """
+    데이터 및 spill 파일 제거
+    """
+    self.blocks = []
+    self.spilled = 0
+    self._fill = 0
+    self._view = None
+    if self._spill_file is not None:
+      self._spill_file.close()
+      try:
+        os.remove(self._spill_file.name)
+      except OSError:
+        pass
+      self._spill_file = None
+
+  def close(self):
+    self.clear()
+
+  def __del__(self):
+    self.clear()
@@ -1,13 +1,27 @@
 import numpy as np
 from scipy import signal
+from scipy import fft as scipy_fft
+from src.recording import RecordingHandle, as_array
 import importlib.util
+import functools
 import os
+import time
+
+# FIR 필터 방식 자동 선택 기준 (benchmark_fir 결과 기준, 탭 수가 적거나 탭 수 × 블록 길이가 작으면 직접형 lfilter가 빠름)
+FIR_FFT_MIN_TAPS = 128
+FIR_FFT_MIN_WORK = 1 << 17
+FIR_METHODS = ("auto", "direct", "fft")
+# 스펙트럼 스케일/평균 방식
+SPECTRUM_SCALINGS = ("amplitude", "psd")
+SPECTRUM_AVERAGING = ("none", "linear", "exponential", "peak")
 
 # FFT 변환 함수
 def apply_fft(data: np.ndarray) -> np.ndarray:
   """
-  입력 데이터에 대해 FFT(고속 푸리에 변환) 수행
+  입력 데이터에 대해 FFT(고속 푸리에 변환) 수행 (RecordingHandle은 전체를 읽어 변환)
+  실수 신호의 윈도우/스케일 적용 스펙트럼은 apply_rfft, 실시간 평균 스펙트럼은 SpectrumAnalyzer 사용
   """
+  data = as_array(data)
   # 입력 타입 검사
   if not isinstance(data, np.ndarray):
     raise RuntimeError("입력 데이터는 numpy.ndarray여야 합니다.")
@@ -16,34 +30,435 @@ def apply_fft(data: np.ndarray) -> np.ndarray:
   except Exception as e:
     raise RuntimeError(f"FFT 처리 오류: {e}")
 
+# 윈도우/주파수 축 캐시 (같은 길이면 다시 만들지 않음)
+@functools.lru_cache(maxsize=32)
+def spectral_window(window, nfft) -> np.ndarray:
+  """
+  FFT용 주기 윈도우 (읽기 전용 캐시 배열, window는 "hann" 또는 ("kaiser", 8.0) 같은 튜플)
+  """
+  w = signal.get_window(window, nfft, fftbins=True)
+  w.flags.writeable = False
+  return w
+
+@functools.lru_cache(maxsize=32)
+def rfft_frequencies(nfft, fs) -> np.ndarray:
+  """rfft 결과 주파수 축 (Hz, 읽기 전용 캐시 배열)"""
+  freqs = scipy_fft.rfftfreq(nfft, 1.0 / fs)
+  freqs.flags.writeable = False
+  return freqs
+
+def _spectrum_scale(window, nfft, fs, scaling):
+  # |X|² → 단측 전력 스펙트럼 계수 (amplitude는 평균 후 제곱근을 취하면 사인파 피크 진폭, psd는 V²/Hz)
+  if scaling not in SPECTRUM_SCALINGS:
+    raise ValueError(f"지원하지 않는 스펙트럼 스케일입니다: {scaling} (가능: {', '.join(SPECTRUM_SCALINGS)})")
+  if scaling == "amplitude":
+    scale = np.full(nfft // 2 + 1, 4.0 / window.sum() ** 2)
+    scale[0] /= 4.0
+    if nfft % 2 == 0:
+      scale[-1] /= 4.0
+  else:
+    scale = np.full(nfft // 2 + 1, 2.0 / (fs * (window ** 2).sum()))
+    scale[0] /= 2.0
+    if nfft % 2 == 0:
+      scale[-1] /= 2.0
+  return scale
+
+def _window_key(window):
+  return tuple(window) if isinstance(window, list) else window
+
+# 실수 FFT 스펙트럼 함수
+def apply_rfft(data: np.ndarray, fs: float, window="hann", scaling="amplitude", nfft=None):
+  """
+  실수 데이터 단측 스펙트럼 (채널 전체를 한 번의 rfft로 계산)
+  반환: (주파수 축, 스펙트럼) - amplitude는 피크 진폭, psd는 전력 스펙트럼 밀도(V²/Hz)
+  """
+  data = as_array(data)
+  if not isinstance(data, np.ndarray):
+    raise RuntimeError("입력 데이터는 numpy.ndarray여야 합니다.")
+  try:
+    nfft = nfft or data.shape[-1]
+    segment = data[..., :nfft]
+    w = spectral_window(_window_key(window), nfft)
+    if segment.shape[-1] < nfft:
+      segment = np.pad(segment, [(0, 0)] * (data.ndim - 1) + [(0, nfft - segment.shape[-1])])
+    power = np.abs(scipy_fft.rfft(segment * w, axis=-1)) ** 2 * _spectrum_scale(w, nfft, fs, scaling)
+    return rfft_frequencies(nfft, float(fs)), np.sqrt(power) if scaling == "amplitude" else power
+  except Exception as e:
+    raise RuntimeError(f"스펙트럼 처리 오류: {e}")
+
+# 필터 설계 캐시 (같은 파라미터면 firwin/butter를 다시 실행하지 않음)
+@functools.lru_cache(maxsize=64)
+def design_fir(order, cutoff_hz, fs, btype="lowpass") -> np.ndarray:
+  """
+  FIR 탭 계수 (읽기 전용 캐시 배열, cutoff_hz는 대역 필터면 (저, 고) 튜플)
+  """
+  taps = signal.firwin(order, cutoff_hz, fs=fs, pass_zero=btype)
+  taps.flags.writeable = False
+  return taps
+
+@functools.lru_cache(maxsize=64)
+def design_iir_sos(order, cutoff_hz, fs, btype="lowpass") -> np.ndarray:
+  """
+  버터워스 IIR 2차 구간(SOS) 계수 (캐시 공유 배열이므로 수정 금지, 고차에서도 수치적으로 안정)
+  sosfilt가 쓰기 가능한 버퍼를 요구하므로 읽기 전용 플래그는 설정하지 않음
+  """
+  return signal.butter(order, cutoff_hz, fs=fs, btype=btype, output="sos")
+
+def _cutoff_key(cutoff_hz):
+  # 캐시 키로 쓸 수 있도록 대역 경계 목록은 튜플로 변환
+  return tuple(float(c) for c in cutoff_hz) if np.ndim(cutoff_hz) else float(cutoff_hz)
+
+def fir_use_fft(n_taps, n_samples, method="auto") -> bool:
+  """
+  FIR 필터 방식 선택 (True면 FFT 컨볼루션, False면 직접형 lfilter)
+  auto: 탭 수가 FIR_FFT_MIN_TAPS 이상이고 탭 수 × 블록 길이가 FIR_FFT_MIN_WORK 이상일 때 FFT
+  (직접형 O(N·탭), FFT O(N·log 프레임) + 블록마다 고정 비용)
+  """
+  if method not in FIR_METHODS:
+    raise ValueError(f"지원하지 않는 FIR 방식입니다: {method} (가능: {', '.join(FIR_METHODS)})")
+  if method != "auto":
+    return method == "fft"
+  return n_taps >= FIR_FFT_MIN_TAPS and n_taps * n_samples >= FIR_FFT_MIN_WORK
+
+def fir_fft_size(n_taps, n_samples) -> int:
+  """
+  overlap-save 프레임 길이 (탭 수의 약 8배, 블록이 더 짧으면 블록 한 번에 맞는 길이)
+  """
+  return scipy_fft.next_fast_len(min(n_samples + n_taps - 1, max(8 * n_taps, 1024)), real=True)
+
+def _overlap_save(taps, spectrum, nfft, ext, n_out):
+  # ext: (채널 수, 탭 수 - 1 + n_out) 입력 (앞부분은 이전 블록 꼬리), 프레임별 FFT 곱 후 유효 구간만 사용
+  overlap = len(taps) - 1
+  step = nfft - overlap
+  n_frames = -(-n_out // step)
+  pad = n_frames * step + overlap - ext.shape[1]
+  if pad > 0:
+    ext = np.pad(ext, ((0, 0), (0, pad)))
+  frames = np.lib.stride_tricks.sliding_window_view(ext, nfft, axis=-1)[:, ::step]
+  out = scipy_fft.irfft(scipy_fft.rfft(frames, axis=-1) * spectrum, nfft, axis=-1)[..., overlap:]
+  return out.reshape(ext.shape[0], -1)[:, :n_out]
+
 # FIR 저역통과 필터 적용 함수
-def apply_fir_lowpass(data: np.ndarray, cutoff_hz: float, fs: float, order=64) -> np.ndarray:
+def apply_fir_lowpass(data: np.ndarray, cutoff_hz: float, fs: float, order=64, method="auto") -> np.ndarray:
   """
-  FIR 저역통과 필터 적용
+  FIR 저역통과 필터 적용 (한 번에 처리하는 데이터용, 실시간 청크는 StreamingFIRFilter 사용)
+  method: "auto"(탭 수/길이로 선택), "direct"(lfilter), "fft"(overlap-add 컨볼루션, 결과는 lfilter와 동일)
   """
   try:
-    taps = signal.firwin(order, cutoff_hz, fs=fs)
-    return signal.lfilter(taps, 1.0, data, axis=-1)
+    taps = design_fir(order, _cutoff_key(cutoff_hz), float(fs))
+    data = as_array(data)
+    if not fir_use_fft(len(taps), data.shape[-1], method):
+      return signal.lfilter(taps, 1.0, data, axis=-1)
+    kernel = taps.reshape((1,) * (data.ndim - 1) + (-1,))
+    return signal.oaconvolve(data, kernel, mode="full", axes=-1)[..., :data.shape[-1]]
   except Exception as e:
     raise RuntimeError(f"FIR 필터 처리 오류: {e}")
 
 # IIR 저역통과 필터 적용 함수
 def apply_iir_lowpass(data: np.ndarray, cutoff_hz: float, fs: float, order=4) -> np.ndarray:
   """
-  IIR 저역통과 필터 적용
+  IIR 저역통과 필터 적용 (SOS 구조, 실시간 청크는 StreamingIIRFilter 사용)
   """
   try:
-    b, a = signal.butter(order, cutoff_hz, fs=fs, btype='low')
-    return signal.lfilter(b, a, data, axis=-1)
+    sos = design_iir_sos(order, _cutoff_key(cutoff_hz), float(fs))
+    return signal.sosfilt(sos, as_array(data), axis=-1)
   except Exception as e:
     raise RuntimeError(f"IIR 필터 처리 오류: {e}")
 
+class StreamingFilter:
+  """
+  청크 단위 실시간 필터 공통 부분
+  - 채널별 필터 상태(zi)를 청크 사이에 이어 받아 경계에서 끊김 없는 출력 (한 번에 필터링한 결과와 동일)
+  - 설계 계수는 파라미터별 캐시에서 가져오고, 청크마다 필터링 연산만 수행
+  - reset(): 상태 배열을 다시 만들지 않고 0(또는 첫 샘플 기준 정상 상태)으로 초기화
+  - configure(): 파라미터 변경 (상태 크기가 같으면 기존 배열 재사용)
+  """
+  def __init__(self, cutoff_hz, fs, order, btype="lowpass", channel_count=None):
+    self.channel_count = channel_count
+    self.zi = None
+    self._initial = None
+    self.configure(cutoff_hz, fs, order, btype)
+
+  def configure(self, cutoff_hz=None, fs=None, order=None, btype=None):
+    self.cutoff_hz = _cutoff_key(cutoff_hz) if cutoff_hz is not None else self.cutoff_hz
+    self.fs = float(fs) if fs is not None else self.fs
+    self.order = int(order) if order is not None else self.order
+    self.btype = btype or self.btype
+    try:
+      self._design()
+    except Exception as e:
+      raise RuntimeError(f"필터 설계 오류: {e}")
+    if self.zi is not None and self.zi.shape != self._state_shape(self.channel_count):
+      self.zi = None
+    self.reset()
+    return self
+
+  def reset(self, initial=None):
+    """
+    필터 상태 초기화
+    initial: 채널별 첫 샘플 값 (옵션, 주면 그 값이 계속 들어온 정상 상태로 시작해 시작 과도 응답 제거)
+    정상 상태는 다음 청크 처리 직전에 생성 (상태 배열이 아직 없거나 FIR 방식이 첫 청크에서 정해지는 경우 포함)
+    """
+    self._initial = None if initial is None else np.asarray(initial, dtype=np.float64).reshape(-1)
+    if self.zi is not None:
+      self.zi[...] = 0.0
+
+  def process(self, data: np.ndarray) -> np.ndarray:
+    """
+    (채널 수, N) 또는 단일 채널 (N,) 청크 필터링, 상태는 다음 청크로 이어짐
+    """
+    squeeze = data.ndim == 1
+    x = data.reshape(1, -1) if squeeze else data
+    if self.zi is None:
+      self.channel_count = x.shape[0]
+      self.zi = np.zeros(self._state_shape(self.channel_count))
+    elif x.shape[0] != self.channel_count:
+      raise ValueError(f"필터 채널 수({self.channel_count})와 데이터 채널 수({x.shape[0]})가 다릅니다.")
+    if x.shape[1] == 0:
+      return np.zeros(data.shape)
+    self._prepare(x)
+    if self._initial is not None:
+      self.zi[...] = self._steady_state(self._initial)
+      self._initial = None
+    y = self._filter(x)
+    return y.reshape(-1) if squeeze else y
+
+  def _prepare(self, x):
+    # 청크 필터링 직전 준비 (정상 상태 생성 전에 호출)
+    pass
+
+class StreamingFIRFilter(StreamingFilter):
+  """
+  청크 단위 FIR 필터
+  - direct: lfilter + 채널별 지연선 상태
+  - fft: overlap-save FFT 컨볼루션, 상태는 채널별 직전 입력 꼬리(탭 수 - 1 샘플)
+  - method="auto"면 탭 수와 block_size(예상 청크 길이, None이면 첫 청크 길이)로 방식 선택
+    (방식은 configure/첫 청크에서만 정하므로 청크 중간에 상태 의미가 바뀌지 않음)
+  btype: "lowpass"/"highpass"/"bandpass"/"bandstop" (대역 필터는 cutoff_hz=(저, 고))
+  """
+  def __init__(self, cutoff_hz, fs, order=64, btype="lowpass", channel_count=None, method="auto", block_size=None):
+    fir_use_fft(1, 0, method)
+    self.method = method
+    self.block_size = block_size
+    super().__init__(cutoff_hz, fs, order, btype, channel_count)
+
+  def configure(self, cutoff_hz=None, fs=None, order=None, btype=None, method=None, block_size=None):
+    if method is not None:
+      fir_use_fft(1, 0, method)
+      self.method = method
+    self.block_size = block_size or self.block_size
+    return super().configure(cutoff_hz, fs, order, btype)
+
+  def _design(self):
+    self.taps = design_fir(self.order, self.cutoff_hz, self.fs, self.btype)
+    self._zi_unit = signal.lfilter_zi(self.taps, 1.0)
+    self._spectra = {}  # FFT 길이 → 탭 스펙트럼
+    self.use_fft = None
+    if self.block_size is not None or self.method != "auto":
+      self.use_fft = fir_use_fft(len(self.taps), self.block_size or 0, self.method)
+
+  def _state_shape(self, channel_count):
+    return (channel_count, len(self.taps) - 1)
+
+  def _steady_state(self, initial):
+    if self.use_fft:
+      return np.repeat(initial[:, None], len(self.taps) - 1, axis=1)
+    return initial[:, None] * self._zi_unit[None, :]
+
+  def _prepare(self, x):
+    if self.use_fft is None:
+      # block_size 없이 auto면 첫 청크 길이로 방식 결정 (reset(initial)의 정상 상태는 방식이 정해진 뒤 생성)
+      self.block_size = x.shape[1]
+      self.use_fft = fir_use_fft(len(self.taps), self.block_size, self.method)
+
+  def _filter(self, x):
+    if not self.use_fft:
+      y, self.zi[...] = signal.lfilter(self.taps, 1.0, x, axis=-1, zi=self.zi)
+      return y
+    n = x.shape[1]
+    ext = np.concatenate([self.zi, x], axis=1)
+    nfft = fir_fft_size(len(self.taps), n)
+    spectrum = self._spectra.get(nfft)
+    if spectrum is None:
+      spectrum = self._spectra[nfft] = scipy_fft.rfft(self.taps, nfft)
+    y = _overlap_save(self.taps, spectrum, nfft, ext, n)
+    self.zi[...] = ext[:, n:]
+    return y
+
+class StreamingIIRFilter(StreamingFilter):
+  """
+  청크 단위 버터워스 IIR 필터 (sosfilt + 구간/채널별 상태)
+  btype: "lowpass"/"highpass"/"bandpass"/"bandstop" (대역 필터는 cutoff_hz=(저, 고))
+  """
+  def __init__(self, cutoff_hz, fs, order=4, btype="lowpass", channel_count=None):
+    super().__init__(cutoff_hz, fs, order, btype, channel_count)
+
+  def _design(self):
+    self.sos = design_iir_sos(self.order, self.cutoff_hz, self.fs, self.btype)
+    self._zi_unit = signal.sosfilt_zi(self.sos)
+
+  def _state_shape(self, channel_count):
+    return (self.sos.shape[0], channel_count, 2)
+
+  def _steady_state(self, initial):
+    return self._zi_unit[:, None, :] * initial[None, :, None]
+
+  def _filter(self, x):
+    y, self.zi[...] = signal.sosfilt(self.sos, x, axis=-1, zi=self.zi)
+    return y
+
+class SpectrumAnalyzer:
+  """
+  실시간 스트림 Welch 스펙트럼 분석기
+  - push(chunk): 청크를 이어 붙여 nfft 길이, overlap 비율로 겹친 구간을 잘라 채널/구간 전체를 한 번의 rfft로 계산
+    (청크 경계에 걸친 구간은 남은 꼬리 샘플로 이어서 처리하므로 청크 크기와 무관하게 같은 구간 분할)
+  - averaging: "none"(마지막 구간), "linear"(최근 n_averages 구간 평균), "exponential"(가중치 1/n_averages),
+    "peak"(최댓값 유지)
+  - update_rate(Hz, 데이터 시간 기준)마다 한 번 결과를 내므로 청크 크기와 무관하게 갱신 주기 일정
+  - 윈도우/주파수 축/스케일 계수는 설정이 바뀔 때만 계산
+  """
+  def __init__(self, fs, nfft=1024, overlap=0.5, window="hann", scaling="psd", averaging="linear", n_averages=8,
+               update_rate=10.0, channel_count=None):
+    self.channel_count = channel_count
+    self.fs = float(fs)
+    self.nfft = nfft
+    self.overlap = overlap
+    self.window = window
+    self.scaling = scaling
+    self.averaging = averaging
+    self.n_averages = n_averages
+    self.update_rate = update_rate
+    self.configure()
+
+  def configure(self, **params):
+    """
+    파라미터 변경 (fs, nfft, overlap, window, scaling, averaging, n_averages, update_rate) 후 평균 초기화
+    """
+    for name, value in params.items():
+      if not hasattr(self, name) or name.startswith("_"):
+        raise ValueError(f"알 수 없는 스펙트럼 파라미터입니다: {name}")
+      setattr(self, name, value)
+    if self.averaging not in SPECTRUM_AVERAGING:
+      raise ValueError(f"지원하지 않는 평균 방식입니다: {self.averaging} (가능: {', '.join(SPECTRUM_AVERAGING)})")
+    if not 0.0 <= self.overlap < 1.0:
+      raise ValueError(f"overlap은 0 이상 1 미만이어야 합니다. 현재: {self.overlap}")
+    if self.nfft < 2 or self.n_averages < 1 or self.update_rate <= 0:
+      raise ValueError("nfft는 2 이상, n_averages는 1 이상, update_rate는 0보다 커야 합니다.")
+    self.fs = float(self.fs)
+    self.hop = max(self.nfft - int(round(self.nfft * self.overlap)), 1)
+    self.update_interval = max(int(round(self.fs / self.update_rate)), 1)
+    try:
+      self._window = spectral_window(_window_key(self.window), self.nfft)
+    except Exception as e:
+      raise ValueError(f"윈도우 생성 오류: {e}")
+    self._scale = _spectrum_scale(self._window, self.nfft, self.fs, self.scaling)
+    self.frequencies = rfft_frequencies(self.nfft, self.fs)
+    self.reset()
+    return self
+
+  def reset(self):
+    """평균/꼬리 샘플/갱신 카운터 초기화"""
+    self._tail = None
+    self._history = None   # linear: (n_averages, 채널 수, 주파수 수) 링
+    self._history_count = 0
+    self._average = None
+    self._pending = 0      # 마지막 결과 이후 들어온 샘플 수
+    self.segments = 0      # 지금까지 처리한 구간 수
+    self.updates = 0
+
+  def push(self, data: np.ndarray):
+    """
+    (채널 수, N) 또는 단일 채널 (N,) 청크 입력
+    반환: 이번 청크로 갱신 시점이 지나면 (주파수 축, 스펙트럼), 아니면 None
+    (한 청크가 여러 갱신 주기에 걸쳐도 최신 결과 하나만 반환)
+    """
+    x = data.reshape(1, -1) if data.ndim == 1 else data
+    if self.channel_count is None:
+      self.channel_count = x.shape[0]
+    elif x.shape[0] != self.channel_count:
+      raise ValueError(f"분석기 채널 수({self.channel_count})와 데이터 채널 수({x.shape[0]})가 다릅니다.")
+    ext = x if self._tail is None else np.concatenate([self._tail, x], axis=1)
+    n_segments = (ext.shape[1] - self.nfft) // self.hop + 1 if ext.shape[1] >= self.nfft else 0
+    if n_segments:
+      frames = np.lib.stride_tricks.sliding_window_view(ext, self.nfft, axis=-1)[:, ::self.hop][:, :n_segments]
+      power = np.abs(scipy_fft.rfft(frames * self._window, axis=-1)) ** 2 * self._scale
+      self._accumulate(power)
+    self._tail = np.array(ext[:, n_segments * self.hop:])
+    self._pending += x.shape[1]
+    if self._pending < self.update_interval or self._average is None:
+      return None
+    self._pending %= self.update_interval
+    self.updates += 1
+    return self.spectrum()
+
+  def _accumulate(self, power):
+    # power: (채널 수, 구간 수, 주파수 수), 구간 순서대로 평균에 반영
+    n = power.shape[1]
+    self.segments += n
+    if self.averaging == "none":
+      self._average = power[:, -1]
+    elif self.averaging == "peak":
+      peak = power.max(axis=1)
+      self._average = peak if self._average is None else np.maximum(self._average, peak)
+    elif self.averaging == "exponential":
+      alpha = 1.0 / self.n_averages
+      if self._average is None:
+        self._average, power, n = power[:, 0], power[:, 1:], n - 1
+      weights = alpha * (1.0 - alpha) ** np.arange(n - 1, -1, -1)
+      self._average = (1.0 - alpha) ** n * self._average + np.einsum("k,ckf->cf", weights, power)
+    else:
+      if self._history is None:
+        self._history = np.zeros((self.n_averages, power.shape[0], power.shape[2]))
+      for k in range(max(n - self.n_averages, 0), n):
+        self._history[self._history_count % self.n_averages] = power[:, k]
+        self._history_count += 1
+      filled = min(self._history_count, self.n_averages)
+      self._average = self._history.sum(axis=0) / filled if filled < self.n_averages else self._history.mean(axis=0)
+
+  def spectrum(self):
+    """
+    현재 평균 스펙트럼 (주파수 축, (채널 수, 주파수 수)), 아직 구간이 없으면 None
+    """
+    if self._average is None:
+      return None
+    return self.frequencies, np.sqrt(self._average) if self.scaling == "amplitude" else self._average.copy()
+
+def benchmark_fir(tap_counts=(16, 32, 64, 128, 256, 512, 1024, 2048, 4096), block_sizes=(64, 256, 1024, 8192),
+                  channel_count=4, n_samples=65536, repeat=3) -> list:
+  """
+  직접형/FFT 방식 청크 단위 FIR 처리 시간 비교 (탭 수 × 블록 길이별 최솟값, 초)
+  반환: [{"taps", "block", "direct", "fft", "faster"}, ...] (FIR_FFT_MIN_TAPS/FIR_FFT_MIN_WORK 조정 근거)
+  """
+  data = np.random.default_rng(0).standard_normal((channel_count, n_samples))
+  rows = []
+  for taps in tap_counts:
+    for block in block_sizes:
+      row = {"taps": taps, "block": block}
+      for method in ("direct", "fft"):
+        best = None
+        for _ in range(repeat):
+          filt = StreamingFIRFilter(0.1, 1.0, order=taps, method=method)
+          start = time.perf_counter()
+          for offset in range(0, n_samples, block):
+            filt.process(data[:, offset:offset + block])
+          elapsed = time.perf_counter() - start
+          best = elapsed if best is None else min(best, elapsed)
+        row[method] = best
+      row["faster"] = "fft" if row["fft"] < row["direct"] else "direct"
+      rows.append(row)
+  return rows
+
 # 통계 분석 함수 (평균, 표준편차)
 def calc_stats(data: np.ndarray) -> dict:
   """
   데이터의 평균, 표준편차 등 통계값 반환
+  RecordingHandle은 블록 단위로 읽으며 누적 (전체를 메모리에 올리지 않음)
   """
   try:
+    if isinstance(data, RecordingHandle):
+      stats = RunningStats(data.channel_count).update(data)
+      result = {'mean': stats.mean, 'std': stats.std, 'min': stats.min, 'max': stats.max}
+      return {key: value[0] for key, value in result.items()} if data.ndim == 1 else result
     return {
       'mean': np.mean(data, axis=-1),
       'std': np.std(data, axis=-1),
@@ -53,19 +468,351 @@ def calc_stats(data: np.ndarray) -> dict:
   except Exception as e:
     raise RuntimeError(f"통계 분석 오류: {e}")
 
+# 스트리밍 통계 누적기
+class RunningStats:
+  """
+  채널별 스트리밍 통계 (Welford/Chan 병합 방식 평균·분산, 최소/최대, RMS, 개수)
+  - update(data): (채널 수, N) 청크를 한 번의 벡터 연산으로 요약한 뒤 누적값과 병합
+  - merge(other): 다른 누적기(다른 청크/구간)와 병합, merged_channels(): 전체 채널을 하나로 병합
+  - 조회는 누적값으로 O(1) 계산 (배열을 다시 훑지 않음)
+  """
+  def __init__(self, channel_count=1):
+    self.channel_count = channel_count
+    self.count = 0
+    self._mean = np.zeros(channel_count)
+    self._m2 = np.zeros(channel_count)       # 평균으로부터의 편차 제곱합
+    self._sumsq = np.zeros(channel_count)    # 제곱합 (RMS용)
+    self._min = np.full(channel_count, np.inf)
+    self._max = np.full(channel_count, -np.inf)
+
+  @classmethod
+  def from_data(cls, data: np.ndarray):
+    """청크 하나(또는 RecordingHandle 전체)의 통계"""
+    if isinstance(data, RecordingHandle):
+      return cls(data.channel_count).update(data)
+    data = np.atleast_2d(data)
+    stats = cls(data.shape[0])
+    stats.update(data)
+    return stats
+
+  def update(self, data: np.ndarray):
+    if isinstance(data, RecordingHandle):
+      # 기록 핸들은 블록 단위로 읽어 병합
+      for _, block in data.iter_blocks():
+        self.update(block)
+      return self
+    data = np.atleast_2d(data)
+    if data.shape[0] != self.channel_count:
+      raise ValueError(f"통계 채널 수({self.channel_count})와 데이터 채널 수({data.shape[0]})가 다릅니다.")
+    n = data.shape[1]
+    if n == 0:
+      return self
+    chunk = RunningStats(self.channel_count)
+    chunk.count = n
+    chunk._mean = data.mean(axis=1)
+    deviation = data - chunk._mean[:, None]
+    chunk._m2 = np.einsum("ij,ij->i", deviation, deviation)
+    chunk._sumsq = np.einsum("ij,ij->i", data, data, dtype=np.float64)
+    chunk._min = data.min(axis=1).astype(np.float64)
+    chunk._max = data.max(axis=1).astype(np.float64)
+    return self.merge(chunk)
+
+  def merge(self, other):
+    """
+    다른 누적기를 이 누적기에 병합 (병렬 분산 결합 공식)
+    """
+    if other.count == 0:
+      return self
+    if self.count == 0:
+      self.count = other.count
+      self._mean, self._m2, self._sumsq = other._mean.copy(), other._m2.copy(), other._sumsq.copy()
+      self._min, self._max = other._min.copy(), other._max.copy()
+      return self
+    total = self.count + other.count
+    delta = other._mean - self._mean
+    self._mean = self._mean + delta * (other.count / total)
+    self._m2 = self._m2 + other._m2 + delta * delta * (self.count * other.count / total)
+    self._sumsq = self._sumsq + other._sumsq
+    self._min = np.minimum(self._min, other._min)
+    self._max = np.maximum(self._max, other._max)
+    self.count = total
+    return self
+
+  def merged_channels(self):
+    """
+    모든 채널을 하나의 채널로 병합한 누적기
+    """
+    merged = RunningStats(1)
+    for ch in range(self.channel_count):
+      single = RunningStats(1)
+      single.count = self.count
+      single._mean, single._m2, single._sumsq = self._mean[ch:ch + 1], self._m2[ch:ch + 1], self._sumsq[ch:ch + 1]
+      single._min, single._max = self._min[ch:ch + 1], self._max[ch:ch + 1]
+      merged.merge(single)
+    return merged
+
+  def copy(self):
+    return RunningStats(self.channel_count).merge(self)
+
+  @property
+  def mean(self):
+    return self._mean.copy() if self.count else np.full(self.channel_count, np.nan)
+
+  @property
+  def variance(self):
+    """모분산 (np.var와 동일)"""
+    return self._m2 / self.count if self.count else np.full(self.channel_count, np.nan)
+
+  @property
+  def std(self):
+    return np.sqrt(self.variance)
+
+  @property
+  def rms(self):
+    return np.sqrt(self._sumsq / self.count) if self.count else np.full(self.channel_count, np.nan)
+
+  @property
+  def min(self):
+    return self._min.copy() if self.count else np.full(self.channel_count, np.nan)
+
+  @property
+  def max(self):
+    return self._max.copy() if self.count else np.full(self.channel_count, np.nan)
+
+  def snapshot(self) -> dict:
+    """
+    calc_stats와 같은 키(mean/std/min/max) + rms/count를 갖는 채널별 통계
+    """
+    return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max, "rms": self.rms}
+
+class WindowedStats:
+  """
+  최근 window 샘플 구간의 슬라이딩 통계 (예: 플롯에 보이는 버퍼)
+  - 청크 통계를 block_size 샘플 단위 블록으로 묶어 보관하고, window를 벗어난 블록은 제거
+  - 구간 경계는 블록 단위 근사 (최근 window ~ window + block_size 샘플)
+  - 조회 시 블록 수(≈ window / block_size)만큼 병합 후 캐시
+  """
+  def __init__(self, channel_count=1, window=10000, block_size=None):
+    self.channel_count = channel_count
+    self.window = window
+    self.block_size = block_size or max(window // 32, 1)
+    self._blocks = []
+    self._count = 0
+    self._cached = None
+
+  def update(self, data: np.ndarray):
+    data = np.atleast_2d(data)
+    if data.shape[1] > self.window:
+      data = data[:, -self.window:]
+    chunk = RunningStats(self.channel_count).update(data)
+    if self._blocks and self._blocks[-1].count < self.block_size:
+      self._blocks[-1].merge(chunk)
+    else:
+      self._blocks.append(chunk)
+    self._count += chunk.count
+    while len(self._blocks) > 1 and self._count - self._blocks[0].count >= self.window:
+      self._count -= self._blocks.pop(0).count
+    self._cached = None
+    return self
+
+  def clear(self):
+    self._blocks = []
+    self._count = 0
+    self._cached = None
+
+  def stats(self) -> RunningStats:
+    """구간 통계 (RunningStats)"""
+    if self._cached is None:
+      self._cached = RunningStats(self.channel_count)
+      for block in self._blocks:
+        self._cached.merge(block)
+    return self._cached
+
+  def snapshot(self) -> dict:
+    return self.stats().snapshot()
+
+class PluginStats:
+  """플러그인별 호출 지연 시간 누적 (초)"""
+  __slots__ = ("calls", "total", "last", "max", "loads")
+
+  def __init__(self):
+    self.calls = 0
+    self.total = 0.0
+    self.last = 0.0
+    self.max = 0.0
+    self.loads = 0
+
+  def record(self, elapsed):
+    self.calls += 1
+    self.total += elapsed
+    self.last = elapsed
+    self.max = max(self.max, elapsed)
+
+  @property
+  def mean(self):
+    return self.total / self.calls if self.calls else 0.0
+
+def validate_plugin_output(result, data, same_length=False) -> np.ndarray:
+  """
+  플러그인 출력 검사: 숫자형 ndarray, 입력과 같은 차원/채널 수 (same_length면 shape까지 같아야 함)
+  스트리밍 플러그인은 내부 버퍼링으로 청크마다 샘플 수가 달라도 됨
+  """
+  if not isinstance(result, np.ndarray):
+    raise RuntimeError(f"플러그인 출력은 numpy.ndarray여야 합니다. 현재: {type(result).__name__}")
+  if not (np.issubdtype(result.dtype, np.number) or result.dtype == np.bool_):
+    raise RuntimeError(f"플러그인 출력 dtype이 숫자형이 아닙니다: {result.dtype}")
+  if result.ndim != data.ndim or (data.ndim == 2 and result.shape[0] != data.shape[0]):
+    raise RuntimeError(f"플러그인 출력 shape {result.shape}가 입력 shape {data.shape}와 맞지 않습니다.")
+  if same_length and result.shape != data.shape:
+    raise RuntimeError(f"플러그인 출력 shape {result.shape}가 입력 shape {data.shape}와 다릅니다.")
+  return result
+
+class PluginRegistry:
+  """
+  외부 파이썬 플러그인 캐시
+  - 파일마다 한 번만 import하여 모듈(및 모듈 전역 상태)을 유지
+  - 파일 수정 시각/크기가 바뀐 경우에만 다시 import (기본은 호출마다 stat 한 번, check_interval초를 주면 그 간격으로만 확인)
+  - 일괄 계약: process(data) → 입력과 같은 shape의 배열 (run)
+  - 스트리밍 계약: init(config), process(chunk), flush() (open_stream, flush는 선택)
+  - 플러그인별 호출 지연 시간 기록 (latency_report)
+  """
+  def __init__(self, check_interval=0.0):
+    self.check_interval = check_interval
+    self._modules = {}   # 절대 경로 → (모듈, 파일 서명, 마지막 확인 시각)
+    self._stats = {}     # 절대 경로 → PluginStats
+    self._loads = 0
+
+  def load(self, plugin_path):
+    """
+    플러그인 모듈 (캐시, 파일이 바뀌었으면 다시 import)
+    """
+    path = os.path.abspath(plugin_path)
+    cached = self._modules.get(path)
+    now = time.monotonic()
+    if cached is not None and now - cached[2] < self.check_interval:
+      return cached[0]
+    try:
+      info = os.stat(path)
+    except OSError:
+      raise FileNotFoundError(f"플러그인 파일이 존재하지 않습니다: {plugin_path}")
+    signature = (info.st_mtime_ns, info.st_size)
+    if cached is not None and cached[1] == signature:
+      self._modules[path] = (cached[0], signature, now)
+      return cached[0]
+    try:
+      self._loads += 1
+      spec = importlib.util.spec_from_file_location(f"daq_plugin_{self._loads}", path)
+      module = importlib.util.module_from_spec(spec)
+      spec.loader.exec_module(module)
+    except Exception as e:
+      raise RuntimeError(f"플러그인 로딩 오류: {e}")
+    if not callable(getattr(module, "process", None)):
+      raise RuntimeError("플러그인에 process 함수가 없습니다.")
+    self._modules[path] = (module, signature, now)
+    self.stats(path).loads += 1
+    return module
+
+  def run(self, plugin_path, data: np.ndarray) -> np.ndarray:
+    """
+    일괄 계약 플러그인 실행 (process(data), 출력 shape는 입력과 같아야 함)
+    """
+    module = self.load(plugin_path)
+    return self._call(plugin_path, module.process, data, same_length=True)
+
+  def open_stream(self, plugin_path, config=None):
+    """스트리밍 계약 플러그인 실행기 생성 (PluginStream)"""
+    return PluginStream(self, plugin_path, config)
+
+  def _call(self, plugin_path, func, data, same_length=False):
+    start = time.perf_counter()
+    try:
+      result = func(data)
+    except Exception as e:
+      raise RuntimeError(f"플러그인 실행 오류: {e}")
+    finally:
+      self.stats(plugin_path).record(time.perf_counter() - start)
+    return validate_plugin_output(result, data, same_length)
+
+  def stats(self, plugin_path) -> PluginStats:
+    return self._stats.setdefault(os.path.abspath(plugin_path), PluginStats())
+
+  def latency_report(self) -> list:
+    """
+    플러그인별 [{"path", "calls", "loads", "mean_ms", "max_ms", "last_ms"}]
+    """
+    return [{"path": path, "calls": s.calls, "loads": s.loads, "mean_ms": s.mean * 1e3, "max_ms": s.max * 1e3,
+             "last_ms": s.last * 1e3} for path, s in self._stats.items()]
+
+  def unload(self, plugin_path=None):
+    """캐시 제거 (plugin_path가 None이면 전체)"""
+    if plugin_path is None:
+      self._modules.clear()
+    else:
+      self._modules.pop(os.path.abspath(plugin_path), None)
+
+class PluginStream:
+  """
+  청크 단위 플러그인 실행기
+  - 스트리밍 계약(init이 있는 플러그인): 처음에 init(config) 한 번, 청크마다 process(chunk), 종료 시 flush()
+  - 일괄 계약 플러그인은 청크마다 process(chunk) (출력 shape는 청크와 같아야 함)
+  - 실행 중 파일이 바뀌면 새 모듈로 교체하고 init(config)을 다시 호출 (이전 상태는 버림)
+  - 상태는 모듈 전역에 있으므로 같은 파일을 여러 스트림에서 동시에 쓰면 상태를 공유
+  """
+  def __init__(self, registry, plugin_path, config=None):
+    self.registry = registry
+    self.plugin_path = plugin_path
+    self.config = dict(config or {})
+    self.module = None
+    self._ensure_module()
+
+  @property
+  def streaming(self):
+    return callable(getattr(self.module, "init", None))
+
+  def _ensure_module(self):
+    module = self.registry.load(self.plugin_path)
+    if module is not self.module:
+      self.module = module
+      if self.streaming:
+        try:
+          module.init(self.config)
+        except Exception as e:
+          raise RuntimeError(f"플러그인 초기화 오류: {e}")
+    return module
+
+  def process(self, chunk: np.ndarray) -> np.ndarray:
+    module = self._ensure_module()
+    return self.registry._call(self.plugin_path, module.process, chunk, same_length=not self.streaming)
+
+  def flush(self):
+    """
+    남은 출력 반환 (flush가 없거나 None을 반환하면 None)
+    """
+    flush = getattr(self.module, "flush", None)
+    if not callable(flush):
+      return None
+    try:
+      return flush()
+    except Exception as e:
+      raise RuntimeError(f"플러그인 flush 오류: {e}")
+
+  def reset(self):
+    """상태 초기화 (스트리밍 플러그인은 init(config) 다시 호출)"""
+    self.module = None
+    self._ensure_module()
+
+# 기본 플러그인 레지스트리 (run_plugin, 처리 그래프 plugin 단계가 공유)
+PLUGINS = PluginRegistry()
+
 # 외부 파이썬 플러그인(스크립트) 로딩 및 실행 함수
 def run_plugin(plugin_path: str, data: np.ndarray) -> np.ndarray:
   """
-  플러그인 파이썬 파일에서 process(data) 함수를 실행
+  플러그인 파이썬 파일에서 process(data) 함수를 실행 (모듈은 PLUGINS에 캐시, 파일이 바뀌면 다시 로딩)
   """
-  if not os.path.exists(plugin_path):
-    raise FileNotFoundError(f"플러그인 파일이 존재하지 않습니다: {plugin_path}")
-  try:
-    spec = importlib.util.spec_from_file_location("plugin_module", plugin_path)
-    plugin = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(plugin)
-    if not hasattr(plugin, "process"):
-      raise AttributeError("플러그인에 process(data) 함수가 없습니다.")
-    return plugin.process(data)
-  except Exception as e:
-    raise RuntimeError(f"플러그인 실행 오류: {e}") 
\ No newline at end of file
+  return PLUGINS.run(plugin_path, data)
+
+if __name__ == "__main__":
+  # python -m src.signal_pipeline: FIR 방식 교차점 벤치마크 출력
+  print(f"{'탭 수':>6} {'블록':>6} {'직접형(ms)':>11} {'FFT(ms)':>9}  빠른 방식")
+  for row in benchmark_fir():
+    print(f"{row['taps']:>6} {row['block']:>6} {row['direct'] * 1e3:>11.2f} {row['fft'] * 1e3:>9.2f}  {row['faster']}")
@@ -0,0 +1,34 @@
+from PySide6.QtCore import QThread, Signal
+from src.signal_pipeline import RunningStats
+
+class RecordingStatsWorker(QThread):
+  """
+  불러온 기록 파일 전체 통계를 백그라운드 스레드에서 블록 단위로 계산
+  - 파일 열기(GUI 스레드)는 전체를 훑지 않고 바로 끝나며, 통계는 계산이 끝나면 stats_ready로 전달
+  - cancel(): 다음 블록 전에 중단 (핸들을 닫기 전에 cancel() 후 wait() 호출)
+  """
+  stats_ready = Signal(object)  # RunningStats
+  error_occurred = Signal(str)
+
+  def __init__(self, recording, block_samples=65536, parent=None):
+    super().__init__(parent)
+    self.recording = recording
+    self.block_samples = block_samples
+    self._cancelled = False
+
+  def cancel(self):
+    self._cancelled = True
+
+  def run(self):
+    stats = RunningStats(self.recording.channel_count)
+    try:
+      for _, block in self.recording.iter_blocks(self.block_samples):
+        if self._cancelled:
+          return
+        stats.update(block)
+    except Exception as e:
+      if not self._cancelled:
+        self.error_occurred.emit(f"기록 통계 계산 오류: {e}")
+      return
+    if not self._cancelled:
+      self.stats_ready.emit(stats)
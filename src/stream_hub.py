@@ -0,0 +1,174 @@
+from PySide6.QtCore import QObject, Signal
+from src.timebase import ChunkTimebase
+from src.scaling import scale_if_raw
+import numpy as np
+import bisect
+
+class StreamCursor:
+  """
+  스트림 허브 소비자별 읽기 커서
+  - position: 다음에 읽을 허브 절대 샘플 인덱스
+  - decimation: 읽을 때 솎아낼 간격 (허브 절대 인덱스 기준으로 정렬되어 읽기 단위와 무관하게 일정)
+  - behind: 링 버퍼 용량을 넘게 밀려 읽지 못하고 건너뛴 누적 샘플 수
+  """
+  def __init__(self, hub, name, decimation=1):
+    if decimation < 1:
+      raise ValueError(f"decimation은 1 이상이어야 합니다: {decimation}")
+    self.hub = hub
+    self.name = name
+    self.decimation = int(decimation)
+    self.position = hub.write_index
+    self.behind = 0
+
+  @property
+  def lag(self):
+    """아직 읽지 않은 샘플 수"""
+    return self.hub.write_index - self.position
+
+  def read(self, max_samples=None, scaling=None):
+    """
+    마지막으로 읽은 위치 이후의 샘플을 한 번에 읽음
+    - 반환: ((채널 수, N) 배열 복사본, ChunkTimebase) (읽을 데이터가 없으면 N=0)
+    - max_samples: 한 번에 읽을 최대 샘플 수 (솎아내기 전 기준, 나머지는 다음 읽기로)
+    - scaling: 원시(int16) 허브에서 전압으로 변환해 읽을 때 ChannelScaling (솎아낸 뒤 변환)
+    - 링 버퍼에서 이미 덮어써진 구간은 건너뛰고 hub.fell_behind 신호로 알림
+    """
+    stop = self.hub.write_index
+    if max_samples is not None:
+      stop = min(stop, self.position + max_samples)
+    start, data = self.hub.read_available(self.position, stop)
+    if start > self.position:
+      self._fell_behind(start - self.position)
+    # 허브 절대 인덱스가 decimation 배수인 샘플만 선택
+    first = -start % self.decimation
+    if self.decimation > 1:
+      data = data[:, first::self.decimation]
+    self.position = stop
+    return scale_if_raw(data, scaling), self.hub.timebase_at(start + first, data.shape[1], self.decimation)
+
+  def skip_to_latest(self):
+    """읽지 않은 데이터를 버리고 최신 위치로 이동"""
+    self.position = self.hub.write_index
+
+  def _fell_behind(self, n_samples):
+    self.behind += n_samples
+    self.hub.fell_behind.emit(self.name, n_samples)
+
+class StreamHub(QObject):
+  """
+  단일 생산자 / 다중 소비자 실시간 데이터 허브
+  - 미리 할당한 (채널 수, 용량) 링 버퍼에 수집 스레드가 기록 (DaqDataCollector.add_sink(hub.write))
+  - 소비자(플롯/기록/DSP/통계/외부 구독자)는 subscribe()로 각자 커서를 받아 자기 주기/솎아내기로 읽음
+  - 청크마다 큐에 쌓이는 시그널 대신, 밀린 소비자에게 fell_behind(이름, 건너뛴 샘플 수)를 한 번 알림
+  - 생산자는 데이터를 쓴 뒤 write_index를 갱신하고, 소비자는 복사 후 덮어쓰기 여부를 다시 확인 (락 없음)
+  - dtype: 원시 모드 수집은 np.int16으로 저장 (변환은 읽는 쪽에서 필요할 때만)
+  """
+  fell_behind = Signal(str, int)
+
+  def __init__(self, channel_count=1, capacity=100000, dtype=np.float64, parent=None):
+    super().__init__(parent)
+    self.channel_count = channel_count
+    self.capacity = capacity
+    self.buffer = np.zeros((channel_count, capacity), dtype=dtype)
+    self.write_index = 0  # 지금까지 기록된 채널당 샘플 수 (허브 절대 인덱스)
+    self._reserved = 0  # 기록 중인 청크까지 포함한 인덱스 (소비자의 덮어쓰기 확인용)
+    self.cursors = {}
+    self._reset_timebase()
+
+  def _reset_timebase(self):
+    # 허브 절대 인덱스 → 수집 샘플 인덱스 오프셋 구간 (유실(gap) 발생 시에만 새 구간 추가)
+    self._segment_starts = [0]
+    self._segment_offsets = [0]
+    self._t0 = 0.0
+    self._dt = 1.0
+
+  def reset(self):
+    """새 수집 시작 시 버퍼/커서 위치 초기화"""
+    self.write_index = self._reserved = 0
+    self._reset_timebase()
+    for cursor in self.cursors.values():
+      cursor.position = 0
+      cursor.behind = 0
+
+  def subscribe(self, name, decimation=1):
+    """
+    소비자 커서 등록 (같은 이름이면 교체), 현재 위치부터 읽음
+    """
+    cursor = StreamCursor(self, name, decimation)
+    self.cursors[name] = cursor
+    return cursor
+
+  def unsubscribe(self, name):
+    self.cursors.pop(name, None)
+
+  def write(self, data: np.ndarray, timebase=None):
+    """
+    생산자 전용: 청크를 링 버퍼에 복사 (DaqDataCollector 싱크 시그니처와 동일)
+    - data: (채널 수, N) 또는 단일 채널 (N,) 배열
+    - timebase: 청크의 ChunkTimebase (솎아낸 표시용 청크는 받지 않음)
+    """
+    if data.ndim == 1:
+      data = data.reshape(1, -1)
+    if data.shape[0] != self.channel_count:
+      raise ValueError(f"입력 데이터 shape는 ({self.channel_count}, N)이어야 합니다. 현재: {data.shape}")
+    n = data.shape[1]
+    start = self.write_index
+    if timebase is not None:
+      self._t0, self._dt = timebase.t0, timebase.dt
+      offset = timebase.start_sample - start
+      if offset != self._segment_offsets[-1]:
+        self._segment_starts.append(start)
+        self._segment_offsets.append(offset)
+      # 링 버퍼에서 밀려난 구간 정보 정리
+      while len(self._segment_starts) > 1 and self._segment_starts[1] <= start - self.capacity:
+        del self._segment_starts[0], self._segment_offsets[0]
+    if n > self.capacity:
+      data = data[:, -self.capacity:]
+      start += n - self.capacity
+    self._reserved = self.write_index + n
+    pos = start % self.capacity
+    first = min(data.shape[1], self.capacity - pos)
+    self.buffer[:, pos:pos + first] = data[:, :first]
+    self.buffer[:, :data.shape[1] - first] = data[:, first:]
+    self.write_index += n
+
+  def read_available(self, start, stop):
+    """
+    [start, stop) 구간 중 아직 링 버퍼에 남아 있는 부분을 복사해 반환
+    - 반환: (실제 시작 인덱스, (채널 수, N) 배열)
+    """
+    start = max(start, stop - self.capacity)
+    data = self._copy(start, stop)
+    # 복사 중 생산자가 덮어쓴 앞부분은 버림
+    overwritten = self._reserved - self.capacity - start
+    if overwritten > 0:
+      overwritten = min(overwritten, stop - start)
+      data = data[:, overwritten:]
+      start += overwritten
+    return start, data
+
+  def read_range(self, start, stop):
+    """
+    [start, stop) 구간을 한 번에 읽음 (이미 덮어써진 구간이 포함되면 ValueError)
+    """
+    if stop > self.write_index or start > stop:
+      raise ValueError(f"잘못된 읽기 구간입니다: [{start}, {stop}) (기록된 샘플 수: {self.write_index})")
+    actual, data = self.read_available(start, stop)
+    if actual != start:
+      raise ValueError(f"요청 구간의 앞 {actual - start} 샘플은 이미 덮어써졌습니다.")
+    return data
+
+  def timebase_at(self, start, n_samples, step=1):
+    """
+    허브 절대 인덱스 start부터 n_samples개 (step 간격) 구간의 ChunkTimebase
+    """
+    segment = max(bisect.bisect_right(self._segment_starts, start) - 1, 0)
+    return ChunkTimebase(start + self._segment_offsets[segment], self._t0, self._dt, n_samples=n_samples, step=step)
+
+  def _copy(self, start, stop):
+    n = stop - start
+    pos = start % self.capacity
+    first = min(n, self.capacity - pos)
+    if first == n:
+      return self.buffer[:, pos:pos + n].copy()
+    return np.concatenate([self.buffer[:, pos:], self.buffer[:, :n - first]], axis=1)
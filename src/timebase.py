@@ -0,0 +1,104 @@
+import time
+
+class ChunkTimebase:
+  """
+  샘플 인덱스 기반 청크 타임베이스
+  - start_sample: 수집 시작 이후 청크 첫 샘플의 인덱스
+  - t0: 수집 시작 시 한 번만 고정한 기준 시각 (epoch 초)
+  - dt: 샘플 간격 (1 / sample_rate)
+  - drift: 모노토닉 시계 경과 시간 - 샘플 클럭 경과 시간 (초, 양수면 샘플 클럭이 느림)
+  - step: 청크 샘플 간 절대 인덱스 간격 (표시용으로 솎아낸 청크는 1보다 큼)
+  - 청크 내 i번째 샘플 시각 = t0 + (start_sample + i * step) * dt (샘플별 시간 배열을 따로 두지 않음)
+  """
+  def __init__(self, start_sample=0, t0=0.0, dt=1.0, drift=0.0, n_samples=0, step=1):
+    self.start_sample = int(start_sample)
+    self.t0 = float(t0)
+    self.dt = float(dt)
+    self.drift = float(drift)
+    self.n_samples = int(n_samples)
+    self.step = int(step)
+
+  @property
+  def sample_rate(self):
+    return 1.0 / self.dt
+
+  @property
+  def start_time(self):
+    """청크 첫 샘플의 시각 (epoch 초)"""
+    return self.t0 + self.start_sample * self.dt
+
+  @property
+  def end_sample(self):
+    """청크 마지막 샘플 다음 인덱스"""
+    return self.start_sample + self.n_samples * self.step
+
+  @property
+  def drift_ppm(self):
+    """경과 시간 대비 시계 드리프트 (ppm)"""
+    elapsed = self.end_sample * self.dt
+    return self.drift / elapsed * 1e6 if elapsed > 0 else 0.0
+
+  def time_of(self, sample_index):
+    """절대 샘플 인덱스의 시각 (epoch 초)"""
+    return self.t0 + sample_index * self.dt
+
+  def sample_at(self, t):
+    """시각 t(epoch 초)에 가장 가까운 절대 샘플 인덱스"""
+    return int(round((t - self.t0) / self.dt))
+
+  def to_dict(self):
+    return {"start_sample": self.start_sample, "t0": self.t0, "dt": self.dt, "drift": self.drift,
+            "n_samples": self.n_samples, "step": self.step}
+
+  @classmethod
+  def from_dict(cls, info):
+    return cls(info.get("start_sample", 0), info.get("t0", 0.0), info.get("dt", 1.0),
+               info.get("drift", 0.0), info.get("n_samples", 0), info.get("step", 1))
+
+  def __repr__(self):
+    return (f"ChunkTimebase(start_sample={self.start_sample}, t0={self.t0:.6f}, dt={self.dt:g}, "
+            f"drift={self.drift:.6f}, n_samples={self.n_samples}, step={self.step})")
+
+class SampleClock:
+  """
+  수집 시작 시 한 번 고정(anchor)한 기준 시각 + 누적 샘플 카운터로 청크 타임베이스 생성
+  - 청크마다 time.time()을 찍지 않고 샘플 인덱스로 시각 계산
+  - 모노토닉 시계와 샘플 클럭 차이를 지수 평활하여 드리프트 추정
+  """
+  def __init__(self, sample_rate, smoothing=0.05):
+    self.sample_rate = sample_rate
+    self.dt = 1.0 / sample_rate
+    self.smoothing = smoothing  # 드리프트 지수 평활 계수
+    self.t0 = None
+    self.t0_monotonic = None
+    self.sample_count = 0
+    self.drift = 0.0
+
+  def start(self):
+    """수집 시작 시 기준 시각 고정"""
+    self.t0 = time.time()
+    self.t0_monotonic = time.monotonic()
+    self.sample_count = 0
+    self.drift = 0.0
+
+  def skip(self, n_samples):
+    """
+    장치에서 유실된 샘플 수만큼 카운터를 건너뜀 (이후 청크 시각에 공백(gap) 반영)
+    """
+    self.sample_count += n_samples
+
+  def advance(self, n_samples) -> ChunkTimebase:
+    """
+    n_samples개를 읽은 청크의 타임베이스 반환 후 카운터 증가
+    """
+    if self.t0 is None:
+      self.start()
+    start_sample = self.sample_count
+    self.sample_count += n_samples
+    # 모노토닉 경과 시간과 샘플 클럭 경과 시간의 차 (읽기 지연 포함) → 평활
+    offset = (time.monotonic() - self.t0_monotonic) - self.sample_count * self.dt
+    if start_sample == 0:
+      self.drift = offset
+    else:
+      self.drift += self.smoothing * (offset - self.drift)
+    return ChunkTimebase(start_sample, self.t0, self.dt, self.drift, n_samples)
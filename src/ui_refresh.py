@@ -0,0 +1,56 @@
+from PySide6.QtCore import QObject, QTimer
+
+class UiRefreshCoalescer(QObject):
+  """
+  수집 속도와 무관하게 고정 저주기(기본 10 Hz)로 위젯을 갱신하는 UI 갱신 모음기
+  - set_text(): 라벨 텍스트는 마지막 값만 반영 (callable이면 반영 시점에 한 번만 문자열 생성)
+  - set_items(): 목록 항목이 실제로 바뀐 경우에만 다시 채움
+  - 대기 중인 갱신이 없으면 타이머를 멈춤 (유휴 상태 CPU 사용 없음)
+  - 로그는 LogView(log_view.py)가 모델/뷰로 직접 일괄 갱신하므로 여기서 다루지 않음
+  """
+  def __init__(self, interval_ms=100, parent=None):
+    super().__init__(parent)
+    self._texts = {}        # 라벨 → 대기 중인 텍스트 (또는 텍스트를 만드는 함수)
+    self._items = {}        # 목록 위젯 → 대기 중인 항목
+    self._applied_items = {}  # 목록 위젯 → 마지막으로 반영한 항목
+    self.flushes = 0
+    self.timer = QTimer(self)
+    self.timer.setSingleShot(True)
+    self.timer.setInterval(interval_ms)
+    self.timer.timeout.connect(self.flush)
+
+  def _schedule(self):
+    if not self.timer.isActive():
+      self.timer.start()
+
+  def set_text(self, label, text):
+    """라벨 텍스트 갱신 예약 (text: 문자열 또는 인자 없는 함수)"""
+    self._texts[label] = text
+    self._schedule()
+
+  def set_items(self, widget, items):
+    """목록 항목 갱신 예약 (마지막으로 반영한 항목과 같으면 무시)"""
+    items = tuple(items)
+    if self._applied_items.get(widget) == items:
+      self._items.pop(widget, None)
+      return
+    self._items[widget] = items
+    self._schedule()
+
+  def invalidate(self, widget):
+    """위젯을 외부에서 직접 바꾼 경우 캐시된 상태 제거 (다음 set_items는 항상 반영)"""
+    self._applied_items.pop(widget, None)
+    self._texts.pop(widget, None)
+
+  def flush(self):
+    """대기 중인 갱신을 즉시 위젯에 반영"""
+    self.timer.stop()
+    texts, self._texts = self._texts, {}
+    items, self._items = self._items, {}
+    for label, text in texts.items():
+      label.setText(text() if callable(text) else text)
+    for widget, values in items.items():
+      widget.clear()
+      widget.addItems(list(values))
+      self._applied_items[widget] = values
+    self.flushes += 1
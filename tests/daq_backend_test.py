@@ -0,0 +1,65 @@
+import unittest
+import time
+import numpy as np
+from src.daq_backend import SyntheticBackend
+
+class TestSyntheticBackend(unittest.TestCase):
+  def test_waveform_shapes_and_values(self):
+    """
+    채널별 파형(sine/chirp/noise/step/pulse)이 (채널, 샘플) 배열로 생성되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=5, sample_rate=1000, waveforms=list(SyntheticBackend.WAVEFORMS),
+                               frequency=10.0, amplitude=2.0, realtime=False, seed=0)
+    with backend:
+      data = backend.read(1000)
+    self.assertEqual(data.shape, (5, 1000))
+    t = np.arange(1000) / 1000
+    self.assertTrue(np.allclose(data[0], 2.0 * np.sin(2 * np.pi * 10.0 * t)))
+    self.assertTrue(set(np.unique(data[3])) <= {-2.0, 2.0})
+    # pulse: duty 10% 구간만 진폭
+    self.assertAlmostEqual(np.mean(data[4] > 0), 0.1, places=2)
+    self.assertGreater(np.std(data[2]), 1.0)
+
+  def test_continuous_across_reads(self):
+    """
+    여러 번 나눠 읽어도 한 번에 읽은 것과 같은 연속 신호가 생성되는지 테스트
+    """
+    a = SyntheticBackend(channel_count=2, sample_rate=500, waveforms=["sine", "chirp"], realtime=False)
+    b = SyntheticBackend(channel_count=2, sample_rate=500, waveforms=["sine", "chirp"], realtime=False)
+    with a, b:
+      whole = a.read(300)
+      parts = np.hstack([b.read(100) for _ in range(3)])
+    self.assertTrue(np.allclose(whole, parts))
+
+  def test_seeded_noise_is_reproducible(self):
+    """
+    seed 지정 시 노이즈가 재현 가능한지 테스트
+    """
+    runs = []
+    for _ in range(2):
+      with SyntheticBackend(channel_count=3, waveforms="noise", realtime=False, seed=42) as backend:
+        runs.append(backend.read(50))
+    self.assertTrue(np.array_equal(runs[0], runs[1]))
+
+  def test_realtime_pacing(self):
+    """
+    realtime 모드는 샘플링 속도에 맞춰 대기하고, free-run은 대기하지 않는지 테스트
+    """
+    with SyntheticBackend(sample_rate=1000, realtime=True) as backend:
+      start = time.monotonic()
+      backend.read(100)
+      self.assertGreaterEqual(time.monotonic() - start, 0.09)
+    with SyntheticBackend(sample_rate=1000, realtime=False) as backend:
+      start = time.monotonic()
+      backend.read(100000)
+      self.assertLess(time.monotonic() - start, 1.0)
+
+  def test_invalid_waveform(self):
+    """
+    지원하지 않는 파형 지정 시 ValueError 발생 테스트
+    """
+    with self.assertRaises(ValueError):
+      SyntheticBackend(waveforms="square")
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import multiprocessing
+import numpy as np
+from src.daq_process import SharedSlotRing, acquisition_process_main, drain_status
+from src.daq_backend import SyntheticBackend
+
+class TestSharedSlotRing(unittest.TestCase):
+  def setUp(self):
+    self.ring = SharedSlotRing(channel_count=2, block_size=8, n_slots=4)
+    self.addCleanup(self.ring.close)
+
+  def test_write_commit_and_view(self):
+    """
+    슬롯에 쓴 데이터가 commit 후 다른 핸들에서 복사 없이 보이는지 테스트
+    """
+    reader = SharedSlotRing(2, 8, 4, name=self.ring.name, create=False)
+    self.addCleanup(reader.close)
+    slot = self.ring.write_slot()
+    slot[:] = np.arange(16).reshape(2, 8)
+    self.assertEqual(reader.write_count, 0)
+    self.ring.commit(start_sample=0, n_samples=5, read_ns=123, backlog=7)
+    self.assertEqual(reader.write_count, 1)
+    self.assertEqual(reader.meta(0), (0, 5, 123, 7))
+    view = reader.slot_view(0, 5)
+    self.assertEqual(view.shape, (2, 5))
+    self.assertTrue(np.array_equal(view, np.arange(16).reshape(2, 8)[:, :5]))
+
+  def test_overwrite_detection(self):
+    """
+    슬롯 수를 넘게 기록하면 오래된 슬롯이 덮어써진 것으로 판정되는지 테스트
+    """
+    for i in range(6):
+      self.ring.write_slot()[:] = i
+      self.ring.commit(i * 8, 8)
+    self.assertTrue(self.ring.is_overwritten(0))
+    self.assertTrue(self.ring.is_overwritten(1))
+    # 다음 write_slot()이 슬롯 2를 가리키므로 생산자가 쓰기 시작한 것으로 간주
+    self.assertTrue(self.ring.is_overwritten(2))
+    self.assertFalse(self.ring.is_overwritten(3))
+    self.assertEqual(self.ring.meta(5)[0], 40)
+    self.assertTrue(np.all(self.ring.slot_view(5) == 5))
+
+class TestAcquisitionProcess(unittest.TestCase):
+  def test_child_process_fills_ring(self):
+    """
+    자식 프로세스가 백엔드로 슬롯을 채우고 시작/종료 상태를 전달하는지 테스트
+    """
+    ctx = multiprocessing.get_context("spawn")
+    ring = SharedSlotRing(channel_count=3, block_size=100, n_slots=16)
+    self.addCleanup(ring.close)
+    stop_event = ctx.Event()
+    status_queue = ctx.Queue()
+    backend = SyntheticBackend(channel_count=3, sample_rate=10000, realtime=True)
+    process = ctx.Process(target=acquisition_process_main,
+                          args=(backend, ring.name, 3, 100, 16, stop_event, status_queue))
+    process.start()
+    self.assertEqual(status_queue.get(timeout=60)[0], "started")
+    while ring.write_count < 3:
+      pass
+    stop_event.set()
+    process.join(10)
+    self.assertEqual(drain_status(status_queue)[-1], ("stopped",))
+    self.assertEqual([ring.meta(i)[:2] for i in range(3)], [(0, 100), (100, 100), (200, 100)])
+    expected = SyntheticBackend(channel_count=3, sample_rate=10000, realtime=False).read(100)
+    self.assertTrue(np.allclose(ring.slot_view(0), expected))
+
+if __name__ == '__main__':
+  unittest.main()
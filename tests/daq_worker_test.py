@@ -1,7 +1,10 @@
 import unittest
 from unittest.mock import patch, MagicMock
-from src.daq_worker import DaqDataCollector
+from src.daq_worker import DaqDataCollector, BufferPool, AcquisitionHealth, expand_channels
+from src.daq_backend import SyntheticBackend
 import numpy as np
+import threading
+import time
 from PySide6.QtCore import QCoreApplication, QTimer
 
 class TestDaqDataCollector(unittest.TestCase):
@@ -17,20 +20,39 @@ class TestDaqDataCollector(unittest.TestCase):
     정상적으로 데이터가 수집되어 data_collected 시그널이 emit되는지 테스트
     """
     mock_instance = mock_task.return_value.__enter__.return_value
-    mock_instance.read.return_value = [1.0, 2.0, 3.0, 4.0, 5.0]
+    def fake_read(number_of_samples_per_channel):
+      self.collector.stop()  # 한 번만 실행
+      return [1.0, 2.0, 3.0, 4.0, 5.0]
+    mock_instance.read.side_effect = fake_read
     emitted = []
     def on_data(data, ts):
       emitted.append((data, ts))
     self.collector.data_collected.connect(on_data)
-    self.collector._running = True
-    # run()을 직접 호출 (스레드 없이)
+    # run()을 직접 호출 (스레드 없이), 기준 시각은 시작 시 한 번만 고정
     with patch("time.time", return_value=123.456):
-      self.collector._running = False  # 한 번만 실행
       self.collector.run()
     self.assertTrue(len(emitted) > 0)
+    self.assertEqual(emitted[0][0].shape, (5,))
     self.assertTrue(np.allclose(emitted[0][0], [1.0,2.0,3.0,4.0,5.0]))
     self.assertEqual(emitted[0][1], 123.456)
 
+  def test_single_channel_shape_matches_across_backends(self):
+    """
+    단일 채널 모드에서 가상 백엔드도 NI 백엔드/별도 프로세스 모드와 같은 1차원 배열을 emit하는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=1, sample_rate=1000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=50, backend=backend)
+    emitted = []
+    def on_data(data, ts):
+      emitted.append(data.copy())
+      collector.stop()
+    collector.data_collected.connect(on_data)
+    collector.run()
+    self.assertEqual(emitted[0].shape, (50,))
+    self.assertEqual(emitted[0].dtype, np.float64)
+    self.assertEqual(backend.read(10, np.float32).shape, (1, 10))
+    self.assertEqual(backend.read(10, np.float32).dtype, np.float32)
+
   @patch("nidaqmx.Task", side_effect=Exception("장치 없음"))
   def test_run_emits_error(self, mock_task):
     """
@@ -43,5 +65,350 @@ class TestDaqDataCollector(unittest.TestCase):
     self.collector.run()
     self.assertTrue(any("장치 없음" in e for e in errors))
 
+  @patch("nidaqmx.Task")
+  def test_task_closed_when_setup_fails(self, mock_task):
+    """
+    채널/클럭 설정 중 실패하면 이미 연 DAQmx Task가 닫히는지 테스트
+    """
+    mock_instance = mock_task.return_value.__enter__.return_value
+    mock_instance.timing.cfg_samp_clk_timing.side_effect = Exception("클럭 설정 실패")
+    errors = []
+    self.collector.error_occurred.connect(lambda msg: errors.append(msg))
+    self.collector.run()
+    self.assertTrue(any("클럭 설정 실패" in e for e in errors))
+    mock_task.return_value.__exit__.assert_called_once()
+
+  def test_backend_stopped_when_scaling_fails(self):
+    """
+    시작 후 scaling() 조회가 실패해도 백엔드가 정지되는지 테스트
+    """
+    class FailingBackend(SyntheticBackend):
+      stops = 0
+      def scaling(self):
+        raise RuntimeError("스케일 조회 실패")
+      def stop(self):
+        FailingBackend.stops += 1
+        super().stop()
+    backend = FailingBackend(channel_count=1, sample_rate=1000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", backend=backend, raw=True)
+    errors = []
+    collector.error_occurred.connect(lambda msg: errors.append(msg))
+    collector.run()
+    self.assertTrue(any("스케일 조회 실패" in e for e in errors))
+    self.assertEqual(FailingBackend.stops, 1)
+
+  @patch("nidaqmx.stream_readers.AnalogMultiChannelReader")
+  @patch("nidaqmx.Task")
+  def test_multi_channel_reads_into_pool(self, mock_task, mock_reader_cls):
+    """
+    다채널 모드에서 스트림 리더가 풀 버퍼에 직접 채우고 (채널, 샘플) 배열이 emit되는지 테스트
+    """
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=4, channels="ai0:2", pool_size=2)
+    reads = []
+    def fake_read(buf, number_of_samples_per_channel):
+      reads.append(buf)
+      buf[:] = len(reads)
+      if len(reads) == 3:
+        collector.stop()
+      return number_of_samples_per_channel
+    mock_reader_cls.return_value.read_many_sample.side_effect = fake_read
+    emitted = []
+    collector.data_collected.connect(lambda data, ts: emitted.append(data.copy()))
+    collector.run()
+    mock_task.return_value.__enter__.return_value.ai_channels.add_ai_voltage_chan.assert_called_with("Dev1/ai0,Dev1/ai1,Dev1/ai2")
+    self.assertEqual(len(emitted), 3)
+    self.assertEqual(emitted[0].shape, (3, 4))
+    self.assertTrue(np.all(emitted[2] == 3))
+    # 풀 크기(2)만큼 버퍼가 순환 재사용됨
+    self.assertIs(reads[0], reads[2])
+
+  def test_expand_channels(self):
+    """
+    채널 목록/범위 문자열 확장 테스트
+    """
+    self.assertEqual(expand_channels("ai0:3"), ["ai0", "ai1", "ai2", "ai3"])
+    self.assertEqual(expand_channels("ai0, ai2"), ["ai0", "ai2"])
+    self.assertEqual(expand_channels(["ai1", "ai5"]), ["ai1", "ai5"])
+    with self.assertRaises(ValueError):
+      expand_channels("")
+
+  def test_buffer_pool_rotation(self):
+    """
+    버퍼 풀이 미리 할당된 버퍼를 순서대로 재사용하는지 테스트
+    """
+    pool = BufferPool(channel_count=2, samples_per_read=10, pool_size=3)
+    bufs = [pool.acquire() for _ in range(4)]
+    self.assertEqual(bufs[0].shape, (2, 10))
+    self.assertTrue(bufs[0].flags['C_CONTIGUOUS'])
+    self.assertIs(bufs[0], bufs[3])
+    self.assertIsNot(bufs[0], bufs[1])
+
+  def test_buffer_pool_keeps_undelivered_buffers(self):
+    """
+    전달되지 않은 emit이 잡고 있는 버퍼는 덮어쓰지 않고 새 버퍼로 교체하는지 테스트
+    """
+    delivered = [0]
+    pool = BufferPool(channel_count=1, samples_per_read=4, pool_size=2, delivered=lambda: delivered[0])
+    first = pool.acquire()
+    pool.hold(1)
+    pool.acquire()
+    self.assertIsNot(pool.acquire(), first)
+    self.assertEqual(pool.replaced, 1)
+    delivered[0] = 5
+    second = pool.acquire()
+    pool.hold(3)
+    pool.acquire()
+    self.assertIs(pool.acquire(), second)
+
+  def test_queued_chunks_not_overwritten(self):
+    """
+    GUI가 pool_size보다 많이 밀려도 큐 연결 슬롯이 받은 청크가 나중 읽기로 덮어써지지 않는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=2, sample_rate=100000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=100, backend=backend, pool_size=4)
+    received = []
+    collector.chunk_collected.connect(lambda data, tb: received.append((data, tb)))
+    self._run_with_blocked_gui(collector, seconds=0.1)
+    self.assertGreater(len(received), collector.pool_size)
+    expected = SyntheticBackend(channel_count=2, sample_rate=100000, realtime=False).read(backend.sample_index)
+    for data, tb in received:
+      self.assertTrue(np.array_equal(data, expected[:, tb.start_sample:tb.start_sample + data.shape[-1]]))
+
+  def test_run_with_synthetic_backend(self):
+    """
+    하드웨어 없이 SyntheticBackend로 다채널 데이터가 수집되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=4, sample_rate=100000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=500, backend=backend)
+    emitted = []
+    def on_data(data, ts):
+      emitted.append(data.copy())
+      if len(emitted) == 5:
+        collector.stop()
+    collector.data_collected.connect(on_data)
+    collector.run()
+    self.assertEqual(len(emitted), 5)
+    self.assertEqual(emitted[0].shape, (4, 500))
+    self.assertEqual(backend.sample_index, 2500)
+
+  def test_chunk_timebase_is_sample_based(self):
+    """
+    청크 타임베이스가 샘플 인덱스로 연속 계산되고 시작 시각은 한 번만 고정되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=2, sample_rate=1000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=100, backend=backend)
+    timebases = []
+    stamps = []
+    def on_chunk(data, tb):
+      timebases.append(tb)
+      if len(timebases) == 3:
+        collector.stop()
+    collector.chunk_collected.connect(on_chunk)
+    collector.data_collected.connect(lambda data, ts: stamps.append(ts))
+    collector.run()
+    self.assertEqual([tb.start_sample for tb in timebases], [0, 100, 200])
+    self.assertTrue(all(tb.t0 == timebases[0].t0 for tb in timebases))
+    self.assertAlmostEqual(timebases[0].dt, 0.001)
+    self.assertAlmostEqual(stamps[2] - stamps[0], 0.2)
+    self.assertEqual(timebases[2].end_sample, 300)
+
+  def test_adaptive_coalescing_limits_emit_rate(self):
+    """
+    적응형 모드에서 청크가 병합되어 emit 횟수가 max_emit_rate 이하로 제한되고, 샘플이 연속인지 테스트
+    """
+    backend = SyntheticBackend(channel_count=2, sample_rate=200000, realtime=True)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", backend=backend, adaptive=True,
+                                 target_latency=0.005, max_emit_rate=20, telemetry_interval=0.0)
+    chunks = []
+    telemetry = []
+    collector.chunk_collected.connect(lambda data, tb: chunks.append((data.shape, tb)))
+    collector.telemetry_updated.connect(telemetry.append)
+    timer = threading.Timer(0.5, collector.stop)
+    timer.start()
+    collector.run()
+    timer.join()
+    self.assertLessEqual(len(chunks), 0.5 * 20 + 2)
+    self.assertGreater(len(chunks), 2)
+    # 배치 경계에서 샘플 인덱스가 끊기지 않음
+    expected = 0
+    for shape, tb in chunks:
+      self.assertEqual(shape, (2, tb.n_samples))
+      self.assertEqual(tb.start_sample, expected)
+      expected = tb.end_sample
+    self.assertEqual(expected, backend.sample_index)
+    self.assertTrue(telemetry)
+    self.assertGreater(telemetry[-1]["batch_chunks"], 1)
+    self.assertIn("latency", telemetry[-1])
+    self.assertIn("read_samples", collector.telemetry)
+
+  def test_next_read_size(self):
+    """
+    백로그와 목표 지연으로 읽기 크기가 결정되는지 테스트
+    """
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", sample_rate=100000, adaptive=True, target_latency=0.01)
+    base, max_read, capacity = collector.read_size_limits()
+    self.assertEqual(base, 1000)
+    self.assertEqual(collector.next_read_size(0), 1000)
+    self.assertEqual(collector.next_read_size(2500), 2500)
+    self.assertEqual(collector.next_read_size(10 ** 7), max_read)
+    self.assertGreaterEqual(capacity, max_read)
+
+  def test_buffer_pool_partial_acquire(self):
+    """
+    용량보다 작은 요청 시에도 C-연속 (채널, n) 배열이 반환되는지 테스트
+    """
+    pool = BufferPool(channel_count=3, samples_per_read=100, pool_size=1)
+    buf = pool.acquire(40)
+    self.assertEqual(buf.shape, (3, 40))
+    self.assertTrue(buf.flags['C_CONTIGUOUS'])
+    with self.assertRaises(ValueError):
+      pool.acquire(101)
+
+  def _run_with_blocked_gui(self, collector, seconds=0.3):
+    # GUI 이벤트 루프를 막은 채 수집 스레드를 돌린 뒤, 밀린 시그널을 한꺼번에 처리
+    collector.start()
+    time.sleep(seconds)
+    collector.stop()
+    collector.wait(5000)
+    self.app.processEvents()
+
+  def test_degrade_drop_keeps_record_sink_lossless(self):
+    """
+    GUI가 밀리면 표시용 청크는 버려지지만 기록용 싱크에는 모든 샘플이 전달되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=2, sample_rate=100000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=100, backend=backend,
+                                 degrade_policy="drop", max_queue_depth=4)
+    recorded = []
+    collector.add_sink(lambda data, tb: recorded.append(data.shape[-1]))
+    displayed = []
+    collector.chunk_collected.connect(lambda data, tb: displayed.append(data.shape[-1]))
+    self._run_with_blocked_gui(collector)
+    self.assertEqual(sum(recorded), backend.sample_index)
+    self.assertGreater(collector.health.dropped_display_chunks, 0)
+    self.assertEqual(sum(displayed) + collector.health.dropped_display_samples, backend.sample_index)
+    self.assertEqual(collector.health.queue_depth, 0)
+
+  def test_degrade_decimate(self):
+    """
+    decimate 정책에서 표시용 청크가 솎아지고 타임베이스 step이 반영되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=1, sample_rate=100000, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=64, channels=["ai0"],
+                                 backend=backend, degrade_policy="decimate", max_queue_depth=2)
+    recorded = []
+    collector.add_sink(lambda data, tb: recorded.append(data.shape[-1]))
+    steps = []
+    collector.chunk_collected.connect(lambda data, tb: steps.append((tb.step, data.shape[-1], tb.n_samples)))
+    self._run_with_blocked_gui(collector)
+    self.assertEqual(sum(recorded), backend.sample_index)
+    self.assertTrue(any(step > 1 for step, _, _ in steps))
+    self.assertTrue(all(n == 64 // step for step, n, _ in steps if 64 % step == 0))
+    self.assertTrue(all(n == tb_n for _, n, tb_n in steps))
+
+  def test_out_of_process_acquisition(self):
+    """
+    별도 프로세스 수집 모드에서 공유 메모리 링을 거쳐 연속된 청크가 전달되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=2, sample_rate=20000, realtime=True)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=200, backend=backend,
+                                 out_of_process=True, ring_slots=16)
+    chunks = []
+    def on_chunk(data, tb):
+      chunks.append((data.copy(), tb))
+      if len(chunks) == 5:
+        collector.stop()
+    collector.chunk_collected.connect(on_chunk)
+    errors = []
+    collector.error_occurred.connect(errors.append)
+    collector.run()
+    self.assertEqual(errors, [])
+    self.assertEqual(len(chunks), 5)
+    self.assertEqual([tb.start_sample for _, tb in chunks], [0, 200, 400, 600, 800])
+    expected = SyntheticBackend(channel_count=2, sample_rate=20000, realtime=False).read(1000)
+    self.assertTrue(np.allclose(np.hstack([data for data, _ in chunks]), expected))
+    self.assertEqual(collector.health.total_samples, 1000)
+
+  def test_out_of_process_rejects_adaptive(self):
+    with self.assertRaises(ValueError):
+      DaqDataCollector(device_name="Dev1", channel="ai0", adaptive=True, out_of_process=True)
+
+  def test_raw_mode_emits_int16_with_scaling(self):
+    """
+    원시 모드에서 int16 코드가 전달되고 스케일링 계수로 전압 복원이 가능한지 테스트
+    """
+    backend = SyntheticBackend(channel_count=2, sample_rate=1000, amplitude=5.0, realtime=False)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=100, backend=backend, raw=True)
+    chunks = []
+    def on_chunk(data, tb):
+      chunks.append(data.copy())
+      if len(chunks) == 2:
+        collector.stop()
+    collector.chunk_collected.connect(on_chunk)
+    collector.run()
+    self.assertEqual(chunks[0].dtype, np.int16)
+    self.assertEqual(chunks[0].shape, (2, 100))
+    volts = collector.scaling.apply(np.hstack(chunks))
+    expected = SyntheticBackend(channel_count=2, sample_rate=1000, amplitude=5.0, realtime=False).read(200)
+    self.assertTrue(np.allclose(volts, expected, atol=10.0 / 32768))
+
+  def test_health_reports_gaps_and_histogram(self):
+    """
+    장치 버퍼 덮어쓰기로 유실된 샘플이 gap으로 집계되고 헬스 신호로 발행되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=1, sample_rate=10000, realtime=True, buffer_size=200)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", samples_per_read=100, backend=backend,
+                                 health_interval=0.0)
+    chunks = []
+    def slow_sink(data, tb):
+      chunks.append(tb)
+      time.sleep(0.05)  # 기록이 느려 장치 버퍼가 넘침
+      if len(chunks) == 5:
+        collector.stop()
+    collector.add_sink(slow_sink)
+    reports = []
+    collector.health_updated.connect(reports.append)
+    collector.run()
+    self.assertGreater(collector.health.gaps, 0)
+    self.assertEqual(collector.health.lost_samples, backend.lost_samples)
+    # 유실 구간만큼 청크 시작 샘플이 건너뜀
+    self.assertGreater(chunks[-1].start_sample, 100 * (len(chunks) - 1))
+    self.assertEqual(sum(tb.n_samples for tb in chunks) + backend.lost_samples, collector.clock.sample_count)
+    last = reports[-1]
+    for key in ["backlog", "total_samples", "read_hist", "queue_depth", "overflows", "gaps"]:
+      self.assertIn(key, last)
+    self.assertEqual(sum(last["read_hist"]), last["reads"])
+
+  def test_overflow_error_counted(self):
+    """
+    읽기 중 오버플로 예외 발생 시 overflows가 집계되는지 테스트
+    """
+    backend = SyntheticBackend(channel_count=1, realtime=False)
+    backend.read = MagicMock(side_effect=RuntimeError("overflow"))
+    backend.is_overflow = lambda e: "overflow" in str(e)
+    collector = DaqDataCollector(device_name="Dev1", channel="ai0", backend=backend)
+    errors = []
+    collector.error_occurred.connect(errors.append)
+    collector.run()
+    self.assertEqual(collector.health.overflows, 1)
+    self.assertTrue(any("overflow" in e for e in errors))
+
+  def test_invalid_degrade_policy(self):
+    with self.assertRaises(ValueError):
+      DaqDataCollector(device_name="Dev1", channel="ai0", degrade_policy="skip")
+
+  def test_health_histogram_bins(self):
+    """
+    읽기 시간 히스토그램 구간 집계 테스트
+    """
+    health = AcquisitionHealth()
+    health.record_read(0.0005, 10)
+    health.record_read(0.003, 10)
+    health.record_read(1.0, 10)
+    self.assertEqual(health.read_hist[0], 1)
+    self.assertEqual(health.read_hist[2], 1)
+    self.assertEqual(health.read_hist[-1], 1)
+    self.assertEqual(health.total_samples, 30)
+
 if __name__ == "__main__":
   unittest.main() 
\ No newline at end of file
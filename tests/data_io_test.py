@@ -1,7 +1,12 @@
 import unittest
 import numpy as np
 import os
-from src.data_io import save_data, load_data
+import h5py
+from src.data_io import save_data, load_data, load_timebase, load_scaling, save_hdf5, load_hdf5, load_hdf5_info, append_hdf5
+from src.data_io import save_csv, load_csv, iter_csv, read_csv_table, write_csv_table
+from src.data_io import RawWriter, save_raw, load_raw, load_raw_info, open_recording, save_data_blocks
+from src.timebase import ChunkTimebase
+from src.scaling import ChannelScaling
 
 class TestDataIO(unittest.TestCase):
   def setUp(self):
@@ -56,5 +61,168 @@ class TestDataIO(unittest.TestCase):
     with self.assertRaises(IOError):
       load_data("not_exist.csv")
 
+  def test_timebase_round_trip(self):
+    """
+    CSV/HDF5 저장 시 타임베이스(t0/dt/start_sample)가 기록되고 복원되는지 테스트
+    """
+    tb = ChunkTimebase(start_sample=200, t0=1700000000.25, dt=1e-4)
+    for path in [self.csv_file, self.h5_file]:
+      save_data(path, self.data, timebase=tb)
+      self.assertTrue(np.allclose(load_data(path), self.data))
+      loaded = load_timebase(path)
+      self.assertEqual(loaded.start_sample, 200)
+      self.assertAlmostEqual(loaded.t0, tb.t0)
+      self.assertAlmostEqual(loaded.dt, tb.dt)
+
+  def test_timebase_missing(self):
+    """
+    타임베이스 없이 저장한 파일은 None 반환 테스트
+    """
+    for path in [self.csv_file, self.h5_file]:
+      save_data(path, self.data)
+      self.assertIsNone(load_timebase(path))
+
+  def test_raw_codes_with_scaling(self):
+    """
+    원시 코드와 스케일링 계수를 함께 저장하고, 불러올 때 전압 또는 원시 코드로 받는지 테스트
+    """
+    raw = np.array([[0, 100, -100], [16384, -16384, 1]], dtype=np.int16)
+    scaling = ChannelScaling([[0.0, 10.0 / 32768], [1.0, 5.0 / 32768]])
+    tb = ChunkTimebase(start_sample=0, t0=5.0, dt=0.01)
+    for path in [self.csv_file, self.h5_file]:
+      save_data(path, raw, timebase=tb, scaling=scaling)
+      codes = load_data(path, scaled=False)
+      self.assertEqual(codes.dtype, np.int16)
+      self.assertTrue(np.array_equal(codes, raw))
+      self.assertTrue(np.allclose(load_data(path), scaling.apply(raw)))
+      self.assertTrue(np.allclose(load_scaling(path).coefficients, scaling.coefficients))
+      self.assertAlmostEqual(load_timebase(path).t0, 5.0)
+    save_data(self.h5_file, self.data)
+    self.assertIsNone(load_scaling(self.h5_file))
+
+  def test_hdf5_v2_layout(self):
+    """
+    버전 2 HDF5 레이아웃: 압축/청크, 채널 메타데이터, 시간 원점, 이어 쓰기와 구간 읽기
+    """
+    data = np.random.randn(2, 10000)
+    tb = ChunkTimebase(start_sample=0, t0=1700000000.0, dt=0.001)
+    channels = [{"name": "압력", "unit": "kPa"}, {"name": "온도", "unit": "C"}]
+    save_hdf5(self.h5_file, data, tb, channel_info=channels, compression="lzf", chunk_samples=1024)
+    info = load_hdf5_info(self.h5_file)
+    self.assertEqual(info["format_version"], 2)
+    self.assertEqual(info["compression"], "lzf")
+    self.assertEqual(info["chunks"], (2, 1024))
+    self.assertEqual(info["channel_names"], ["압력", "온도"])
+    self.assertEqual(info["channels"][0]["unit"], "kPa")
+    self.assertAlmostEqual(info["sample_rate"], 1000.0)
+    self.assertTrue(info["time_origin"].startswith("2023-11-14T22:13:20"))
+    self.assertTrue(np.array_equal(load_hdf5(self.h5_file, start=2000, stop=2100), data[:, 2000:2100]))
+    with h5py.File(self.h5_file, "a") as f:
+      append_hdf5(f["data"], data[:, :500])
+    loaded = load_data(self.h5_file)
+    self.assertEqual(loaded.shape, (2, 10500))
+    self.assertTrue(np.array_equal(loaded[:, 10000:], data[:, :500]))
+    with self.assertRaises(IOError):
+      save_hdf5(self.h5_file, data, compression="zip")
+
+  def test_csv_engine_matches_savetxt(self):
+    """
+    블록 단위 CSV 기록이 np.savetxt와 같은 파일을 만들고, 블록 단위 읽기/dtype 지정이 동작
+    """
+    data = np.random.randn(3, 500)
+    save_csv(self.csv_file, data, ChunkTimebase(0, 1.0, 0.01), chunk_rows=64)
+    np.savetxt(self.invalid_file, data, delimiter=",", fmt="%.8f")
+    with open(self.csv_file, encoding="utf-8") as f, open(self.invalid_file, encoding="utf-8") as g:
+      lines = f.read().splitlines()
+      self.assertEqual(lines[1:], g.read().splitlines())
+    self.assertTrue(lines[0].startswith("# timebase"))
+    loaded = load_csv(self.csv_file, dtype=np.float32)
+    self.assertEqual(loaded.dtype, np.float32)
+    self.assertTrue(np.allclose(loaded, data, atol=1e-6))
+    self.assertTrue(np.allclose(load_csv(self.csv_file, parallel=True, workers=2), data))
+
+  def test_csv_table_with_header_and_timestamps(self):
+    """
+    열 이름 줄과 시각 열(숫자/ISO 8601)이 있는 행=샘플 형식 CSV
+    """
+    data = np.random.randn(1000, 2)
+    stamps = 1700000000.0 + np.arange(1000) * 0.001
+    write_csv_table(self.csv_file, data, columns=["압력", "온도"], timestamps=stamps, chunk_rows=128)
+    table = read_csv_table(self.csv_file, timestamp_col="time")
+    self.assertEqual(table["columns"], ["압력", "온도"])
+    self.assertTrue(np.allclose(table["timestamps"], stamps))
+    self.assertTrue(np.allclose(table["data"], data))
+    blocks = [block.shape for _, block in iter_csv(self.csv_file, chunk_rows=300, timestamp_col=0)]
+    self.assertEqual(blocks, [(300, 2), (300, 2), (300, 2), (100, 2)])
+    with open(self.csv_file, "w", encoding="utf-8") as f:
+      f.write("time,a\n2024-01-01T00:00:00,1.5\n2024-01-01T00:00:01.5,2.5\n")
+    table = read_csv_table(self.csv_file, timestamp_col=0)
+    self.assertTrue(np.allclose(table["timestamps"] - table["timestamps"][0], [0.0, 1.5]))
+    self.assertTrue(np.allclose(table["data"][:, 0], [1.5, 2.5]))
+    with self.assertRaises(ValueError):
+      read_csv_table(self.csv_file, dtype=np.int32)
+
+  def test_raw_binary_format(self):
+    """
+    원시 바이너리(.bin) + JSON 사이드카: 인터리브/플래너 저장, memmap 읽기, 이어 쓰기
+    """
+    path = "test_data.bin"
+    self.addCleanup(lambda: [os.remove(p) for p in (path, path + ".json") if os.path.exists(p)])
+    data = np.random.randn(3, 1000)
+    tb = ChunkTimebase(start_sample=0, t0=7.0, dt=0.001)
+    for layout in ("interleaved", "planar"):
+      save_raw(path, data, tb, layout=layout)
+      loaded = load_data(path)
+      self.assertIsInstance(loaded if layout == "planar" else loaded.base, np.memmap)
+      self.assertTrue(np.array_equal(loaded, data))
+      self.assertEqual(load_raw_info(path)["layout"], layout)
+      self.assertAlmostEqual(load_timebase(path).t0, 7.0)
+      self.assertEqual(load_timebase(path).n_samples, 1000)
+    raw = (np.arange(2 * 5000).reshape(2, 5000) % 300).astype(np.int16)
+    scaling = ChannelScaling.linear(2, 0.01)
+    with RawWriter(path, 2, np.int16, sample_rate=1000, scaling=scaling, buffer_bytes=4096) as writer:
+      for i in range(0, 5000, 700):
+        writer.append(raw[:, i:i + 700])
+    self.assertEqual(load_raw_info(path)["n_samples"], 5000)
+    self.assertTrue(np.array_equal(load_raw(path), raw))
+    self.assertTrue(np.allclose(load_data(path), scaling.apply(raw)))
+    with open_recording(path) as rec:
+      self.assertEqual(rec.shape, (2, 5000))
+      self.assertTrue(np.allclose(rec[1, 100:200], scaling.apply(raw)[1, 100:200]))
+
+  def test_save_data_blocks_matches_save_data(self):
+    """
+    블록 단위 저장이 전체 배열을 save_data로 저장한 것과 같은 파일을 만드는지 테스트 (csv/h5/bin, 1차원/다채널)
+    """
+    paths = [self.csv_file, self.h5_file, "test_data.bin", "test_whole.csv", "test_whole.h5", "test_whole.bin"]
+    self.addCleanup(lambda: [os.remove(p) for p in paths + [p + ".json" for p in paths] if os.path.exists(p)])
+    tb = ChunkTimebase(start_sample=0, t0=3.0, dt=0.01)
+    for data in (np.random.randn(3, 250), np.random.randn(1, 250)):
+      blocks = [data[:, i:i + 64] for i in range(0, data.shape[1], 64)]
+      whole = data[0] if data.shape[0] == 1 else data
+      for ext in (".csv", ".h5", ".bin"):
+        save_data_blocks("test_data" + ext, lambda: iter(blocks), whole.shape, data.dtype, tb)
+        save_data("test_whole" + ext, whole, tb)
+        loaded = load_data("test_data" + ext)
+        self.assertEqual(loaded.shape, whole.shape)
+        self.assertTrue(np.allclose(loaded, whole))
+        self.assertAlmostEqual(load_timebase("test_data" + ext).t0, 3.0)
+      with open(self.csv_file) as a, open("test_whole.csv") as b:
+        self.assertEqual(a.read(), b.read())
+    with self.assertRaises(ValueError):
+      save_data_blocks(self.invalid_file, lambda: iter([]), (0,))
+
+  def test_hdf5_v1_compat(self):
+    """
+    format_version 속성이 없는 기존 단일 데이터셋 파일도 그대로 불러오기
+    """
+    with h5py.File(self.h5_file, "w") as f:
+      f.create_dataset("data", data=self.data)
+    self.assertTrue(np.array_equal(load_data(self.h5_file), self.data))
+    self.assertIsNone(load_timebase(self.h5_file))
+    info = load_hdf5_info(self.h5_file)
+    self.assertEqual(info["format_version"], 1)
+    self.assertEqual(info["channel_names"], ["ch0", "ch1"])
+
 if __name__ == "__main__":
   unittest.main() 
\ No newline at end of file
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+import tempfile
+from PySide6.QtWidgets import QApplication
+from src.log_view import LogModel, LogView, RecordRing
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestLogView(unittest.TestCase):
+  def test_ring_and_folding(self):
+    model = LogModel(capacity=3, fold_window=10.0)
+    for i in range(1200):
+      model.log("DEBUG", "데이터 수집", source="daq", detail=f"청크 {i}", timestamp=100.0 + i * 0.001)
+    self.assertEqual(model.rowCount(), 1)
+    self.assertEqual(model.records[0].count, 1200)
+    self.assertIn("×1200", model.records[0].text())
+    self.assertIn("청크 1199", model.records[0].text())
+    # fold_window를 넘으면 새 레코드
+    model.log("DEBUG", "데이터 수집", source="daq", timestamp=200.0)
+    for i in range(5):
+      model.log("INFO", f"메시지 {i}", timestamp=201.0)
+    self.assertEqual(model.rowCount(), 3)
+    self.assertEqual(model.dropped, 4)
+    self.assertEqual([r.message for r in model.records], ["메시지 2", "메시지 3", "메시지 4"])
+    with self.assertRaises(ValueError):
+      model.log("TRACE", "x")
+
+  def test_record_ring(self):
+    ring = RecordRing(4)
+    for i in range(10):
+      ring.append(i)
+    self.assertEqual(list(ring), [6, 7, 8, 9])
+    self.assertEqual((ring[0], ring[-1], len(ring)), (6, 9, 4))
+    self.assertEqual(ring.popleft(), 6)
+    ring.append(10)
+    self.assertEqual(list(ring), [7, 8, 9, 10])
+    with self.assertRaises(IndexError):
+      ring[4]
+    ring.clear()
+    self.assertEqual(len(ring), 0)
+
+  def test_filter_and_prefix(self):
+    view = LogView()
+    view.append("[WARN] 샘플 유실\n[MARK] 북마크")
+    view.append("데이터 수집 시작")
+    view.log("DEBUG", "데이터 수집", source="daq")
+    self.assertEqual([(r.level, r.source) for r in view.model.records],
+                     [("WARN", "app"), ("INFO", "mark"), ("INFO", "app"), ("DEBUG", "daq")])
+    self.assertEqual(view.proxy.rowCount(), 4)
+    view.level_combo.setCurrentText("WARN")
+    self.assertEqual(view.proxy.rowCount(), 1)
+    view.level_combo.setCurrentText("DEBUG")
+    view.source_combo.setCurrentText("daq")
+    self.assertEqual(view.proxy.rowCount(), 1)
+    self.assertEqual([view.source_combo.itemText(i) for i in range(view.source_combo.count())],
+                     ["전체", "app", "mark", "daq"])
+
+  def test_spill_rotating_file(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, "session.log")
+      model = LogModel(fold_window=10.0)
+      model.enable_spill(path)
+      for _ in range(3):
+        model.log("DEBUG", "데이터 수집", source="daq", timestamp=1.0)
+      model.log("WARN", "샘플 유실", timestamp=2.0)
+      model.disable_spill()
+      with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+      self.assertEqual(len(lines), 3)
+      self.assertIn("3회 반복", lines[1])
+      self.assertIn("[WARN] app: 샘플 유실", lines[2])
+
+if __name__ == "__main__":
+  unittest.main()
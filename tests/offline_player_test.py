@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 from src.offline_player import OfflinePlayer
+from src.timebase import ChunkTimebase
 from PySide6.QtWidgets import QApplication
 import sys
 
@@ -81,5 +82,15 @@ class TestOfflinePlayer(unittest.TestCase):
     self.player._on_timer_tick()
     self.assertTrue(self.finished_emitted)
 
+  def test_frame_time_from_timebase(self):
+    """
+    타임베이스 지정 시 프레임 시각이 샘플 인덱스로 계산되는지 테스트
+    """
+    self.assertIsNone(self.player.frame_time())
+    self.player.set_data(self.data, ChunkTimebase(start_sample=100, t0=0.0, dt=0.01))
+    self.player.seek(5)
+    self.assertAlmostEqual(self.player.frame_time(), 1.05)
+    self.assertIn("1.050s", self.player.position_label.text())
+
 if __name__ == "__main__":
   unittest.main() 
\ No newline at end of file
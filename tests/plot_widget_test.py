@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 from src.plot_widget import RealtimePlotWidget
+from src.timebase import ChunkTimebase
 from PySide6.QtWidgets import QApplication
 import sys
 import pyqtgraph as pg
@@ -48,6 +49,88 @@ class TestRealtimePlotWidget(unittest.TestCase):
     with self.assertRaises(Exception):
       self.widget.append_data(np.ones((2, 10, 2)))
 
+  def test_append_with_timebase(self):
+    """
+    타임베이스 지정 시 x축 좌표가 샘플 인덱스 기반 시간으로 계산되는지 테스트
+    """
+    self.widget.append_data(np.ones((2, 10)), ChunkTimebase(start_sample=0, t0=0.0, dt=0.5))
+    self.widget.append_data(np.ones((2, 10)), ChunkTimebase(start_sample=10, t0=0.0, dt=0.5))
+    self.assertEqual(self.widget.end_sample, 20)
+    self.assertAlmostEqual(self.widget.x_at(0), 0.0)
+    self.assertAlmostEqual(self.widget.x_at(self.widget.ptr), 10.0)
+    self.widget.update_plot()
+    self.assertAlmostEqual(self.widget.curves[0].transform().m11(), 0.5)
+
+  def test_ring_buffer_wraps_without_reordering(self):
+    """
+    버퍼가 넘치면 쓰기 위치만 돌고, 정렬된 데이터는 렌더링 시에만 만들어지는지 테스트
+    """
+    for start in range(0, 130, 10):
+      chunk = np.vstack([np.arange(start, start + 10)] * 2).astype(float)
+      self.widget.append_data(chunk)
+    self.assertEqual((self.widget.ptr, self.widget.head), (100, 30))
+    self.assertTrue(self.widget.wrapped)
+    self.assertTrue(np.array_equal(self.widget.data_buffer[0, :30], np.arange(100, 130)))
+    self.assertTrue(np.array_equal(self.widget.ordered_data()[1], np.arange(30, 130)))
+    self.widget.update_plot()
+    x, y = self.widget.curves[0].getData()
+    self.assertTrue(np.array_equal(y, np.arange(30, 130)))
+    # 버퍼보다 큰 청크는 마지막 buffer_size 샘플만 보관
+    self.widget.append_data(np.vstack([np.arange(250.0)] * 2))
+    self.assertEqual(self.widget.head, 0)
+    self.assertTrue(np.array_equal(self.widget.ordered_data()[0], np.arange(150, 250)))
+
+  def test_sweep_mode(self):
+    """
+    sweep 모드는 버퍼 위치 그대로 그리고 쓰기 위치를 x축 좌표로 사용하는지 테스트
+    """
+    widget = RealtimePlotWidget(channel_count=1, buffer_size=50, display_mode="sweep")
+    widget.append_data(np.arange(30.0).reshape(1, -1))
+    widget.append_data(np.arange(30.0, 70.0).reshape(1, -1))
+    self.assertEqual(widget.x_at(widget.ptr), 20)
+    self.assertEqual(widget.x_at(0), 20)
+    widget.update_plot()
+    x, y = widget.curves[0].getData()
+    self.assertTrue(np.array_equal(y[:20], np.arange(50, 70)))
+    with self.assertRaises(ValueError):
+      widget.set_display_mode("strip")
+
+  def test_lod_min_max_envelope(self):
+    """
+    샘플이 픽셀보다 많으면 픽셀당 최소/최대 포락선으로 줄이고, 캐시 bin이 원본과 일치하는지 테스트
+    """
+    widget = RealtimePlotWidget(channel_count=2, buffer_size=100000)
+    rng = np.random.default_rng(0)
+    history = rng.standard_normal((2, 250000))
+    for start in range(0, history.shape[1], 777):
+      widget.append_data(history[:, start:start + 777])
+    x, y = widget.lod_data(0, widget.ptr, 1000)
+    self.assertLessEqual(y.shape[1], 2 * 1000 + 4)
+    self.assertEqual(x.shape[0], y.shape[1])
+    visible = history[:, -widget.ptr:]
+    self.assertAlmostEqual(y[0].max(), visible[0].max())
+    self.assertAlmostEqual(y[1].min(), visible[1].min())
+    # 각 bin 캐시는 절대 인덱스 구간의 원본 최소/최대와 같음
+    b = widget.envelope.bin_size
+    last_bin = widget.total_samples // b
+    mins, maxs = widget.envelope.query(last_bin - 10, last_bin)
+    blocks = history[:, (last_bin - 10) * b:last_bin * b].reshape(2, 10, b)
+    self.assertTrue(np.array_equal(mins, blocks.min(axis=2)))
+    self.assertTrue(np.array_equal(maxs, blocks.max(axis=2)))
+
+  def test_lod_falls_back_to_raw_when_zoomed(self):
+    """
+    보이는 샘플이 픽셀보다 적으면 원본 샘플을 그대로 그리는지 테스트
+    """
+    widget = RealtimePlotWidget(channel_count=1, buffer_size=10000)
+    widget.append_data(np.arange(10000.0).reshape(1, -1))
+    x, y = widget.lod_data(100, 600, 1000)
+    self.assertTrue(np.array_equal(y[0], np.arange(100.0, 600.0)))
+    self.assertTrue(np.array_equal(x, np.arange(100, 600)))
+    x, y = widget.lod_data(0, 10000, 500)
+    self.assertEqual((y[0].min(), y[0].max()), (0.0, 9999.0))
+    self.assertTrue(np.all(np.diff(x) >= 0))
+
 class TestRealtimePlotWidgetColormap(unittest.TestCase):
   def setUp(self):
     self.widget = RealtimePlotWidget(channel_count=3, buffer_size=1000)
@@ -0,0 +1,114 @@
+import unittest
+import os
+import numpy as np
+from src.processing_graph import ProcessingGraph, FusedStage
+from src.signal_pipeline import apply_fir_lowpass, apply_iir_lowpass
+from src.timebase import ChunkTimebase
+from src.data_io import load_raw, load_raw_info, raw_sidecar_path
+
+class TestProcessingGraph(unittest.TestCase):
+  def setUp(self):
+    self.fs = 10000.0
+    self.data = np.random.default_rng(4).standard_normal((2, 20000))
+    self.file_path = "test_processing_graph.bin"
+    self.config = {"version": 1, "stages": [
+      {"id": "plot", "type": "sink", "input": "dec", "params": {"target": "plot"}},
+      {"id": "lp", "type": "iir", "input": "source", "params": {"cutoff_hz": 500.0}},
+      {"id": "dec", "type": "decimate", "input": "lp", "params": {"factor": 10}},
+      {"id": "gain", "type": "gain", "input": "dec", "params": {"gain": 2.0}},
+      {"id": "rect", "type": "abs", "input": "gain"},
+      {"id": "diff", "type": "derived", "input": "dec", "params": {"weights": [[1.0, -1.0]]}},
+      {"id": "stats", "type": "stats", "input": "diff"},
+      {"id": "file", "type": "file", "input": "dec", "params": {"path": self.file_path}},
+    ]}
+
+  def tearDown(self):
+    for path in (self.file_path, raw_sidecar_path(self.file_path)):
+      if os.path.exists(path):
+        os.remove(path)
+
+  def run_graph(self, graph, chunk=777):
+    sink = []
+    graph.bind_sink("plot", lambda data, timebase: sink.append((data.copy(), timebase)))
+    rect = []
+    for start in range(0, self.data.shape[1], chunk):
+      outputs = graph.process(self.data[:, start:start + chunk], ChunkTimebase(start, 100.0, 1 / self.fs, n_samples=chunk))
+      rect.append(outputs["rect"].copy())
+    return sink, np.concatenate(rect, axis=1)
+
+  def test_graph_matches_direct_processing(self):
+    """
+    청크 단위 그래프 출력(필터 → 다운샘플 팬아웃, 요소별 단계 합침, 파일 출력)이 한 번에 처리한 결과와 같은지 테스트
+    """
+    graph = ProcessingGraph(self.fs, self.config)
+    self.assertIn("gain+rect", [node.id for node in graph._plan])
+    sink, rect = self.run_graph(graph)
+    expected = apply_fir_lowpass(apply_iir_lowpass(self.data, 500.0, self.fs), 400.0, self.fs, order=201)[:, ::10]
+    plotted = np.concatenate([data for data, _ in sink], axis=1)
+    self.assertTrue(np.allclose(plotted, expected))
+    self.assertTrue(np.allclose(rect, np.abs(expected * 2.0)))
+    self.assertEqual(sink[1][1].start_sample, 780)
+    self.assertEqual(sink[1][1].step, 10)
+    stats = graph.result("stats")
+    self.assertTrue(np.allclose(stats["mean"], (expected[0] - expected[1]).mean()))
+    graph.close()
+    self.assertTrue(np.allclose(load_raw(self.file_path), expected))
+    self.assertAlmostEqual(load_raw_info(self.file_path)["timebase"]["dt"], 10 / self.fs)
+    report = {row["id"]: row for row in graph.timing_report()}
+    self.assertEqual(report["lp"]["calls"], 26)
+    self.assertGreater(report["gain+rect"]["throughput"], 0)
+
+  def test_params_swap_and_config(self):
+    """
+    실행 중 파라미터 변경이 다음 청크부터 반영되고, 설정 저장/잘못된 설정 검증이 동작하는지 테스트
+    """
+    graph = ProcessingGraph(self.fs, self.config)
+    graph.process(self.data[:, :1000])
+    graph.set_params("gain", gain=-1.0)
+    self.assertEqual(graph.stages["gain"].params["gain"], 2.0)
+    outputs = graph.process(self.data[:, 1000:2000])
+    self.assertTrue(np.allclose(outputs["rect"], np.abs(outputs["dec"])))
+    config = graph.to_config()
+    self.assertEqual(config["stages"][3]["params"]["gain"], -1.0)
+    rebuilt = ProcessingGraph(self.fs, config, fuse=False)
+    self.assertFalse(any(isinstance(node, FusedStage) for node in rebuilt._plan))
+    self.assertTrue(rebuilt.has_sink("plot"))
+    invalid = [
+      {"stages": [{"id": "a", "type": "gain", "input": "b"}, {"id": "b", "type": "gain", "input": "a"}]},
+      {"stages": [{"id": "a", "type": "unknown"}]},
+      {"stages": [{"id": "a", "type": "fir", "params": {"cutoff_hz": -1}}]},
+      {"stages": [{"id": "a", "type": "gain", "input": "missing"}]},
+    ]
+    for bad in invalid:
+      with self.assertRaises(ValueError):
+        graph.load_config(bad)
+    self.assertEqual(len(graph), len(self.config["stages"]))
+    graph.close()
+
+  def test_plugin_stage(self):
+    """
+    plugin 단계가 스트리밍 플러그인 상태를 청크 사이에 유지하는지 테스트
+    """
+    plugin_path = "temp_graph_plugin.py"
+    with open(plugin_path, "w", encoding="utf-8") as f:
+      f.write("""
+import numpy as np
+state = {}
+def init(config):
+  state["offset"] = 0.0
+def process(chunk):
+  out = np.cumsum(chunk, axis=-1) + state["offset"]
+  state["offset"] = out[:, -1:]
+  return out
+""")
+    try:
+      graph = ProcessingGraph(self.fs, {"stages": [{"id": "sum", "type": "plugin", "params": {"path": plugin_path}}]})
+      outputs = [graph.process(self.data[:, start:start + 500])["sum"].copy() for start in range(0, 2000, 500)]
+      self.assertTrue(np.allclose(np.concatenate(outputs, axis=1), np.cumsum(self.data[:, :2000], axis=1)))
+      self.assertEqual(graph.timing_report()[0]["calls"], 4)
+      graph.close()
+    finally:
+      os.remove(plugin_path)
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import os
+import json
+import h5py
+import numpy as np
+from PySide6.QtCore import QCoreApplication
+from src.recorder import StreamRecorder
+from src.data_io import load_data, load_timebase, load_hdf5_markers, create_hdf5_stream
+from src.timebase import ChunkTimebase
+
+class TestStreamRecorder(unittest.TestCase):
+  def setUp(self):
+    self.app = QCoreApplication.instance() or QCoreApplication([])
+    self.file_path = "test_recording.h5"
+
+  def tearDown(self):
+    if os.path.exists(self.file_path):
+      os.remove(self.file_path)
+
+  def _record(self, chunks, **kwargs):
+    recorder = StreamRecorder(self.file_path, channel_count=2, sample_rate=1000, channel_names=["ai0", "ai1"],
+                              flush_interval=0.05, chunk_samples=16, **kwargs)
+    stopped = []
+    recorder.recording_stopped.connect(lambda path, n: stopped.append(n))
+    recorder.start()
+    buf = np.empty((2, 10))
+    for start, n in chunks:
+      # 재사용 버퍼를 넘겨도 기록 내용이 보존되는지 확인
+      buf[0, :n] = np.arange(start, start + n)
+      buf[1, :n] = -np.arange(start, start + n)
+      recorder.write(buf[:, :n], ChunkTimebase(start, t0=100.0, dt=0.001, n_samples=n))
+    recorder.add_marker(15, "mark")
+    recorder.stop()
+    self.assertTrue(recorder.wait(5000))
+    self.app.processEvents()
+    return recorder, stopped
+
+  def test_records_chunks_with_attributes(self):
+    """
+    청크가 순서대로 이어 쓰이고 샘플링 속도/채널명/t0/마커가 속성으로 기록되는지 테스트
+    """
+    recorder, stopped = self._record([(0, 10), (10, 10), (20, 5)])
+    data = load_data(self.file_path)
+    self.assertEqual(data.shape, (2, 25))
+    self.assertTrue(np.array_equal(data[0], np.arange(25)))
+    self.assertEqual(stopped, [25])
+    timebase = load_timebase(self.file_path)
+    self.assertAlmostEqual(timebase.t0, 100.0)
+    self.assertAlmostEqual(timebase.dt, 0.001)
+    self.assertEqual(load_hdf5_markers(self.file_path), [{"sample": 15, "label": "mark"}])
+    with h5py.File(self.file_path, "r") as f:
+      attrs = f["data"].attrs
+      self.assertEqual(attrs["sample_rate"], 1000.0)
+      self.assertEqual(json.loads(attrs["channel_names"]), ["ai0", "ai1"])
+      self.assertEqual(f["data"].chunks, (2, 16))
+
+  def test_stop_does_not_block_after_failure(self):
+    """
+    파일 생성에 실패해 쓰기 스레드가 끝난 뒤에도 write()는 청크를 받지 않고 stop()은 대기 없이 반환되는지 테스트
+    """
+    recorder = StreamRecorder(os.path.join("no_such_dir", "rec.h5"), channel_count=1, max_queue_chunks=4)
+    errors = []
+    recorder.error_occurred.connect(errors.append)
+    recorder.start()
+    self.assertTrue(recorder.wait(5000))
+    for start in range(0, 100, 10):
+      recorder.write(np.zeros(10), ChunkTimebase(start, dt=0.001, n_samples=10))
+    self.assertTrue(recorder._queue.empty())
+    recorder.stop()
+    self.app.processEvents()
+    self.assertEqual(len(errors), 1)
+
+  def test_stop_with_full_queue_drains(self):
+    """
+    큐가 가득 차 종료 표시를 넣지 못해도 남은 청크를 기록한 뒤 종료되는지 테스트
+    """
+    recorder = StreamRecorder(self.file_path, channel_count=1, max_queue_chunks=2, flush_interval=0.05)
+    for start in (0, 10):
+      recorder.write(np.zeros(10), ChunkTimebase(start, dt=0.001, n_samples=10))
+    recorder.stop()
+    recorder.start()
+    self.assertTrue(recorder.wait(5000))
+    self.assertEqual(recorder.samples_written, 20)
+
+  def test_records_gaps_and_drops(self):
+    """
+    수집 유실 구간과 큐 초과로 기록하지 못한 샘플 수가 기록되는지 테스트
+    """
+    recorder = StreamRecorder(self.file_path, channel_count=1, max_queue_chunks=2)
+    for start in (0, 10, 20):
+      recorder.write(np.zeros(10), ChunkTimebase(start, dt=0.001, n_samples=10))
+    self.assertEqual(recorder.dropped_samples, 10)
+    recorder, _ = self._record([(0, 10), (30, 10)])
+    self.assertEqual(recorder.gaps, [{"offset": 10, "lost": 20}])
+    with h5py.File(self.file_path, "r") as f:
+      self.assertEqual(json.loads(f["data"].attrs["gaps"]), [{"offset": 10, "lost": 20}])
+      self.assertEqual(f["data"].attrs["dropped_samples"], 0)
+
+  def test_dropped_chunk_counted_once(self):
+    """
+    큐 초과로 버린 청크는 dropped_samples에만 집계되고 수집 유실(lost)로 다시 집계되지 않는지 테스트
+    """
+    recorder = StreamRecorder(self.file_path, channel_count=1, max_queue_chunks=2)
+    for start in (0, 10, 20):
+      recorder.write(np.zeros(10), ChunkTimebase(start, dt=0.001, n_samples=10))
+    # 쓰기 스레드가 큐를 비운 뒤 시작 샘플 40 청크 도착 (20~29는 큐 초과, 30~39는 수집 유실)
+    h5file, dset = create_hdf5_stream(self.file_path, channel_count=1)
+    self.addCleanup(h5file.close)
+    while not recorder._queue.empty():
+      recorder._append(dset, *recorder._queue.get())
+    recorder._append(dset, np.zeros(10), ChunkTimebase(40, dt=0.001, n_samples=10))
+    self.assertEqual(recorder.dropped_samples, 10)
+    self.assertEqual(recorder.gaps, [{"offset": 20, "lost": 10, "dropped": 10}])
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from src.data_io import save_data, open_recording
+from src.recording import RecordingHandle
+from src.scaling import ChannelScaling
+from src.timebase import ChunkTimebase
+from src.signal_pipeline import calc_stats, RunningStats, apply_fft
+from src.plot_widget import RealtimePlotWidget
+from src.offline_player import OfflinePlayer
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestRecordingHandle(unittest.TestCase):
+  def setUp(self):
+    self.h5_file = "test_recording_handle.h5"
+    self.raw = (np.arange(2 * 5000).reshape(2, 5000) % 2000 - 1000).astype(np.int16)
+    self.scaling = ChannelScaling([[0.5, 0.001], [-0.5, 0.002]])
+    save_data(self.h5_file, self.raw, ChunkTimebase(0, 10.0, 0.001), self.scaling)
+
+  def tearDown(self):
+    if os.path.exists(self.h5_file):
+      os.remove(self.h5_file)
+
+  def test_lazy_slices_and_scaling(self):
+    volts = self.scaling.apply(self.raw)
+    with open_recording(self.h5_file) as rec:
+      self.assertEqual(rec.shape, (2, 5000))
+      self.assertEqual(rec.dtype, np.float64)
+      self.assertEqual(rec.metadata["format_version"], 2)
+      self.assertAlmostEqual(rec.timebase.t0, 10.0)
+      self.assertTrue(np.allclose(rec[..., 100:200], volts[:, 100:200]))
+      self.assertTrue(np.allclose(rec[1, 10:20], volts[1, 10:20]))
+      self.assertTrue(np.allclose(rec[..., 42], volts[:, 42]))
+      self.assertTrue(np.allclose(np.asarray(rec), volts))
+      blocks = [block.shape[1] for _, block in rec.iter_blocks(2048)]
+      self.assertEqual(blocks, [2048, 2048, 904])
+    with open_recording(self.h5_file, scaled=False) as rec:
+      self.assertEqual(rec[..., :5].dtype, np.int16)
+
+  def test_consumers_accept_handle(self):
+    volts = self.scaling.apply(self.raw)
+    with open_recording(self.h5_file) as rec:
+      stats = calc_stats(rec)
+      self.assertTrue(np.allclose(stats["mean"], volts.mean(axis=-1)))
+      self.assertTrue(np.allclose(stats["std"], volts.std(axis=-1)))
+      self.assertTrue(np.allclose(RunningStats.from_data(rec).max, volts.max(axis=-1)))
+      self.assertTrue(np.allclose(apply_fft(rec), np.fft.fft(volts, axis=-1)))
+      plot = RealtimePlotWidget(channel_count=2, buffer_size=1000)
+      plot.append_data(rec, rec.timebase)
+      self.assertEqual(plot.total_samples, 5000)
+      self.assertTrue(np.allclose(plot.ordered_data(), volts[:, -1000:]))
+      player = OfflinePlayer()
+      frames = []
+      player.frame_changed.connect(lambda i, frame: frames.append(frame))
+      player.set_data(rec, rec.timebase)
+      player.seek(321)
+      self.assertTrue(np.allclose(frames[-1], volts[:, 321]))
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import time
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from src.render_scheduler import RenderScheduler
+from src.plot_widget import RealtimePlotWidget
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class CountingPlot(RealtimePlotWidget):
+  def __init__(self, *args, delay=0.0, **kwargs):
+    self.renders = 0
+    self.delay = delay
+    super().__init__(*args, **kwargs)
+
+  def update_plot(self):
+    self.renders += 1
+    time.sleep(self.delay)
+    super().update_plot()
+
+class TestRenderScheduler(unittest.TestCase):
+  def setUp(self):
+    self.scheduler = RenderScheduler(max_fps=60, frame_budget=0.01)
+    self.plot = CountingPlot(channel_count=1, buffer_size=1000, scheduler=self.scheduler)
+    self.plot.show()
+    app.processEvents()
+    self._settle()
+
+  def tearDown(self):
+    self.plot.close()
+
+  def _settle(self):
+    # 보류된 프레임을 모두 처리
+    deadline = time.monotonic() + 2
+    while self.scheduler.timer.isActive() and time.monotonic() < deadline:
+      app.processEvents()
+      time.sleep(0.002)
+
+  def test_redraws_only_when_dirty_and_idles(self):
+    """
+    데이터가 추가될 때만 다시 그리고, 변경이 없으면 타이머가 멈추는지 테스트
+    """
+    before = self.plot.renders
+    self.plot.append_data(np.ones((1, 10)))
+    self.plot.append_data(np.ones((1, 10)))
+    self.assertTrue(self.plot.dirty)
+    self.assertTrue(self.scheduler.timer.isActive())
+    self._settle()
+    self.assertFalse(self.plot.dirty)
+    self.assertGreaterEqual(self.plot.renders - before, 1)
+    self.assertFalse(self.scheduler.timer.isActive())
+    idle = self.plot.renders
+    for _ in range(20):
+      app.processEvents()
+      time.sleep(0.005)
+    self.assertEqual(self.plot.renders, idle)
+
+  def test_hidden_widget_is_deferred(self):
+    """
+    숨겨진 위젯은 그리지 않고 dirty로 남았다가 다시 보이면 그려지는지 테스트
+    """
+    self.plot.hide()
+    before = self.plot.renders
+    self.plot.append_data(np.ones((1, 10)))
+    self.scheduler.render_frame()
+    self.assertEqual(self.plot.renders, before)
+    self.assertTrue(self.plot.dirty)
+    self.assertFalse(self.scheduler.timer.isActive())
+    self.plot.show()
+    app.processEvents()
+    self._settle()
+    self.assertGreater(self.plot.renders, before)
+    self.assertFalse(self.plot.dirty)
+
+  def test_frame_budget_lowers_fps(self):
+    """
+    프레임 예산을 넘는 렌더링이 이어지면 프레임 간격이 늘어나고, 가벼워지면 회복되는지 테스트
+    """
+    self.plot.delay = 0.02
+    for _ in range(3):
+      self.plot.append_data(np.ones((1, 10)))
+      self.scheduler.render_frame()
+    self.assertGreater(self.scheduler.interval, self.scheduler.min_interval)
+    self.assertLess(self.scheduler.effective_fps, 60)
+    self.plot.delay = 0.0
+    for _ in range(30):
+      self.plot.append_data(np.ones((1, 10)))
+      self.scheduler.render_frame()
+    self.assertAlmostEqual(self.scheduler.interval, self.scheduler.min_interval)
+
+if __name__ == '__main__':
+  unittest.main()
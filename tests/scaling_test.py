@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+from src.scaling import ChannelScaling, scale_if_raw
+
+class TestChannelScaling(unittest.TestCase):
+  def test_polynomial_per_channel(self):
+    """
+    채널별 다항식 계수가 원시 코드에 벡터화 적용되는지 테스트
+    """
+    scaling = ChannelScaling([[0.0, 0.5, 0.0], [1.0, 0.0, 2.0]])
+    raw = np.array([[0, 2, -4], [1, 2, 3]], dtype=np.int16)
+    volts = scaling.apply(raw)
+    self.assertEqual(volts.dtype, np.float64)
+    self.assertTrue(np.allclose(volts, [[0.0, 1.0, -2.0], [3.0, 9.0, 19.0]]))
+    self.assertTrue(np.allclose(scaling.apply(raw[1:], channels=[1]), [[3.0, 9.0, 19.0]]))
+
+  def test_linear_roundtrip_and_passthrough(self):
+    """
+    선형 계수 직렬화 복원, 전압 데이터는 그대로 통과하는지 테스트
+    """
+    scaling = ChannelScaling.linear(2, 10.0 / 32768)
+    single = ChannelScaling.linear(1, 10.0 / 32768)
+    self.assertAlmostEqual(single.apply(np.array([-32768], dtype=np.int16))[0], -10.0)
+    restored = ChannelScaling.from_dict(scaling.to_dict())
+    self.assertTrue(np.array_equal(restored.coefficients, scaling.coefficients))
+    volts = np.ones((2, 3))
+    self.assertIs(scale_if_raw(volts, scaling), volts)
+    self.assertTrue(np.allclose(scale_if_raw(np.full((2, 3), 16384, dtype=np.int16), scaling), 5.0))
+    with self.assertRaises(ValueError):
+      scaling.apply(np.zeros((3, 4), dtype=np.int16))
+
+if __name__ == '__main__':
+  unittest.main()
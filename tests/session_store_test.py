@@ -0,0 +1,42 @@
+import unittest
+import tempfile
+import os
+import numpy as np
+from src.session_store import SessionStore
+
+class TestSessionStore(unittest.TestCase):
+  def test_append_keeps_channel_shape(self):
+    store = SessionStore(channel_count=2, block_size=8)
+    chunks = [np.arange(2 * n, dtype=np.float64).reshape(2, n) + 100 * i for i, n in enumerate([5, 7, 3, 20])]
+    for chunk in chunks:
+      store.append(chunk)
+    expected = np.concatenate(chunks, axis=1)
+    self.assertEqual(store.shape, (2, 35))
+    np.testing.assert_array_equal(store.view(), expected)
+    np.testing.assert_array_equal(store.slice(6, 30), expected[:, 6:30])
+    np.testing.assert_array_equal(store.slice(-4), expected[:, -4:])
+    self.assertEqual(store.slice(10, 10).shape, (2, 0))
+    with self.assertRaises(ValueError):
+      store.append(np.zeros((3, 4)))
+
+  def test_spill_to_memmap(self):
+    with tempfile.TemporaryDirectory() as spill_dir:
+      block_bytes = 16 * 8
+      store = SessionStore(channel_count=1, block_size=16, ram_budget=2 * block_bytes, spill_dir=spill_dir)
+      data = np.random.randn(100)
+      for i in range(0, 100, 10):
+        store.append(data[i:i + 10])
+      self.assertGreater(store.spilled, 0)
+      self.assertLessEqual(store.ram_bytes, 2 * block_bytes)
+      self.assertIsInstance(store.blocks[0], np.memmap)
+      np.testing.assert_array_equal(store.view()[0], data)
+      # spill된 세션은 이어붙인 결과를 캐시하지 않고, 블록 순회로 전체를 읽을 수 있음
+      self.assertIsNone(store._view)
+      np.testing.assert_array_equal(np.concatenate(list(store.iter_blocks()), axis=1)[0], data)
+      np.testing.assert_array_equal(store.slice(5, 40)[0], data[5:40])
+      store.close()
+      self.assertEqual(len(store), 0)
+      self.assertEqual(os.listdir(spill_dir), [])
+
+if __name__ == "__main__":
+  unittest.main()
@@ -1,7 +1,10 @@
 import unittest
 import numpy as np
 import os
-from src.signal_pipeline import apply_fft, apply_fir_lowpass, apply_iir_lowpass, calc_stats, run_plugin
+from scipy import signal
+from src.signal_pipeline import apply_fft, apply_fir_lowpass, apply_iir_lowpass, calc_stats, run_plugin, RunningStats, WindowedStats
+from src.signal_pipeline import StreamingFIRFilter, StreamingIIRFilter, design_iir_sos, fir_use_fft, benchmark_fir
+from src.signal_pipeline import apply_rfft, SpectrumAnalyzer, PluginRegistry
 
 class TestSignalPipeline(unittest.TestCase):
   def setUp(self):
@@ -110,5 +113,227 @@ def dummy():
     finally:
       os.remove(plugin_path)
 
+class TestPluginRegistry(unittest.TestCase):
+  def setUp(self):
+    self.plugin_path = "temp_stream_plugin.py"
+    self.write_plugin("1.0")
+
+  def tearDown(self):
+    if os.path.exists(self.plugin_path):
+      os.remove(self.plugin_path)
+
+  def write_plugin(self, factor):
+    with open(self.plugin_path, "w", encoding="utf-8") as f:
+      f.write(f"""
+import numpy as np
+state = {{"loaded": 0}}
+state["loaded"] += 1
+def init(config):
+  state["total"] = 0.0
+  state["gain"] = config.get("gain", 1.0) * {factor}
+def process(chunk):
+  state["total"] += chunk.sum()
+  return chunk[:, ::2] * state["gain"]
+def flush():
+  return state["total"]
+""")
+
+  def test_cache_and_reload(self):
+    """
+    플러그인을 한 번만 로딩하고, 파일이 바뀐 경우에만 다시 로딩하는지 테스트
+    """
+    registry = PluginRegistry()
+    module = registry.load(self.plugin_path)
+    self.assertIs(registry.load(self.plugin_path), module)
+    self.assertEqual(module.state["loaded"], 1)
+    stream = registry.open_stream(self.plugin_path, {"gain": 2.0})
+    self.assertTrue(np.allclose(stream.process(np.ones((2, 10))), 2.0))
+    self.write_plugin("10.0")
+    mtime = os.stat(self.plugin_path).st_mtime_ns + 1_000_000_000
+    os.utime(self.plugin_path, ns=(mtime, mtime))
+    self.assertTrue(np.allclose(stream.process(np.ones((2, 10))), 20.0))
+    self.assertEqual(stream.flush(), 20.0)
+    stats = registry.stats(self.plugin_path)
+    self.assertEqual((stats.loads, stats.calls), (2, 2))
+    self.assertEqual(registry.latency_report()[0]["calls"], 2)
+
+  def test_streaming_contract_and_validation(self):
+    """
+    스트리밍 계약(init/process/flush) 상태 유지, 일괄 계약 출력 shape 검사 테스트
+    """
+    registry = PluginRegistry()
+    stream = registry.open_stream(self.plugin_path)
+    self.assertTrue(stream.streaming)
+    for _ in range(3):
+      self.assertEqual(stream.process(np.ones((2, 10))).shape, (2, 5))
+    self.assertEqual(stream.flush(), 60.0)
+    stream.reset()
+    self.assertEqual(stream.flush(), 0.0)
+    # 일괄 계약(run)은 입력과 같은 shape를 요구
+    with self.assertRaises(RuntimeError):
+      registry.run(self.plugin_path, np.ones((2, 10)))
+    with self.assertRaises(FileNotFoundError):
+      registry.load("not_exist_plugin.py")
+
+class TestStreamingFilter(unittest.TestCase):
+  def setUp(self):
+    self.data = np.random.default_rng(2).standard_normal((3, 5000))
+
+  def test_chunked_matches_one_shot(self):
+    """
+    청크 단위 필터 출력이 전체 배열을 한 번에 필터링한 결과와 같은지 테스트
+    """
+    for streaming, one_shot in ((StreamingFIRFilter(50, 1000, order=65), apply_fir_lowpass(self.data, 50, 1000, order=65)),
+                                (StreamingIIRFilter(50, 1000, order=6), apply_iir_lowpass(self.data, 50, 1000, order=6))):
+      chunks = [streaming.process(self.data[:, start:start + 333]) for start in range(0, 5000, 333)]
+      self.assertTrue(np.allclose(np.concatenate(chunks, axis=1), one_shot))
+
+  def test_fft_fir_matches_direct(self):
+    """
+    긴 FIR의 FFT 컨볼루션(일괄 overlap-add, 청크 overlap-save)이 직접형 결과와 같은지 테스트
+    """
+    direct = apply_fir_lowpass(self.data, 20, 1000, order=1001, method="direct")
+    self.assertTrue(np.allclose(apply_fir_lowpass(self.data, 20, 1000, order=1001, method="fft"), direct))
+    for chunk in (7, 333, 5000):
+      filt = StreamingFIRFilter(20, 1000, order=1001, method="fft")
+      chunks = [filt.process(self.data[:, start:start + chunk]) for start in range(0, 5000, chunk)]
+      self.assertTrue(np.allclose(np.concatenate(chunks, axis=1), direct))
+    self.assertTrue(fir_use_fft(2048, 1024))
+    self.assertFalse(fir_use_fft(16, 65536))
+    auto = StreamingFIRFilter(20, 1000, order=1001)
+    auto.process(self.data[:, :1000])
+    self.assertTrue(auto.use_fft)
+    with self.assertRaises(ValueError):
+      fir_use_fft(64, 64, method="fast")
+    rows = benchmark_fir(tap_counts=(16,), block_sizes=(64,), n_samples=256, repeat=1)
+    self.assertEqual(set(rows[0]), {"taps", "block", "direct", "fft", "faster"})
+
+  def test_steady_state_before_method_choice(self):
+    """
+    auto 방식이 첫 청크에서 정해지는 경우에도 reset(initial)의 정상 상태가 선택된 방식에 맞는지 테스트
+    """
+    for order in (33, 1001):
+      filt = StreamingFIRFilter(20, 1000, order=order)
+      self.assertIsNone(filt.use_fft)
+      filt.reset(initial=[3.0])
+      self.assertTrue(np.allclose(filt.process(np.full(4096, 3.0)), 3.0))
+      filt.reset(initial=[-1.0])
+      self.assertTrue(np.allclose(filt.process(np.full(4096, -1.0)), -1.0))
+    self.assertTrue(filt.use_fft)
+
+  def test_reset_and_configure(self):
+    """
+    reset/configure가 상태 배열을 재사용하고, 설계 계수는 캐시에서 가져오는지 테스트
+    """
+    design_iir_sos.cache_clear()
+    filt = StreamingIIRFilter(50, 1000, order=4)
+    filt.process(self.data[:, :100])
+    state = filt.zi
+    filt.reset()
+    self.assertIs(filt.zi, state)
+    self.assertFalse(filt.zi.any())
+    filt.configure(cutoff_hz=80)
+    self.assertIs(filt.zi, state)
+    StreamingIIRFilter(80, 1000, order=4)
+    self.assertEqual(design_iir_sos.cache_info().hits, 1)
+    filt.reset(initial=[1.0, 2.0, 3.0])
+    self.assertTrue(np.allclose(filt.process(np.ones((3, 50)) * [[1.0], [2.0], [3.0]]), [[1.0], [2.0], [3.0]]))
+    with self.assertRaises(ValueError):
+      filt.process(self.data[:2])
+    with self.assertRaises(RuntimeError):
+      StreamingFIRFilter(-1, 1000)
+
+class TestSpectrum(unittest.TestCase):
+  def setUp(self):
+    self.fs = 1000.0
+    t = np.arange(20000) / self.fs
+    self.data = np.vstack([3 * np.sin(2 * np.pi * 125 * t), np.random.default_rng(3).standard_normal(20000)])
+
+  def test_rfft_amplitude(self):
+    """
+    단측 진폭 스펙트럼에서 사인파 주파수/피크 진폭이 맞는지 테스트
+    """
+    freqs, amplitude = apply_rfft(self.data[:, :1024], self.fs)
+    self.assertEqual(amplitude.shape, (2, 513))
+    self.assertEqual(freqs[np.argmax(amplitude[0])], 125.0)
+    self.assertAlmostEqual(amplitude[0].max(), 3.0)
+    with self.assertRaises(RuntimeError):
+      apply_rfft(self.data, self.fs, scaling="db")
+
+  def test_streaming_welch(self):
+    """
+    청크 단위 Welch 평균이 scipy welch와 같고, 갱신 주기가 청크 크기와 무관한지 테스트
+    """
+    _, expected = signal.welch(self.data, self.fs, nperseg=1024, noverlap=512, detrend=False)
+    analyzer = SpectrumAnalyzer(self.fs, nfft=1024, overlap=0.5, n_averages=100, update_rate=2.0)
+    results = [analyzer.push(self.data[:, start:start + 77]) for start in range(0, 20000, 77)]
+    self.assertEqual(analyzer.segments, 38)
+    self.assertEqual(sum(r is not None for r in results), 39)
+    self.assertTrue(np.allclose(analyzer.spectrum()[1], expected))
+    for averaging in ("exponential", "peak", "none"):
+      whole = SpectrumAnalyzer(self.fs, averaging=averaging, scaling="amplitude")
+      chunked = SpectrumAnalyzer(self.fs, averaging=averaging, scaling="amplitude")
+      whole.push(self.data)
+      for start in range(0, 20000, 333):
+        chunked.push(self.data[:, start:start + 333])
+      self.assertTrue(np.allclose(whole.spectrum()[1], chunked.spectrum()[1]))
+    with self.assertRaises(ValueError):
+      analyzer.configure(averaging="median")
+
+class TestStreamingStats(unittest.TestCase):
+  def setUp(self):
+    self.data = np.random.default_rng(1).standard_normal((3, 5000)) * [[1.0], [2.0], [0.5]] + [[0.0], [5.0], [-1.0]]
+
+  def test_running_stats_matches_numpy(self):
+    """
+    청크 단위로 누적한 통계가 전체 배열 통계와 같은지 테스트
+    """
+    stats = RunningStats(3)
+    for start in range(0, 5000, 333):
+      stats.update(self.data[:, start:start + 333])
+    self.assertEqual(stats.count, 5000)
+    self.assertTrue(np.allclose(stats.mean, self.data.mean(axis=1)))
+    self.assertTrue(np.allclose(stats.std, self.data.std(axis=1)))
+    self.assertTrue(np.allclose(stats.rms, np.sqrt(np.mean(self.data ** 2, axis=1))))
+    self.assertTrue(np.array_equal(stats.min, self.data.min(axis=1)))
+    self.assertTrue(np.array_equal(stats.max, self.data.max(axis=1)))
+    snapshot = stats.snapshot()
+    expected = calc_stats(self.data)
+    for key in ("mean", "std", "min", "max"):
+      self.assertTrue(np.allclose(snapshot[key], expected[key]))
+
+  def test_merge_and_channels(self):
+    """
+    구간별 누적기 병합, 채널 병합 결과가 전체 데이터 통계와 같은지 테스트
+    """
+    a = RunningStats.from_data(self.data[:, :1200])
+    b = RunningStats.from_data(self.data[:, 1200:])
+    merged = a.copy().merge(b)
+    self.assertTrue(np.allclose(merged.variance, self.data.var(axis=1)))
+    self.assertEqual(a.count, 1200)
+    total = merged.merged_channels()
+    self.assertEqual(total.count, 15000)
+    self.assertAlmostEqual(total.mean[0], self.data.mean())
+    self.assertAlmostEqual(total.std[0], self.data.std())
+    self.assertTrue(np.isnan(RunningStats(2).mean).all())
+    with self.assertRaises(ValueError):
+      RunningStats(2).update(self.data)
+
+  def test_windowed_stats(self):
+    """
+    슬라이딩 구간 통계가 최근 window(블록 단위) 샘플만 반영하는지 테스트
+    """
+    window = WindowedStats(3, window=1000, block_size=100)
+    for start in range(0, 5000, 50):
+      window.update(self.data[:, start:start + 50])
+    stats = window.stats()
+    self.assertGreaterEqual(stats.count, 1000)
+    self.assertLess(stats.count, 1100)
+    recent = self.data[:, -stats.count:]
+    self.assertTrue(np.allclose(stats.mean, recent.mean(axis=1)))
+    self.assertTrue(np.array_equal(stats.max, recent.max(axis=1)))
+    window.clear()
+    self.assertEqual(window.stats().count, 0)
+
 if __name__ == "__main__":
   unittest.main() 
\ No newline at end of file
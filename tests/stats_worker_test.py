@@ -0,0 +1,51 @@
+import unittest
+import os
+import numpy as np
+from PySide6.QtCore import QCoreApplication
+from src.data_io import save_data, open_recording
+from src.stats_worker import RecordingStatsWorker
+
+class TestRecordingStatsWorker(unittest.TestCase):
+  def setUp(self):
+    self.app = QCoreApplication.instance() or QCoreApplication([])
+    self.h5_file = "test_stats_worker.h5"
+    self.data = np.random.randn(2, 5000)
+    save_data(self.h5_file, self.data)
+
+  def tearDown(self):
+    if os.path.exists(self.h5_file):
+      os.remove(self.h5_file)
+
+  def test_stats_computed_in_background(self):
+    """
+    블록 단위로 계산한 기록 전체 통계가 stats_ready로 전달되는지 테스트
+    """
+    with open_recording(self.h5_file) as rec:
+      worker = RecordingStatsWorker(rec, block_samples=1024)
+      results = []
+      worker.stats_ready.connect(results.append)
+      worker.start()
+      self.assertTrue(worker.wait(5000))
+      self.app.processEvents()
+    self.assertEqual(len(results), 1)
+    stats = results[0]
+    self.assertEqual(stats.count, 5000)
+    self.assertTrue(np.allclose(stats.mean, self.data.mean(axis=1)))
+    self.assertTrue(np.allclose(stats.max, self.data.max(axis=1)))
+
+  def test_cancel_emits_nothing(self):
+    """
+    시작 전에 취소하면 통계를 전달하지 않는지 테스트
+    """
+    with open_recording(self.h5_file) as rec:
+      worker = RecordingStatsWorker(rec, block_samples=1024)
+      results = []
+      worker.stats_ready.connect(results.append)
+      worker.cancel()
+      worker.start()
+      self.assertTrue(worker.wait(5000))
+      self.app.processEvents()
+    self.assertEqual(results, [])
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+from PySide6.QtCore import QCoreApplication
+from src.stream_hub import StreamHub
+from src.timebase import ChunkTimebase
+
+class TestStreamHub(unittest.TestCase):
+  def setUp(self):
+    self.app = QCoreApplication.instance() or QCoreApplication([])
+    self.hub = StreamHub(channel_count=2, capacity=100)
+    self.behind = []
+    self.hub.fell_behind.connect(lambda name, n: self.behind.append((name, n)))
+
+  def _write(self, start, n):
+    # 채널 0은 절대 샘플 인덱스, 채널 1은 음수
+    data = np.vstack([np.arange(start, start + n), -np.arange(start, start + n)]).astype(float)
+    self.hub.write(data, ChunkTimebase(start, t0=10.0, dt=0.01, n_samples=n))
+
+  def test_consumers_read_independently(self):
+    """
+    소비자마다 커서가 독립적이고 밀린 구간을 한 번에 읽는지 테스트
+    """
+    fast = self.hub.subscribe("fast")
+    slow = self.hub.subscribe("slow")
+    self._write(0, 30)
+    data, tb = fast.read()
+    self.assertTrue(np.array_equal(data[0], np.arange(30)))
+    self.assertEqual(tb.start_sample, 0)
+    self._write(30, 30)
+    data, tb = fast.read()
+    self.assertTrue(np.array_equal(data[0], np.arange(30, 60)))
+    data, tb = slow.read()
+    self.assertTrue(np.array_equal(data[1], -np.arange(60)))
+    self.assertEqual((tb.start_sample, tb.n_samples), (0, 60))
+    self.assertEqual(fast.read()[0].shape, (2, 0))
+    self.assertEqual(self.behind, [])
+
+  def test_wraparound_and_fell_behind(self):
+    """
+    링 버퍼를 넘게 밀린 소비자는 최신 용량만큼만 읽고 건너뛴 샘플 수를 신호로 받는지 테스트
+    """
+    cursor = self.hub.subscribe("plot")
+    for start in range(0, 250, 50):
+      self._write(start, 50)
+    data, tb = cursor.read()
+    self.assertTrue(np.array_equal(data[0], np.arange(150, 250)))
+    self.assertEqual(tb.start_sample, 150)
+    self.assertEqual(self.behind, [("plot", 150)])
+    self.assertEqual(cursor.behind, 150)
+    self.assertEqual(cursor.lag, 0)
+
+  def test_decimation_is_aligned(self):
+    """
+    솎아내기가 읽기 단위와 무관하게 절대 인덱스 기준으로 일정한지 테스트
+    """
+    cursor = self.hub.subscribe("stats", decimation=4)
+    self._write(0, 10)
+    first, tb1 = cursor.read()
+    self._write(10, 10)
+    second, tb2 = cursor.read()
+    self.assertTrue(np.array_equal(np.hstack([first, second])[0], np.arange(0, 20, 4)))
+    self.assertEqual((tb2.start_sample, tb2.step), (12, 4))
+    self.assertEqual(tb2.end_sample, 20)
+
+  def test_gap_in_timebase_and_read_range(self):
+    """
+    수집 유실(gap) 이후 구간의 타임베이스 오프셋과 구간 읽기 테스트
+    """
+    cursor = self.hub.subscribe("rec")
+    self._write(0, 20)
+    self._write(50, 20)  # 30 샘플 유실
+    data, tb = cursor.read(max_samples=20)
+    self.assertEqual(tb.start_sample, 0)
+    data, tb = cursor.read()
+    self.assertEqual(tb.start_sample, 50)
+    self.assertAlmostEqual(tb.start_time, 10.5)
+    self.assertTrue(np.array_equal(self.hub.read_range(10, 30)[0], np.r_[10:20, 50:60]))
+    for start in range(70, 200, 10):
+      self._write(start, 10)
+    with self.assertRaises(ValueError):
+      self.hub.read_range(0, 10)
+
+  def test_single_channel_and_shape_error(self):
+    hub = StreamHub(channel_count=1, capacity=10)
+    cursor = hub.subscribe("plot")
+    hub.write(np.arange(5.0))
+    self.assertEqual(cursor.read()[0].shape, (1, 5))
+    with self.assertRaises(ValueError):
+      hub.write(np.zeros((2, 5)))
+
+if __name__ == '__main__':
+  unittest.main()
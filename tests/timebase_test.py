@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch
+from src.timebase import ChunkTimebase, SampleClock
+
+class TestChunkTimebase(unittest.TestCase):
+  def test_sample_times(self):
+    """
+    샘플 인덱스로 시각을 계산하고 역변환하는지 테스트
+    """
+    tb = ChunkTimebase(start_sample=1000, t0=100.0, dt=0.001, n_samples=500)
+    self.assertAlmostEqual(tb.start_time, 101.0)
+    self.assertEqual(tb.end_sample, 1500)
+    self.assertAlmostEqual(tb.time_of(1499), 101.499)
+    self.assertEqual(tb.sample_at(101.25), 1250)
+    self.assertAlmostEqual(tb.sample_rate, 1000.0)
+
+  def test_dict_round_trip(self):
+    """
+    to_dict/from_dict 변환 후 값이 보존되는지 테스트
+    """
+    tb = ChunkTimebase(5, 1.5, 0.01, drift=0.002, n_samples=10)
+    restored = ChunkTimebase.from_dict(tb.to_dict())
+    self.assertEqual(restored.to_dict(), tb.to_dict())
+
+class TestSampleClock(unittest.TestCase):
+  def test_anchor_once_and_advance(self):
+    """
+    기준 시각은 시작 시 한 번만 고정되고, 청크마다 샘플 카운터가 누적되는지 테스트
+    """
+    clock = SampleClock(sample_rate=100)
+    with patch("time.time", return_value=50.0):
+      clock.start()
+    with patch("time.time", side_effect=AssertionError("청크마다 time.time() 호출 금지")):
+      a = clock.advance(10)
+      b = clock.advance(20)
+    self.assertEqual((a.start_sample, b.start_sample), (0, 10))
+    self.assertEqual(b.t0, 50.0)
+    self.assertAlmostEqual(b.start_time, 50.1)
+    self.assertEqual(clock.sample_count, 30)
+
+  def test_drift_estimate(self):
+    """
+    모노토닉 시계가 샘플 클럭보다 앞서면 양의 드리프트가 추정되는지 테스트
+    """
+    clock = SampleClock(sample_rate=1000, smoothing=1.0)
+    with patch("time.monotonic", return_value=10.0):
+      clock.start()
+    with patch("time.monotonic", return_value=11.01):
+      tb = clock.advance(1000)
+    self.assertAlmostEqual(tb.drift, 0.01)
+    self.assertAlmostEqual(tb.drift_ppm, 10000.0)
+
+if __name__ == "__main__":
+  unittest.main()
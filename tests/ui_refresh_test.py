@@ -0,0 +1,49 @@
+import unittest
+import sys
+from PySide6.QtWidgets import QApplication, QLabel, QListWidget
+from src.ui_refresh import UiRefreshCoalescer
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class CountingList(QListWidget):
+  def __init__(self):
+    super().__init__()
+    self.fills = 0
+
+  def addItems(self, items):
+    self.fills += 1
+    super().addItems(items)
+
+class TestUiRefreshCoalescer(unittest.TestCase):
+  def setUp(self):
+    self.refresh = UiRefreshCoalescer(interval_ms=1000)
+    self.label = QLabel()
+    self.signals = CountingList()
+
+  def test_coalesces_until_flush(self):
+    formatted = []
+    for i in range(100):
+      self.refresh.set_text(self.label, lambda i=i: formatted.append(i) or f"chunk {i}")
+    self.assertEqual(self.label.text(), "")
+    self.assertTrue(self.refresh.timer.isActive())
+    self.refresh.flush()
+    self.assertEqual(self.label.text(), "chunk 99")
+    self.assertEqual(formatted, [99])
+    self.assertFalse(self.refresh.timer.isActive())
+
+  def test_items_only_on_change(self):
+    for _ in range(3):
+      self.refresh.set_items(self.signals, ["채널 1 (활성)"])
+      self.refresh.flush()
+    self.assertEqual(self.signals.fills, 1)
+    self.refresh.set_items(self.signals, ["채널 1 (활성)", "채널 2 (활성)"])
+    self.refresh.flush()
+    self.assertEqual(self.signals.fills, 2)
+    self.assertEqual(self.signals.count(), 2)
+    self.refresh.invalidate(self.signals)
+    self.refresh.set_items(self.signals, ["채널 1 (활성)", "채널 2 (활성)"])
+    self.refresh.flush()
+    self.assertEqual(self.signals.fills, 3)
+
+if __name__ == "__main__":
+  unittest.main()